@@ -171,7 +171,7 @@ class TradingActionEnhanced:
                                 pairAddress=candle.pairAddress,
                                 timeframe=candle.timeframe,
                                 unixTime=candle.unixTime,
-                                timeBucket=CommonUtil.calculateInitialStartTime(candle.unixTime, candle.timeframe),
+                                timeBucket=0,  # Not persisted (generated by ohlcvdetails)
                                 openPrice=candle.openPrice,
                                 highPrice=candle.highPrice,
                                 lowPrice=candle.lowPrice,
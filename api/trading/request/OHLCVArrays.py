@@ -0,0 +1,36 @@
+"""
+OHLCV Arrays POJO - Column-oriented candle data for batch indicator calculation
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass
+class OHLCVArrays:
+    """POJO holding one (token, timeframe) candle series as parallel numpy arrays"""
+
+    unixTimes: np.ndarray
+    highPrices: np.ndarray
+    lowPrices: np.ndarray
+    closePrices: np.ndarray
+    volumes: np.ndarray
+
+    # Indicator values (calculated in memory, aligned with unixTimes)
+    vwapValues: Optional[np.ndarray] = None
+
+    @classmethod
+    def fromColumns(cls, unixTimes, highPrices, lowPrices, closePrices, volumes) -> 'OHLCVArrays':
+        """Build from parallel column lists ordered by unixTime (e.g. Postgres array_agg output)"""
+        return cls(
+            unixTimes=np.asarray(unixTimes, dtype=np.int64),
+            highPrices=np.asarray(highPrices, dtype=np.float64),
+            lowPrices=np.asarray(lowPrices, dtype=np.float64),
+            closePrices=np.asarray(closePrices, dtype=np.float64),
+            volumes=np.asarray(volumes, dtype=np.float64)
+        )
+
+    def __len__(self) -> int:
+        return len(self.unixTimes)
@@ -14,7 +14,8 @@ Stores all necessary state for incremental calculations:
 - Recent %K values for %D calculation
 """
 
-from typing import Optional, List
+from collections import deque
+from typing import Optional, Deque
 from dataclasses import dataclass, field
 
 
@@ -42,17 +43,17 @@ class RSIState:
     
     # Stochastic RSI State
     stochRSIValue: Optional[float] = None  # Current Stochastic RSI value
-    rsiValues: List[float] = field(default_factory=list)  # Recent RSI values (max 14)
+    rsiValues: Deque[float] = field(default_factory=deque)  # Recent RSI values (ring buffer, max 14)
     
     # %K Configuration and State
     kInterval: int = 3  # Number of periods for %K smoothing
     kValue: Optional[float] = None  # Current %K value
-    stochRSIValues: List[float] = field(default_factory=list)  # Recent Stochastic RSI values (max 3)
+    stochRSIValues: Deque[float] = field(default_factory=deque)  # Recent Stochastic RSI values (ring buffer, max 3)
     
     # %D Configuration and State
     dInterval: int = 3  # Number of periods for %D smoothing
     dValue: Optional[float] = None  # Current %D value
-    kValues: List[float] = field(default_factory=list)  # Recent %K values (max 3)
+    kValues: Deque[float] = field(default_factory=deque)  # Recent %K values (ring buffer, max 3)
     
     # Timestamps
     lastUpdatedUnix: Optional[int] = None  # Last candle processed
@@ -63,13 +64,10 @@ class RSIState:
     status: int = 1  # 1 = NOT_AVAILABLE, 2 = AVAILABLE
     
     def __post_init__(self):
-        """Ensure lists are properly initialized"""
-        if self.rsiValues is None:
-            self.rsiValues = []
-        if self.stochRSIValues is None:
-            self.stochRSIValues = []
-        if self.kValues is None:
-            self.kValues = []
+        """Hold recent values in fixed-size ring buffers so the oldest value is evicted in O(1)"""
+        self.rsiValues = deque(self.rsiValues or [], maxlen=self.stochRSIInterval)
+        self.stochRSIValues = deque(self.stochRSIValues or [], maxlen=self.kInterval)
+        self.kValues = deque(self.kValues or [], maxlen=self.dInterval)
     
     def hasEnoughDataForRSI(self) -> bool:
         """Check if we have enough data to calculate RSI"""
@@ -88,22 +86,16 @@ class RSIState:
         return len(self.kValues) >= self.dInterval
     
     def addRSIValue(self, rsiValue: float) -> None:
-        """Add RSI value and maintain max size"""
+        """Add RSI value - the ring buffer drops the oldest once full"""
         self.rsiValues.append(rsiValue)
-        if len(self.rsiValues) > self.stochRSIInterval:
-            self.rsiValues.pop(0)
     
     def addStochRSIValue(self, stochRSIValue: float) -> None:
-        """Add Stochastic RSI value and maintain max size"""
+        """Add Stochastic RSI value - the ring buffer drops the oldest once full"""
         self.stochRSIValues.append(stochRSIValue)
-        if len(self.stochRSIValues) > self.kInterval:
-            self.stochRSIValues.pop(0)
     
     def addKValue(self, kValue: float) -> None:
-        """Add %K value and maintain max size"""
+        """Add %K value - the ring buffer drops the oldest once full"""
         self.kValues.append(kValue)
-        if len(self.kValues) > self.dInterval:
-            self.kValues.pop(0)
     
     @classmethod
     def createEmpty(cls, tokenAddress: str, pairAddress: str, timeframe: str, 
@@ -147,13 +139,13 @@ class RSIState:
             'lastClosePrice': self.lastClosePrice,
             'stochRSIInterval': self.stochRSIInterval,
             'stochRSIValue': self.stochRSIValue,
-            'rsiValues': self.rsiValues,
+            'rsiValues': list(self.rsiValues),
             'kInterval': self.kInterval,
             'kValue': self.kValue,
-            'stochRSIValues': self.stochRSIValues,
+            'stochRSIValues': list(self.stochRSIValues),
             'dInterval': self.dInterval,
             'dValue': self.dValue,
-            'kValues': self.kValues,
+            'kValues': list(self.kValues),
             'lastUpdatedUnix': self.lastUpdatedUnix,
             'nextFetchTime': self.nextFetchTime,
             'pairCreatedTime': self.pairCreatedTime,
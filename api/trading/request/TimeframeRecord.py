@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 # Use TYPE_CHECKING to avoid circular imports
 if TYPE_CHECKING:
     from .OHLCVDetails import OHLCVDetails
+    from .OHLCVArrays import OHLCVArrays
     from .VWAPSession import VWAPSession
     from .EMAState import EMAState
     from .AVWAPState import AVWAPState
@@ -29,6 +30,7 @@ class TimeframeRecord:
     
     # Integrated data with proper typing
     ohlcvDetails: List['OHLCVDetails'] = field(default_factory=list)
+    ohlcvArrays: Optional['OHLCVArrays'] = None  # column form used by the VWAP scheduler
     vwapSession: Optional['VWAPSession'] = None
     ema12State: Optional['EMAState'] = None
     ema21State: Optional['EMAState'] = None
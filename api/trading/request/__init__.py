@@ -7,6 +7,7 @@ from .TokenInfo import TokenInfo
 from .CandleData import TimeframeCandleData, AllTimeframesCandleData
 from .TimeframeRecord import TimeframeRecord
 from .OHLCVDetails import OHLCVDetails
+from .OHLCVArrays import OHLCVArrays
 from .VWAPSession import VWAPSession
 from .EMAState import EMAState
 from .AVWAPState import AVWAPState
@@ -21,6 +22,7 @@ __all__ = [
     'AllTimeframesCandleData',
     'TimeframeRecord',
     'OHLCVDetails',
+    'OHLCVArrays',
     'VWAPSession',
     'EMAState',
     'AVWAPState',
@@ -93,6 +93,17 @@ class Config:
     except ValueError:
         DB_CONNECT_TIMEOUT = 10
 
+    # Trading scheduler settings
+    # When enabled, VWAP is advanced with a single SQL statement instead of the Python processor
+    TRADING_VWAP_IN_DATABASE = (
+        os.getenv("TRADING_VWAP_IN_DATABASE", "false").strip().lower() == "true"
+    )
+    # When enabled, EMA/AVWAP persists commit without waiting for the WAL flush; a crash can
+    # drop the last batches, which the scheduler recomputes from ohlcvdetails on the next run
+    TRADING_RELAXED_DURABILITY = (
+        os.getenv("TRADING_RELAXED_DURABILITY", "false").strip().lower() == "true"
+    )
+
     # API settings
     API_HOST = os.getenv("API_HOST", "0.0.0.0")
     _API_PORT = os.getenv("API_PORT", "8080")
@@ -165,6 +176,8 @@ class Config:
             "LOG_LEVEL": self.LOG_LEVEL,
             "LOG_FILE": self.LOG_FILE,
             "JOBS_DB_PATH": self.JOBS_DB_PATH,
+            "TRADING_VWAP_IN_DATABASE": self.TRADING_VWAP_IN_DATABASE,
+            "TRADING_RELAXED_DURABILITY": self.TRADING_RELAXED_DURABILITY,
         }
 
 
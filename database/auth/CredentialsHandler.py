@@ -256,27 +256,26 @@ class CredentialsHandler(BaseDBHandler):
             logger.info(f"Failed to reset credentials: {str(e)}")
 
     def buildResetQuery(self, currentTime: datetime) -> tuple[str, list]:
-        creditCases = []
-        intervalCases = []
-        parameters = [currentTime]  # for lastResetAt
+        serviceNames = []
+        defaultCredits = []
+        resetDurationDays = []
         
-        # Build CASE statements for each service that needs reset
+        # Services that need reset are bound as parallel arrays, so the SQL text is the same
+        # whichever services are configured; array_position yields NULL for any other service
         for service in ServiceCredentials:
             if self.shouldResetCredit(service):
-                defaultCredits = service.metadata.get("default_credits", 1000)
-                creditCases.append(f"WHEN servicename = '{service.service_name}' THEN {defaultCredits}")
-                intervalCases.append(f"WHEN servicename = '{service.service_name}' THEN %s + INTERVAL '{service.reset_duration_days} days'")
-                parameters.append(currentTime)  # for nextResetAt calculation
+                serviceNames.append(service.service_name)
+                defaultCredits.append(service.metadata.get("default_credits", 1000))
+                resetDurationDays.append(int(service.reset_duration_days))
         
-        # Build the complete SQL query
-        creditCaseSql = "CASE " + " ".join(creditCases) + " ELSE availablecredits END"
-        intervalCaseSql = "CASE " + " ".join(intervalCases) + " ELSE nextresetat END"
-        
-        query = f"""
+        query = """
             UPDATE servicecredentials 
-            SET availablecredits = {creditCaseSql},
+            SET availablecredits = COALESCE(
+                    (%s::integer[])[array_position(%s::text[], servicename::text)], availablecredits),
                 lastresetat = %s,
-                nextresetat = {intervalCaseSql},
+                nextresetat = COALESCE(
+                    %s + make_interval(days => (%s::integer[])[array_position(%s::text[], servicename::text)]),
+                    nextresetat),
                 updatedat = %s
             WHERE isactive = 1 
             AND isresetavailable = TRUE 
@@ -284,8 +283,10 @@ class CredentialsHandler(BaseDBHandler):
             AND nextresetat <= %s
         """
         
-        # Add remaining parameters
-        parameters.extend([currentTime, currentTime])  # for updatedAt and WHERE clause
+        # Parameters in placeholder order: credits, lastResetAt, next reset, updatedAt, WHERE clause
+        parameters = [defaultCredits, serviceNames, currentTime,
+                      currentTime, resetDurationDays, serviceNames,
+                      currentTime, currentTime]
         
         return query, parameters
 
@@ -1,6 +1,7 @@
 from config.Config import get_config
 from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
 from typing import Optional
+from contextlib import contextmanager
 from datetime import datetime
 import pytz
 
@@ -52,6 +53,37 @@ class BaseDBHandler:
         """
         return self.conn_manager.table_lock
 
+    @contextmanager
+    def bulk_session(self, sync_commit: bool = False):
+        """
+        Hold one connection and transaction across several batch writes.
+
+        Unless sync_commit is set, the transaction commits without waiting for
+        the WAL flush (SET LOCAL synchronous_commit TO OFF). A crash can lose the
+        last moments of commits but never corrupts data, which suits candle
+        streams that are re-fetched from lastfetchedat anyway.
+
+        Usage:
+            with handler.bulk_session() as cursor:
+                handler.batchPersistNewlyFetchedCandlesData(..., cursor=cursor)
+
+        Returns:
+            Cursor shared by every write in the block
+        """
+        with self.conn_manager.transaction() as cursor:
+            if not sync_commit:
+                cursor.execute("SET LOCAL synchronous_commit TO OFF")
+            yield cursor
+
+    @contextmanager
+    def _cursor_or_transaction(self, cursor=None):
+        """Reuse a caller's cursor (e.g. from bulk_session) or open a new transaction"""
+        if cursor is not None:
+            yield cursor
+        else:
+            with self.conn_manager.transaction() as transactionCursor:
+                yield transactionCursor
+
     def close(self):
         """
         Closes the database connection.
@@ -1,12 +1,13 @@
 from config.Config import get_config
 import threading
+import weakref
 from contextlib import contextmanager
 from typing import ContextManager, Generator
 from logs.logger import get_logger
 import os
 import psycopg2
 import psycopg2.pool
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_batch
 import sys
 from psycopg2 import DatabaseError
 
@@ -35,6 +36,8 @@ class DatabaseConnectionManager:
     _lock = threading.Lock()
     # Dictionary to store table locks
     _locks = {}
+    # Prepared statement names per pooled connection; entries go away with the connection
+    _prepared = weakref.WeakKeyDictionary()
 
     def __init__(self, db_url: str = None):
         """
@@ -98,9 +101,13 @@ class DatabaseConnectionManager:
             log_params["password"] = "****" if log_params["password"] else "None"
             logger.info(f"Initializing PostgreSQL connection pool with: {log_params}")
 
-            # Create connection pool
+            # Create connection pool - overflow connections cover concurrent scheduler writers.
+            # psycopg2 closes a returned connection once more than minconn are idle, so minconn is
+            # the pool size: that many connections (and their prepared statements) stay warm
             self.pool = psycopg2.pool.ThreadedConnectionPool(
-                minconn=1, maxconn=self.config.DB_POOL_SIZE, **conn_params
+                minconn=self.config.DB_POOL_SIZE,
+                maxconn=self.config.DB_POOL_SIZE + self.config.DB_MAX_OVERFLOW,
+                **conn_params
             )
             self._pool_closed = False
             self._initialized = True
@@ -286,10 +293,13 @@ class DatabaseConnectionManager:
             f"Database error during {operation}: {str(error)}"
         ) from error
 
-    def _get_transaction_cursor(self):
+    def _get_transaction_cursor(self, cursor_factory=RealDictCursor):
         """
         Helper method to get a connection and cursor for transactions.
 
+        Args:
+            cursor_factory: psycopg2 cursor class (RealDictCursor by default)
+
         Returns:
             tuple: (connection, cursor)
         """
@@ -298,7 +308,17 @@ class DatabaseConnectionManager:
                 "Database connection pool could not be initialized"
             )
         conn = self.pool.getconn()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur = conn.cursor(cursor_factory=cursor_factory)
+        self._patch_cursor_execute(cur)
+        return conn, cur
+
+    def _patch_cursor_execute(self, cur):
+        """
+        Let cursor.execute accept SQLAlchemy text() objects and map booleans to 1/0.
+
+        Args:
+            cur: psycopg2 cursor to patch in place
+        """
         original_execute = cur.execute
 
         def patched_execute(query, params=None):
@@ -317,13 +337,16 @@ class DatabaseConnectionManager:
             return original_execute(query, params)
 
         cur.execute = patched_execute
-        return conn, cur
 
     @contextmanager
-    def transaction(self):
+    def transaction(self, cursor_factory=RealDictCursor):
         """
         Provides a transaction context for database operations.
 
+        Args:
+            cursor_factory: psycopg2 cursor class (RealDictCursor by default,
+                            NamedTupleCursor for large read-only result sets)
+
         Returns:
             Cursor: Database cursor for operations
         """
@@ -332,13 +355,13 @@ class DatabaseConnectionManager:
         try:
             # First attempt to get connection and cursor
             try:
-                conn, cur = self._get_transaction_cursor()
+                conn, cur = self._get_transaction_cursor(cursor_factory)
             except psycopg2.pool.PoolError as e:
                 logger.error(f"Pool error on first attempt: {str(e)}")
                 if self._initialize_pool():
                     logger.info("Reinitialized pool after error")
                     try:
-                        conn, cur = self._get_transaction_cursor()
+                        conn, cur = self._get_transaction_cursor(cursor_factory)
                     except psycopg2.pool.PoolError as e2:
                         self._handle_connection_error(
                             e2, "transaction after reinitialization"
@@ -346,8 +369,8 @@ class DatabaseConnectionManager:
                 else:
                     self._handle_connection_error(e, "transaction")
 
-            # Set timezone to UTC for this session
-            cur.execute("SET timezone = 'UTC'")
+            # Pooled connections are opened with timezone=UTC (see _initialize_pool),
+            # so no per-transaction SET round trip is needed
             
             # Yield the cursor for the transaction
             yield cur
@@ -384,6 +407,96 @@ class DatabaseConnectionManager:
                     else:
                         self._handle_connection_error(e, "return connection to pool")
 
+    @contextmanager
+    def server_cursor(self, name: str, itersize: int = 5000, cursor_factory=RealDictCursor):
+        """
+        Provides a named (server-side) cursor inside a transaction.
+
+        Iterating the cursor pulls rows from the server itersize at a time,
+        so large result sets are never buffered in memory all at once.
+        The cursor accepts one execute() call.
+
+        Args:
+            name: Cursor name, unique within the connection
+            itersize: Rows fetched per network round trip while iterating
+            cursor_factory: psycopg2 cursor class (RealDictCursor by default)
+
+        Returns:
+            Cursor: Named cursor to execute a single query on and iterate
+        """
+        with self.transaction() as cur:
+            named_cur = cur.connection.cursor(name=name, cursor_factory=cursor_factory)
+            named_cur.itersize = itersize
+            self._patch_cursor_execute(named_cur)
+            try:
+                yield named_cur
+            finally:
+                if not named_cur.closed:
+                    named_cur.close()
+
+    def execute_prepared(self, cur, name: str, query, params=None):
+        """
+        Executes a query as a server-side prepared statement.
+
+        The statement is prepared the first time a pooled connection runs it and
+        executed by name afterwards, so the server skips parsing and planning.
+        Not usable on named cursors (DECLARE cannot wrap EXECUTE).
+
+        Args:
+            cur: Transaction cursor
+            name: Statement name, unique per query
+            query: SQL string or text() object using %s placeholders
+            params: Optional parameter sequence
+        """
+        self._prepare(cur, name, query)
+        if params:
+            placeholders = ", ".join(["%s"] * len(params))
+            cur.execute(f"EXECUTE {name} ({placeholders})", params)
+        else:
+            cur.execute(f"EXECUTE {name}")
+
+    def execute_batch_prepared(self, cur, name: str, query, argslist, page_size: int = 100):
+        """
+        Executes a single-row statement once per parameter sequence through a prepared statement.
+
+        Like psycopg2.extras.execute_batch - page_size EXECUTE calls are joined into one
+        round trip - but the server parses and plans the statement only once per connection.
+
+        Args:
+            cur: Transaction cursor
+            name: Statement name, unique per query
+            query: SQL string or text() object using %s placeholders
+            argslist: Sequence of parameter sequences
+            page_size: Number of EXECUTE calls sent per round trip
+        """
+        param_count = self._prepare(cur, name, query)
+        execute_batch(
+            cur,
+            f"EXECUTE {name} ({', '.join(['%s'] * param_count)})",
+            argslist,
+            page_size=page_size,
+        )
+
+    def _prepare(self, cur, name: str, query) -> int:
+        """
+        PREPAREs query as name on the cursor's connection unless it already was.
+
+        Returns:
+            int: Number of parameters of the statement
+        """
+        if hasattr(query, "text"):
+            query = query.text
+        param_count = query.count("%s")
+        with self._lock:
+            prepared = self._prepared.setdefault(cur.connection, set())
+        if name not in prepared:
+            body = query
+            for position in range(1, param_count + 1):
+                body = body.replace("%s", f"${position}", 1)
+            cur.execute(f"PREPARE {name} AS {body}")
+            prepared.add(name)
+        return param_count
+
     @contextmanager
     def table_lock(self, table_name: str):
         """
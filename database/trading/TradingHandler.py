@@ -1,21 +1,32 @@
 from config.Config import get_config
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
-import json
+import csv
+import io
 from database.operations.BaseDBHandler import BaseDBHandler
 from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
 from logs.logger import get_logger
 from sqlalchemy import text
+from psycopg2.extensions import AsIs, encodings
+from psycopg2.extras import execute_values, NamedTupleCursor, Json
 from enum import IntEnum
 from datetime import datetime, timezone
 
 
+import threading
+from contextlib import contextmanager
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, groupby, repeat
+from operator import attrgetter, itemgetter
+import numpy as np
+from types import MappingProxyType
 from utils.CommonUtil import CommonUtil
 from typing import Any
 from constants.TradingHandlerConstants import TradingHandlerConstants
+from constants.TradingConstants import TimeframeConstants
 from utils.IndicatorConstants import IndicatorConstants
-from api.trading.request import OHLCVDetails, VWAPSession
+from api.trading.request import OHLCVDetails, OHLCVArrays, VWAPSession
 from api.trading.request import TimeframeRecord
 from api.trading.request import TrackedToken
 from api.trading.request import EMAState
@@ -39,24 +50,1044 @@ class EMAStatus(IntEnum):
     AVAILABLE = 2
 
 # Actual Database Tables (based on _createBasicTables implementation)
+# No per-table documentation is maintained; getTableDocumentation/getColumnDescription read
+# this mapping, frozen once at import so lookups never rebuild or mutate it
+TABLE_DOCUMENTATION = MappingProxyType({})
+
+# Candle length per scheduler timeframe, resolved once at import
+_TIMEFRAME_SECONDS = MappingProxyType({
+    timeframe: CommonUtil.getTimeframeSeconds(timeframe)
+    for timeframe in ('15m', '30m', '1h', '4h', *TimeframeConstants.VALID_NEW_TOKEN_TIMEFRAMES)
+})
+
+
+# Runtime queries compiled once at import instead of on every call
+_SQL_ADD_TOKEN = text("""
+    INSERT INTO trackedtokens 
+    (tokenaddress, symbol, name, pairaddress, paircreatedtime, additionsource, addedby, metadata, createdat, lastupdatedat, status, enabledat)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 1, %s)
+    ON CONFLICT (tokenaddress) 
+    DO UPDATE SET
+        symbol = EXCLUDED.symbol,
+        name = EXCLUDED.name,
+        pairaddress = EXCLUDED.pairaddress,
+        paircreatedtime = EXCLUDED.paircreatedtime,
+        additionsource = EXCLUDED.additionsource,
+        addedby = EXCLUDED.addedby,
+        metadata = EXCLUDED.metadata,
+        lastupdatedat = EXCLUDED.lastupdatedat,
+        status = 1,
+        enabledat = EXCLUDED.enabledat,
+        disabledat = NULL
+    -- An already active token is left untouched and returns no row
+    WHERE trackedtokens.status <> 1
+    RETURNING trackedtokenid
+""")
+
+_SQL_DISABLE_TOKEN = text("""
+    UPDATE trackedtokens 
+    SET status = 2, disabledat = %s, disabledby = %s, lastupdatedat = %s
+    WHERE tokenaddress = %s AND status = 1
+    RETURNING trackedtokenid, symbol, name, tokenaddress
+""")
+
+_SQL_ENABLE_TOKEN = text("""
+    UPDATE trackedtokens 
+    SET status = 1, enabledat = %s, disabledat = NULL, disabledby = NULL, lastupdatedat = %s
+    WHERE tokenaddress = %s AND status = 2
+    RETURNING trackedtokenid, symbol, name, tokenaddress
+""")
+
+# Token lookup and cascade delete in one statement: every DELETE keys off the looked-up
+# token, so an unknown address deletes nothing and returns no row
+_SQL_DELETE_TOKEN_CASCADE = text("""
+    WITH token AS (
+        SELECT trackedtokenid, symbol, name, tokenaddress
+        FROM trackedtokens
+        WHERE tokenaddress = %s
+    ),
+    deleted_alerts AS (
+        DELETE FROM alerts WHERE tokenaddress = (SELECT tokenaddress FROM token) RETURNING 1
+    ),
+    deleted_rsistates AS (
+        DELETE FROM rsistates WHERE tokenaddress = (SELECT tokenaddress FROM token) RETURNING 1
+    ),
+    deleted_avwapstates AS (
+        DELETE FROM avwapstates WHERE tokenaddress = (SELECT tokenaddress FROM token) RETURNING 1
+    ),
+    deleted_vwapsessions AS (
+        DELETE FROM vwapsessions WHERE tokenaddress = (SELECT tokenaddress FROM token) RETURNING 1
+    ),
+    deleted_emastates AS (
+        DELETE FROM emastates WHERE tokenaddress = (SELECT tokenaddress FROM token) RETURNING 1
+    ),
+    deleted_ohlcvdetails AS (
+        DELETE FROM ohlcvdetails WHERE tokenaddress = (SELECT tokenaddress FROM token) RETURNING 1
+    ),
+    deleted_timeframemetadata AS (
+        DELETE FROM timeframemetadata WHERE tokenaddress = (SELECT tokenaddress FROM token) RETURNING 1
+    ),
+    deleted_trackedtokens AS (
+        DELETE FROM trackedtokens WHERE tokenaddress = (SELECT tokenaddress FROM token) RETURNING 1
+    )
+    SELECT 
+        token.trackedtokenid,
+        token.symbol,
+        token.name,
+        token.tokenaddress,
+        (SELECT COUNT(*) FROM deleted_alerts) as alerts_deleted,
+        (SELECT COUNT(*) FROM deleted_rsistates) as rsistates_deleted,
+        (SELECT COUNT(*) FROM deleted_avwapstates) as avwapstates_deleted,
+        (SELECT COUNT(*) FROM deleted_vwapsessions) as vwapsessions_deleted,
+        (SELECT COUNT(*) FROM deleted_emastates) as emastates_deleted,
+        (SELECT COUNT(*) FROM deleted_ohlcvdetails) as ohlcvdetails_deleted,
+        (SELECT COUNT(*) FROM deleted_timeframemetadata) as timeframemetadata_deleted,
+        (SELECT COUNT(*) FROM deleted_trackedtokens) as trackedtokens_deleted
+    FROM token
+""")
+
+_SQL_GET_ACTIVE_TOKENS = text("""
+    SELECT t.*, 
+           COUNT(tm.id) as active_timeframes
+    FROM trackedtokens t
+    LEFT JOIN timeframemetadata tm ON t.tokenaddress = tm.tokenaddress
+    WHERE t.status = 1
+    GROUP BY t.trackedtokenid
+    ORDER BY t.createdat DESC
+""")
+
+_SQL_GET_DISABLED_TOKENS = text("""
+    SELECT t.*, 
+           COUNT(tm.id) as active_timeframes
+    FROM trackedtokens t
+    LEFT JOIN timeframemetadata tm ON t.tokenaddress = tm.tokenaddress
+    WHERE t.status = 2
+    GROUP BY t.trackedtokenid
+    ORDER BY t.disabledat DESC
+""")
+
+_SQL_ENABLE_TOKEN_IF_EXISTS = text("""
+    UPDATE trackedtokens 
+    SET status = 1, enabledat = NOW(), disabledat = NULL, disabledby = NULL, lastupdatedat = NOW()
+    WHERE tokenaddress = %s
+    RETURNING trackedtokenid
+""")
+
+_SQL_GET_ALL_VWAP_DATA = text("""
+    SELECT 
+        tt.trackedtokenid,
+        tt.tokenaddress,
+        tt.pairaddress,
+        tt.paircreatedtime,
+        tm.id as timeframeid,
+        tt.symbol,
+        tt.name,
+        tm.timeframe,
+        tm.lastfetchedat,
+        vs.sessionstartunix,
+        vs.sessionendunix,
+        vs.cumulativepv,
+        vs.cumulativevolume,
+        vs.currentvwap,
+        vs.lastcandleunix,
+        vs.nextcandlefetch,
+        candles.unixtimes,
+        candles.highprices,
+        candles.lowprices,
+        candles.closeprices,
+        candles.volumes
+    FROM trackedtokens tt
+    INNER JOIN timeframemetadata tm ON tt.tokenaddress = tm.tokenaddress
+    LEFT JOIN vwapsessions vs ON tt.tokenaddress = vs.tokenaddress 
+        AND tt.pairaddress = vs.pairaddress 
+        AND tm.timeframe = vs.timeframe
+    LEFT JOIN LATERAL (
+        SELECT 
+            array_agg(ohlcv.unixtime ORDER BY ohlcv.unixtime) as unixtimes,
+            array_agg(ohlcv.highprice ORDER BY ohlcv.unixtime) as highprices,
+            array_agg(ohlcv.lowprice ORDER BY ohlcv.unixtime) as lowprices,
+            array_agg(ohlcv.closeprice ORDER BY ohlcv.unixtime) as closeprices,
+            array_agg(ohlcv.volume ORDER BY ohlcv.unixtime) as volumes
+        FROM ohlcvdetails ohlcv
+        WHERE ohlcv.timeframeid = tm.id
+          AND ohlcv.unixtime > COALESCE(vs.lastcandleunix, 0)
+    ) candles ON TRUE
+    WHERE tt.status = 1
+    ORDER BY tt.tokenaddress, tm.timeframe
+""")
+
+_SQL_ADVANCE_VWAP = text("""
+    WITH timeframe_seconds AS (
+        SELECT * FROM unnest(%s::text[], %s::bigint[]) AS t(timeframe, seconds)
+    ),
+    -- Same segmentation as IndicatorKernels.vwapUpdate: a candle only opens a new session when its
+    -- day is past the stored session's day, so every candle up to that day continues the stored
+    -- session (and its cumulative values) and each later day is a session of its own
+    new_candles AS (
+        SELECT 
+            tt.tokenaddress,
+            tt.pairaddress,
+            tm.timeframe,
+            tm.id as timeframeid,
+            ohlcv.unixtime,
+            vs.sessionstartunix as storedsessionstartunix,
+            vs.sessionendunix as storedsessionendunix,
+            COALESCE(vs.sessionendunix / 86400, -1) as storedsessionday,
+            GREATEST(ohlcv.unixtime / 86400, COALESCE(vs.sessionendunix / 86400, -1)) as sessionday,
+            -- float8 arithmetic in the kernel's operation order, so both paths produce identical values
+            (ohlcv.highprice::double precision + ohlcv.lowprice::double precision
+                + ohlcv.closeprice::double precision) / 3::double precision
+                * ohlcv.volume::double precision as pv,
+            ohlcv.volume::double precision as vol,
+            CASE WHEN ohlcv.unixtime / 86400 <= COALESCE(vs.sessionendunix / 86400, -1)
+                 THEN COALESCE(vs.cumulativepv, 0) ELSE 0 END as carrypv,
+            CASE WHEN ohlcv.unixtime / 86400 <= COALESCE(vs.sessionendunix / 86400, -1)
+                 THEN COALESCE(vs.cumulativevolume, 0) ELSE 0 END as carryvolume
+        FROM trackedtokens tt
+        INNER JOIN timeframemetadata tm ON tt.tokenaddress = tm.tokenaddress
+        LEFT JOIN vwapsessions vs ON tt.tokenaddress = vs.tokenaddress 
+            AND tt.pairaddress = vs.pairaddress 
+            AND tm.timeframe = vs.timeframe
+        INNER JOIN ohlcvdetails ohlcv ON tm.id = ohlcv.timeframeid 
+            AND ohlcv.unixtime > COALESCE(vs.lastcandleunix, 0)
+        WHERE tt.status = 1
+    ),
+    running AS (
+        SELECT 
+            nc.*,
+            nc.carrypv + SUM(nc.pv) OVER session_window as cumulativepv,
+            nc.carryvolume + SUM(nc.vol) OVER session_window as cumulativevolume,
+            ROW_NUMBER() OVER (PARTITION BY nc.timeframeid ORDER BY nc.unixtime DESC) as recency
+        FROM new_candles nc
+        WINDOW session_window AS (PARTITION BY nc.timeframeid, nc.sessionday ORDER BY nc.unixtime)
+    ),
+    candle_updates AS (
+        UPDATE ohlcvdetails 
+        SET vwapvalue = r.cumulativepv / r.cumulativevolume
+        FROM running r
+        WHERE ohlcvdetails.timeframeid = r.timeframeid 
+          AND ohlcvdetails.unixtime = r.unixtime
+          AND r.cumulativevolume > 0
+        RETURNING 1
+    ),
+    session_upserts AS (
+        INSERT INTO vwapsessions 
+        (tokenaddress, pairaddress, timeframe, sessionstartunix, sessionendunix,
+         cumulativepv, cumulativevolume, currentvwap, lastcandleunix, nextcandlefetch,
+         createdat, lastupdatedat)
+        SELECT 
+            r.tokenaddress,
+            r.pairaddress,
+            r.timeframe,
+            -- A stored session that was only continued keeps its bounds, as VWAPProcessor does
+            CASE WHEN r.sessionday = r.storedsessionday THEN r.storedsessionstartunix ELSE r.sessionday * 86400 END,
+            CASE WHEN r.sessionday = r.storedsessionday THEN r.storedsessionendunix ELSE r.sessionday * 86400 + 86399 END,
+            r.cumulativepv,
+            r.cumulativevolume,
+            CASE WHEN r.cumulativevolume > 0 THEN r.cumulativepv / r.cumulativevolume ELSE 0 END,
+            r.unixtime,
+            r.unixtime + COALESCE(ts.seconds, 0),
+            NOW(),
+            NOW()
+        FROM running r
+        LEFT JOIN timeframe_seconds ts ON ts.timeframe = r.timeframe
+        WHERE r.recency = 1
+        ON CONFLICT (tokenaddress, timeframe) 
+        DO UPDATE SET 
+            sessionstartunix = EXCLUDED.sessionstartunix,
+            sessionendunix = EXCLUDED.sessionendunix,
+            cumulativepv = EXCLUDED.cumulativepv,
+            cumulativevolume = EXCLUDED.cumulativevolume,
+            currentvwap = EXCLUDED.currentvwap,
+            lastcandleunix = EXCLUDED.lastcandleunix,
+            nextcandlefetch = EXCLUDED.nextcandlefetch,
+            lastupdatedat = NOW()
+        RETURNING 1
+    )
+    SELECT 
+        (SELECT COUNT(*) FROM candle_updates) as candlesupdated,
+        (SELECT COUNT(*) FROM session_upserts) as sessionsupdated
+""")
+
+# timebucket is derived from (unixtime, timeframe), so the server computes it on write
+# instead of the client sending it with every candle. Lengths come from the same CommonUtil map
+# the scheduler uses; an unknown timeframe yields NULL, so the NOT NULL column rejects the insert
+_TIMEBUCKET_EXPRESSION = (
+    "unixtime - unixtime % CASE timeframe "
+    + " ".join(f"WHEN '{timeframe}' THEN {seconds}" for timeframe, seconds in _TIMEFRAME_SECONDS.items())
+    + " ELSE NULL END"
+)
+
+# List partitioned by timeframe so each timeframe keeps its own smaller heap and indexes
+# (partition key must be part of every unique constraint)
+_SQL_CREATE_OHLCV_DETAILS = text(f"""
+    CREATE TABLE IF NOT EXISTS ohlcvdetails (
+        id BIGSERIAL,
+        timeframeid BIGINT NOT NULL REFERENCES timeframemetadata(id),
+        tokenaddress CHAR(44) NOT NULL,
+        pairaddress CHAR(44) NOT NULL,
+        timeframe VARCHAR(10) NOT NULL,
+        unixtime BIGINT NOT NULL,
+        timebucket BIGINT NOT NULL GENERATED ALWAYS AS ({_TIMEBUCKET_EXPRESSION}) STORED,
+        openprice DECIMAL(20,8) NOT NULL,
+        highprice DECIMAL(20,8) NOT NULL,
+        lowprice DECIMAL(20,8) NOT NULL,
+        closeprice DECIMAL(20,8) NOT NULL,
+        volume DECIMAL(20,4) NOT NULL,
+        trades INTEGER DEFAULT 0,
+        vwapvalue DOUBLE PRECISION,
+        avwapvalue DECIMAL(20,8),
+        ema12value DOUBLE PRECISION,
+        ema21value DOUBLE PRECISION,
+        ema34value DOUBLE PRECISION,
+        rsivalue DECIMAL(10,4),
+        stochrsivalue DECIMAL(10,4),
+        stochrsik DECIMAL(10,4),
+        stochrsid DECIMAL(10,4),
+        trend VARCHAR(20),
+        status VARCHAR(50),
+        trend12 VARCHAR(20),
+        status12 VARCHAR(50),
+        iscomplete BOOLEAN DEFAULT TRUE,
+        datasource VARCHAR(20) DEFAULT 'api',
+        createdat TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+        lastupdatedat TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+        PRIMARY KEY (id, timeframe),
+        UNIQUE(tokenaddress, timeframe, unixtime)
+    ) PARTITION BY LIST (timeframe)
+""")
+
+_SQL_CREATE_OHLCV_TFID_TIME_INDEX = text("""
+    CREATE INDEX IF NOT EXISTS idx_ohlcv_tfid_time
+    ON ohlcvdetails (timeframeid, unixtime)
+    INCLUDE (openprice, highprice, lowprice, closeprice, volume)
+""")
+
+# EMA scheduler read lives server-side: the client sends one short call and the
+# (inlinable) SQL function is planned with the live emastates/trackedtokens/timeframemetadata join
+_SQL_CREATE_EMA_SCHEDULER_FUNCTION = text("""
+    CREATE OR REPLACE FUNCTION get_active_ema_with_candles()
+    RETURNS TABLE (
+        tokenaddress CHAR(44),
+        pairaddress CHAR(44),
+        timeframe VARCHAR,
+        timeframeid BIGINT,
+        emakey VARCHAR,
+        emavalue DOUBLE PRECISION,
+        status INTEGER,
+        lastupdatedunix BIGINT,
+        emaavailabletime BIGINT,
+        lastfetchedat BIGINT,
+        candle_unixtimes BIGINT[],
+        candle_closeprices DOUBLE PRECISION[],
+        symbol VARCHAR,
+        name VARCHAR
+    )
+    LANGUAGE sql STABLE
+    AS $$
+        SELECT 
+            es.tokenaddress,
+            es.pairaddress,
+            es.timeframe,
+            tmf.id AS timeframeid,
+            es.emakey,
+            es.emavalue::double precision AS emavalue,
+            es.status,
+            es.lastupdatedunix,
+            es.emaavailabletime,
+            tmf.lastfetchedat,
+            candles.unixtimes as candle_unixtimes,
+            candles.closeprices as candle_closeprices,
+            tt.symbol,
+            tt.name
+        FROM emastates es
+        INNER JOIN trackedtokens tt ON es.tokenaddress = tt.tokenaddress AND es.pairaddress = tt.pairaddress
+        INNER JOIN timeframemetadata tmf ON es.tokenaddress = tmf.tokenaddress AND es.timeframe = tmf.timeframe
+        -- One row per (token, timeframe, emakey); candles come back as parallel arrays ordered by unixtime.
+        -- AVAILABLE (2) states only need candles after lastupdatedunix; NOT_AVAILABLE states get ALL
+        -- candles (initial SMA calculation). A single lower bound keeps this a range scan on (timeframeid, unixtime).
+        LEFT JOIN LATERAL (
+            SELECT 
+                array_agg(o.unixtime ORDER BY o.unixtime) as unixtimes,
+                -- float8 so the driver decodes a double array in C instead of building a Decimal per price
+                array_agg(o.closeprice::double precision ORDER BY o.unixtime) as closeprices
+            FROM ohlcvdetails o
+            WHERE o.timeframeid = tmf.id
+              AND o.unixtime > CASE WHEN es.status = 2 THEN es.lastupdatedunix ELSE -1 END
+              AND o.iscomplete = TRUE
+        ) candles ON TRUE
+        WHERE tt.status = 1
+          AND tmf.isactive = TRUE
+        ORDER BY es.tokenaddress, es.timeframe, es.emakey
+    $$
+""")
+
+_SQL_GET_ALL_EMA_DATA = text("""
+    SELECT * FROM get_active_ema_with_candles()
+    -- The reader groups contiguous (tokenaddress, timeframe) rows, so the order is part of the contract
+    ORDER BY tokenaddress, timeframe, emakey
+""")
+
+_SQL_GET_TIMEFRAMES_READY_FOR_FETCHING = text("""
+    SELECT tm.id as timeframeid,
+           tm.tokenaddress, 
+           tm.pairaddress,
+           tm.timeframe,
+           tm.nextfetchat,
+           tm.lastfetchedat,
+           tt.symbol,
+           tt.name,
+           tt.paircreatedtime,
+           tt.trackedtokenid
+    FROM timeframemetadata tm
+    INNER JOIN trackedtokens tt ON tm.tokenaddress = tt.tokenaddress
+    WHERE tm.isactive = TRUE 
+        AND tt.status = 1
+        AND tm.nextfetchat <= %s
+        AND tt.createdat <= to_timestamp(%s)
+    ORDER BY tm.nextfetchat ASC
+""")
+
+_SQL_GET_ALL_AVWAP_DATA = text("""
+    WITH avwap_data AS (
+        SELECT 
+            avs.tokenaddress,
+            avs.pairaddress,
+            avs.timeframe,
+            avs.avwap,
+            avs.cumulativepv,
+            avs.cumulativevolume,
+            avs.lastupdatedunix,
+            avs.nextfetchtime,
+            tmf.id as timeframeid,
+            tmf.lastfetchedat,
+            tt.symbol,
+            tt.name,
+            CASE 
+                WHEN avs.lastupdatedunix IS NOT NULL THEN avs.lastupdatedunix  -- Get candles after last updated
+                ELSE 0  -- Get all candles if no previous update
+            END as candle_from_time
+        FROM avwapstates avs
+        INNER JOIN trackedtokens tt ON avs.tokenaddress = tt.tokenaddress AND avs.pairaddress = tt.pairaddress
+        INNER JOIN timeframemetadata tmf ON avs.tokenaddress = tmf.tokenaddress AND avs.timeframe = tmf.timeframe
+        WHERE tt.status = 1
+          AND tmf.isactive = TRUE
+    )
+    SELECT 
+        ad.tokenaddress,
+        ad.pairaddress,
+        ad.timeframe,
+        ad.timeframeid,
+        -- float8 so the driver hands back Python floats instead of Decimals
+        ad.avwap::double precision AS avwap,
+        ad.cumulativepv::double precision AS cumulativepv,
+        ad.cumulativevolume::double precision AS cumulativevolume,
+        ad.lastupdatedunix,
+        ad.nextfetchtime,
+        ad.lastfetchedat,
+        candles.unixtimes as candle_unixtimes,
+        candles.timebuckets as candle_timebuckets,
+        candles.openprices as candle_openprices,
+        candles.highprices as candle_highprices,
+        candles.lowprices as candle_lowprices,
+        candles.closeprices as candle_closeprices,
+        candles.volumes as candle_volumes,
+        candles.trades as candle_trades,
+        candles.datasources as candle_datasources,
+        ad.symbol,
+        ad.name
+    FROM avwap_data ad
+    -- One row per (token, timeframe); candles come back as parallel arrays ordered by unixtime
+    LEFT JOIN LATERAL (
+        SELECT 
+            array_agg(o.unixtime ORDER BY o.unixtime) as unixtimes,
+            array_agg(o.timebucket ORDER BY o.unixtime) as timebuckets,
+            array_agg(o.openprice::double precision ORDER BY o.unixtime) as openprices,
+            array_agg(o.highprice::double precision ORDER BY o.unixtime) as highprices,
+            array_agg(o.lowprice::double precision ORDER BY o.unixtime) as lowprices,
+            array_agg(o.closeprice::double precision ORDER BY o.unixtime) as closeprices,
+            array_agg(o.volume::double precision ORDER BY o.unixtime) as volumes,
+            array_agg(o.trades ORDER BY o.unixtime) as trades,
+            array_agg(o.datasource ORDER BY o.unixtime) as datasources
+        FROM ohlcvdetails o
+        WHERE o.timeframeid = ad.timeframeid
+          AND o.unixtime > ad.candle_from_time
+          AND o.iscomplete = TRUE
+    ) candles ON TRUE
+    ORDER BY ad.tokenaddress, ad.timeframe
+""")
+
+_SQL_GET_ALL_RSI_DATA = text("""
+    WITH rsi_data AS (
+        SELECT 
+            rs.tokenaddress,
+            rs.pairaddress,
+            rs.timeframe,
+            rs.rsiinterval,
+            rs.rsiavailabletime,
+            rs.rsivalue,
+            rs.avggain,
+            rs.avgloss,
+            rs.lastcloseprice,
+            rs.stochrsiinterval,
+            rs.stochrsivalue,
+            rs.rsivalues,
+            rs.kinterval,
+            rs.kvalue,
+            rs.stochrsivalues,
+            rs.dinterval,
+            rs.dvalue,
+            rs.kvalues,
+            rs.lastupdatedunix,
+            rs.nextfetchtime,
+            rs.paircreatedtime,
+            rs.status,
+            tmf.id as timeframeid,
+            tmf.lastfetchedat,
+            CASE 
+                WHEN rs.status = 2 THEN rs.lastupdatedunix
+                WHEN rs.status = 1 AND tmf.lastfetchedat >= rs.rsiavailabletime THEN 0
+                ELSE -1
+            END as candle_from_time,
+            tt.symbol,
+            tt.name
+        FROM rsistates rs
+        INNER JOIN trackedtokens tt ON rs.tokenaddress = tt.tokenaddress AND rs.pairaddress = tt.pairaddress
+        INNER JOIN timeframemetadata tmf ON rs.tokenaddress = tmf.tokenaddress AND rs.timeframe = tmf.timeframe
+        WHERE tt.status = 1
+          AND tmf.isactive = TRUE
+    )
+    SELECT 
+        rd.tokenaddress,
+        rd.pairaddress,
+        rd.timeframe,
+        rd.timeframeid,
+        rd.rsiinterval,
+        rd.rsiavailabletime,
+        rd.rsivalue,
+        rd.avggain,
+        rd.avgloss,
+        rd.lastcloseprice,
+        rd.stochrsiinterval,
+        rd.stochrsivalue,
+        rd.rsivalues,
+        rd.kinterval,
+        rd.kvalue,
+        rd.stochrsivalues,
+        rd.dinterval,
+        rd.dvalue,
+        rd.kvalues,
+        rd.lastupdatedunix,
+        rd.nextfetchtime,
+        rd.paircreatedtime,
+        rd.status,
+        rd.lastfetchedat,
+        cd.unixtime as candle_unixtime,
+        cd.closeprice as candle_closeprice,
+        cd.highprice as candle_highprice,
+        cd.lowprice as candle_lowprice,
+        cd.volume as candle_volume,
+        rd.symbol,
+        rd.name
+    FROM rsi_data rd
+    -- Per-state lookup on (timeframeid, unixtime) instead of hash-joining every candle of the
+    -- token/timeframe back onto rsi_data; candle_from_time 0 means all candles
+    LEFT JOIN LATERAL (
+        SELECT 
+            o.unixtime,
+            -- float8 so the driver returns doubles instead of building a Decimal per price
+            o.closeprice::double precision AS closeprice,
+            o.highprice::double precision AS highprice,
+            o.lowprice::double precision AS lowprice,
+            o.volume::double precision AS volume
+        FROM ohlcvdetails o
+        WHERE o.timeframeid = rd.timeframeid
+          AND o.unixtime > CASE WHEN rd.candle_from_time = 0 THEN -1 ELSE rd.candle_from_time END
+          AND o.iscomplete = TRUE
+    ) cd ON TRUE
+    WHERE rd.candle_from_time >= 0
+    ORDER BY rd.tokenaddress, rd.timeframe, cd.unixtime ASC
+""")
+
+
+# Alert processing read - the token filter only switches the WHERE clause, so both variants are built once
+_SQL_GET_ALERT_STATE_AND_NEW_CANDLES_TEMPLATE = """
+    WITH alert_data AS (
+        SELECT 
+            a.alertid,
+            a.tokenid,
+            a.tokenaddress,
+            a.pairaddress,
+            a.timeframe,
+            a.vwap as alert_vwap,
+            a.ema12 as alert_ema12,
+            a.ema21 as alert_ema21,
+            a.ema34 as alert_ema34,
+            a.avwap as alert_avwap,
+            a.rsivalue as alert_rsivalue,
+            a.stochrsivalue as alert_stochrsivalue,
+            a.stochrsik as alert_stochrsik,
+            a.stochrsid as alert_stochrsid,
+            a.avwappriceposition as alert_avwappriceposition,
+            a.lastupdatedunix,
+            a.trend as alert_trend,
+            a.status as alert_status,
+            a.trend12 as alert_trend12,
+            a.status12 as alert_status12,
+            a.touchcount,
+            a.latesttouchunix,
+            a.touchcount12,
+            a.latesttouchunix12,
+            tt.trackedtokenid,
+            tt.symbol,
+            tt.name,
+            tm.id as timeframeid,
+            tm.lastfetchedat,
+            es12.emaavailabletime as ema12availabletime,
+            es21.emaavailabletime as ema21availabletime,
+            es34.emaavailabletime as ema34availabletime
+        FROM alerts a
+        INNER JOIN trackedtokens tt ON a.tokenid = tt.trackedtokenid
+        INNER JOIN timeframemetadata tm ON a.tokenaddress = tm.tokenaddress 
+            AND a.timeframe = tm.timeframe
+        LEFT JOIN emastates es12 ON a.tokenaddress = es12.tokenaddress 
+            AND a.timeframe = es12.timeframe AND es12.emakey = '12'
+        LEFT JOIN emastates es21 ON a.tokenaddress = es21.tokenaddress 
+            AND a.timeframe = es21.timeframe AND es21.emakey = '21'
+        LEFT JOIN emastates es34 ON a.tokenaddress = es34.tokenaddress 
+            AND a.timeframe = es34.timeframe AND es34.emakey = '34'
+        {whereClause}
+    )
+    SELECT 
+        ad.*,
+        o.unixtime,
+        o.timebucket,
+        -- float8 so the driver returns doubles instead of building a Decimal per value
+        o.openprice::double precision AS openprice,
+        o.highprice::double precision AS highprice,
+        o.lowprice::double precision AS lowprice,
+        o.closeprice::double precision AS closeprice,
+        o.volume::double precision AS volume,
+        o.trades,
+        o.vwapvalue::double precision AS vwapvalue,
+        o.avwapvalue::double precision AS avwapvalue,
+        o.ema12value::double precision AS ema12value,
+        o.ema21value::double precision AS ema21value,
+        o.ema34value::double precision AS ema34value,
+        o.rsivalue::double precision AS rsivalue,
+        o.stochrsivalue::double precision AS stochrsivalue,
+        o.stochrsik::double precision AS stochrsik,
+        o.stochrsid::double precision AS stochrsid,
+        o.trend as candle_trend,
+        o.status as candle_status,
+        o.trend12 as candle_trend12,
+        o.status12 as candle_status12
+    FROM alert_data ad
+    LEFT JOIN ohlcvdetails o ON ad.tokenaddress = o.tokenaddress 
+        AND ad.timeframe = o.timeframe
+        AND o.unixtime > COALESCE(ad.lastupdatedunix, 0)
+        AND o.vwapvalue IS NOT NULL
+        AND o.avwapvalue IS NOT NULL
+        AND (ad.ema12availabletime IS NULL OR o.unixtime < ad.ema12availabletime OR o.ema12value IS NOT NULL)
+        AND (ad.ema21availabletime IS NULL OR o.unixtime < ad.ema21availabletime OR o.ema21value IS NOT NULL)
+        AND (ad.ema34availabletime IS NULL OR o.unixtime < ad.ema34availabletime OR o.ema34value IS NOT NULL)
+    ORDER BY ad.tokenaddress, ad.timeframe, o.unixtime
+"""
+_SQL_GET_ALERT_STATE_AND_NEW_CANDLES = text(
+    _SQL_GET_ALERT_STATE_AND_NEW_CANDLES_TEMPLATE.format(whereClause="WHERE tt.status = 1")
+)
+_SQL_GET_ALERT_STATE_AND_NEW_CANDLES_FOR_TOKEN = text(
+    _SQL_GET_ALERT_STATE_AND_NEW_CANDLES_TEMPLATE.format(whereClause="WHERE tt.status = 1 AND tt.tokenaddress = %s")
+)
+
+
+# Active token listing is cached briefly; token add/enable/disable/delete drop it immediately
+_ACTIVE_TOKENS_CACHE_TTL_SECONDS = 30
+
+# Candle batches larger than this are loaded with COPY instead of multi-row VALUES
+_CANDLE_COPY_THRESHOLD = 5000
+
+# Candle inserts carry 25 columns per row, so COPY pays off far earlier than for the
+# narrow indicator updates
+_CANDLE_INSERT_COPY_THRESHOLD = 500
+
+# Page size for candle VALUES batches: anything below the COPY threshold goes out as one statement
+_CANDLE_PAGE_SIZE = _CANDLE_COPY_THRESHOLD
+
+# Rows encoded per COPY chunk - bounds the CSV buffer on large backfills
+_CANDLE_COPY_CHUNK_ROWS = _CANDLE_COPY_THRESHOLD
+
+# Leading candle insert columns shared by every candle of one timeframe
+# (timeframeid, tokenaddress, pairaddress, timeframe)
+_CANDLE_ROW_PREFIX = itemgetter(0, 1, 2, 3)
+
+# Page size for the state table upserts (one row per token timeframe)
+_STATE_PAGE_SIZE = 1000
+
+# Candle value updates larger than this are split by token across pooled connections;
+# at most this many shards and half the pool, so the other scheduler jobs still get connections
+_CANDLE_PARALLEL_UPDATE_THRESHOLD = 20000
+_MAX_CANDLE_UPDATE_SHARDS = 4
+
+# Stored type of the single-value candle columns; incoming values are rounded to it before
+# comparing, so rows whose stored value would not change are skipped
+_CANDLE_VALUE_COLUMN_TYPES = MappingProxyType({
+    'vwapvalue': 'double precision',
+    'avwapvalue': 'numeric(20,8)',
+})
+
+# POJO -> query tuple getters, one C-level call per row (field order matches the batch SQL)
+_EMA_STATE_ROW = attrgetter('tokenAddress', 'pairAddress', 'timeframe', 'emaKey', 'emaValue',
+                            'lastUpdatedUnix', 'nextFetchTime', 'emaAvailableTime', 'pairCreatedTime', 'status')
+_AVWAP_STATE_ROW = attrgetter('tokenAddress', 'pairAddress', 'timeframe', 'avwap', 'cumulativePV',
+                              'cumulativeVolume', 'lastUpdatedUnix', 'nextFetchTime')
+_AVWAP_CANDLE_ROW = attrgetter('avwapValue', 'tokenAddress', 'timeframe', 'unixTime')
+_EMA_CANDLE_ROW = attrgetter('tokenAddress', 'timeframe', 'unixTime', 'ema12Value', 'ema21Value', 'ema34Value')
+_RSI_CANDLE_ROW = attrgetter('tokenAddress', 'timeframe', 'unixTime',
+                             'rsiValue', 'stochRSIValue', 'stochRSIK', 'stochRSID')
+
+# EMA state / candle in-place updates; {source} is a VALUES list or staging table aliased v
+_SQL_UPDATE_EMA_STATES = """
+    UPDATE emastates
+    SET emavalue = v.emavalue,
+        lastupdatedunix = v.lastupdatedunix,
+        nextfetchtime = v.nextfetchtime,
+        status = v.status,
+        lastupdatedat = NOW()
+    FROM {source}
+    WHERE emastates.tokenaddress = v.tokenaddress
+      AND emastates.timeframe = v.timeframe
+      AND emastates.emakey = v.emakey
+"""
+_EMA_STATE_VALUES_SOURCE = "(VALUES %s) AS v(tokenaddress, timeframe, emakey, emavalue, lastupdatedunix, nextfetchtime, status)"
+_EMA_STATE_VALUES_TEMPLATE = "(%s::char(44), %s, %s, %s::numeric, %s::bigint, %s::bigint, %s::integer)"
+
+_SQL_UPDATE_EMA_CANDLES = """
+    UPDATE ohlcvdetails o
+    SET ema12value = COALESCE(v.ema12value, o.ema12value),
+        ema21value = COALESCE(v.ema21value, o.ema21value),
+        ema34value = COALESCE(v.ema34value, o.ema34value),
+        lastupdatedat = NOW()
+    FROM {source}
+    WHERE o.tokenaddress = v.tokenaddress
+      AND o.timeframe = v.timeframe
+      AND o.unixtime = v.unixtime
+      -- Skip candles whose stored values would not change
+      AND (o.ema12value IS DISTINCT FROM COALESCE(v.ema12value, o.ema12value)
+        OR o.ema21value IS DISTINCT FROM COALESCE(v.ema21value, o.ema21value)
+        OR o.ema34value IS DISTINCT FROM COALESCE(v.ema34value, o.ema34value))
+"""
+_EMA_CANDLE_VALUES_SOURCE = "(VALUES %s) AS v(tokenaddress, timeframe, unixtime, ema12value, ema21value, ema34value)"
+_EMA_CANDLE_VALUES_TEMPLATE = "(%s::char(44), %s, %s::bigint, %s::double precision, %s::double precision, %s::double precision)"
+
+# Both EMA updates as one statement - a data-modifying CTE always runs to completion
+_SQL_UPDATE_EMA_STATES_AND_CANDLES = (
+    "WITH updatedstates AS (" + _SQL_UPDATE_EMA_STATES.format(source=_EMA_STATE_VALUES_SOURCE) + ")"
+    + _SQL_UPDATE_EMA_CANDLES.format(source=_EMA_CANDLE_VALUES_SOURCE)
+)
+
+# Column order matches the candle tuples built by the batchPersist* methods
+_OHLCV_INSERT_COLUMNS = """timeframeid, tokenaddress, pairaddress, timeframe, unixtime,
+             openprice, highprice, lowprice, closeprice, volume, trades,
+             vwapvalue, avwapvalue, ema12value, ema21value, ema34value,
+             rsivalue, stochrsivalue, stochrsik, stochrsid,
+             trend, status, trend12, status12, datasource"""
+
+# Only complete candles are persisted, so iscomplete is written as a literal instead of a per-row parameter
+_OHLCV_CONSTANT_COLUMNS = "iscomplete, createdat, lastupdatedat"
+_OHLCV_CONSTANT_VALUES = "TRUE, NOW(), NOW()"
+
+_OHLCV_UPSERT_CLAUSE = """ON CONFLICT (tokenaddress, timeframe, unixtime)
+            DO UPDATE SET
+                vwapvalue = EXCLUDED.vwapvalue,
+                avwapvalue = EXCLUDED.avwapvalue,
+                ema12value = EXCLUDED.ema12value,
+                ema21value = EXCLUDED.ema21value,
+                ema34value = EXCLUDED.ema34value,
+                rsivalue = EXCLUDED.rsivalue,
+                stochrsivalue = EXCLUDED.stochrsivalue,
+                stochrsik = EXCLUDED.stochrsik,
+                stochrsid = EXCLUDED.stochrsid,
+                trend = EXCLUDED.trend,
+                status = EXCLUDED.status,
+                trend12 = EXCLUDED.trend12,
+                status12 = EXCLUDED.status12,
+                lastupdatedat = NOW()"""
+_OHLCV_VALUES_TEMPLATE = "(" + ", ".join(["%s"] * 25) + ", " + _OHLCV_CONSTANT_VALUES + ")"
+
+# Scheduler write statements - built once at import, so every batch sends identical query text
+# One array parameter per column - the statement text stays the same whatever the batch size,
+# so it runs as a prepared statement
+_SQL_UPSERT_TIMEFRAME_METADATA = """
+    INSERT INTO timeframemetadata
+    (tokenaddress, pairaddress, timeframe, lastfetchedat, nextfetchat, createdat, lastupdatedat)
+    SELECT t.tokenaddress, t.pairaddress, t.timeframe, t.lastfetchedat, t.nextfetchat, NOW(), NOW()
+    FROM unnest(%s::text[], %s::text[], %s::text[], %s::bigint[], %s::bigint[])
+        AS t(tokenaddress, pairaddress, timeframe, lastfetchedat, nextfetchat)
+    ON CONFLICT (tokenaddress, pairaddress, timeframe)
+    DO UPDATE SET
+        lastfetchedat = EXCLUDED.lastfetchedat,
+        nextfetchat = EXCLUDED.nextfetchat,
+        lastupdatedat = NOW()
+"""
+
+# New token timeframes - createdat/lastupdatedat are left to the column defaults
+_SQL_INSERT_INITIAL_TIMEFRAME_METADATA = """
+    INSERT INTO timeframemetadata
+    (tokenaddress, pairaddress, timeframe, nextfetchat)
+    SELECT t.tokenaddress, t.pairaddress, t.timeframe, t.nextfetchat
+    FROM unnest(%s::text[], %s::text[], %s::text[], %s::bigint[])
+        AS t(tokenaddress, pairaddress, timeframe, nextfetchat)
+    ON CONFLICT (tokenaddress, pairaddress, timeframe)
+    DO UPDATE SET
+        nextfetchat = EXCLUDED.nextfetchat,
+        lastupdatedat = NOW()
+    RETURNING id, tokenaddress, pairaddress, timeframe, nextfetchat
+"""
+
+# Scheduler rows already exist, so the fetch status is advanced with a plain UPDATE first:
+# unlike the upsert it does not draw an id from the sequence for every row
+_SQL_UPDATE_TIMEFRAME_FETCH_STATUS = """
+    UPDATE timeframemetadata tm
+    SET lastfetchedat = v.lastfetchedat,
+        nextfetchat = v.nextfetchat,
+        lastupdatedat = NOW()
+    FROM unnest(%s::char(44)[], %s::char(44)[], %s::text[], %s::bigint[], %s::bigint[])
+        AS v(tokenaddress, pairaddress, timeframe, lastfetchedat, nextfetchat)
+    WHERE tm.tokenaddress = v.tokenaddress
+      AND tm.pairaddress = v.pairaddress
+      AND tm.timeframe = v.timeframe
+"""
+
+_SQL_UPSERT_CANDLES = f"""
+    INSERT INTO ohlcvdetails ({_OHLCV_INSERT_COLUMNS}, {_OHLCV_CONSTANT_COLUMNS})
+    VALUES %s
+    {_OHLCV_UPSERT_CLAUSE}
+"""
+
+# Metadata upsert and candle upsert as one statement - a data-modifying CTE always runs to completion
+_SQL_UPSERT_TIMEFRAME_METADATA_AND_CANDLES = (
+    "WITH upsertedmetadata AS (" + _SQL_UPSERT_TIMEFRAME_METADATA + ")" + _SQL_UPSERT_CANDLES
+)
+
+_SQL_UPSERT_CANDLES_FROM_STAGE = f"""
+    INSERT INTO ohlcvdetails ({_OHLCV_INSERT_COLUMNS}, {_OHLCV_CONSTANT_COLUMNS})
+    SELECT {_OHLCV_INSERT_COLUMNS}, {_OHLCV_CONSTANT_VALUES}
+    FROM _stage_ohlcv
+    {_OHLCV_UPSERT_CLAUSE};
+    DROP TABLE _stage_ohlcv
+"""
+
+_SQL_UPSERT_VWAP_SESSIONS = """
+    INSERT INTO vwapsessions
+    (tokenaddress, pairaddress, timeframe, sessionstartunix, sessionendunix,
+     cumulativepv, cumulativevolume, currentvwap, lastcandleunix, nextcandlefetch,
+     createdat, lastupdatedat)
+    VALUES %s
+    ON CONFLICT (tokenaddress, timeframe)
+    DO UPDATE SET
+        sessionstartunix = EXCLUDED.sessionstartunix,
+        sessionendunix = EXCLUDED.sessionendunix,
+        cumulativepv = EXCLUDED.cumulativepv,
+        cumulativevolume = EXCLUDED.cumulativevolume,
+        currentvwap = EXCLUDED.currentvwap,
+        lastcandleunix = EXCLUDED.lastcandleunix,
+        nextcandlefetch = EXCLUDED.nextcandlefetch,
+        lastupdatedat = NOW()
+"""
+_VWAP_SESSION_VALUES_TEMPLATE = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())"
+
+_SQL_UPSERT_EMA_STATES = """
+    INSERT INTO emastates
+    (tokenaddress, pairaddress, timeframe, emakey, emavalue,
+     lastupdatedunix, nextfetchtime, emaavailabletime, paircreatedtime, status,
+     createdat, lastupdatedat)
+    VALUES %s
+    ON CONFLICT (tokenaddress, timeframe, emakey)
+    DO UPDATE SET
+        emavalue = EXCLUDED.emavalue,
+        lastupdatedunix = EXCLUDED.lastupdatedunix,
+        nextfetchtime = EXCLUDED.nextfetchtime,
+        status = EXCLUDED.status,
+        lastupdatedat = NOW()
+"""
+
+_SQL_UPDATE_RSI_CANDLES = """
+    UPDATE ohlcvdetails o
+    SET rsivalue = COALESCE(v.rsivalue, o.rsivalue),
+        stochrsivalue = COALESCE(v.stochrsivalue, o.stochrsivalue),
+        stochrsik = COALESCE(v.stochrsik, o.stochrsik),
+        stochrsid = COALESCE(v.stochrsid, o.stochrsid),
+        lastupdatedat = NOW()
+    FROM {source}
+    WHERE o.tokenaddress = v.tokenaddress
+      AND o.timeframe = v.timeframe
+      AND o.unixtime = v.unixtime
+      -- Skip candles whose stored values would not change (columns are numeric(10,4))
+      AND (o.rsivalue IS DISTINCT FROM COALESCE(v.rsivalue::numeric(10,4), o.rsivalue)
+        OR o.stochrsivalue IS DISTINCT FROM COALESCE(v.stochrsivalue::numeric(10,4), o.stochrsivalue)
+        OR o.stochrsik IS DISTINCT FROM COALESCE(v.stochrsik::numeric(10,4), o.stochrsik)
+        OR o.stochrsid IS DISTINCT FROM COALESCE(v.stochrsid::numeric(10,4), o.stochrsid))
+"""
+
+_SQL_UPDATE_CANDLE_VALUE = """
+    UPDATE ohlcvdetails o
+    SET {column} = v.value,
+        lastupdatedat = NOW()
+    FROM {source}
+    WHERE o.tokenaddress = v.tokenaddress
+      AND o.timeframe = v.timeframe
+      AND o.unixtime = v.unixtime
+      AND o.{column} IS DISTINCT FROM v.value::{columnType}
+"""
+_CANDLE_VALUE_VALUES_SOURCE = "(VALUES %s) AS v(value, tokenaddress, timeframe, unixtime)"
+# tokenaddress is cast to the column type so VALUES rows compare as bpchar and can use the candle key index
+_CANDLE_VALUE_VALUES_TEMPLATE = "(%s::double precision, %s::char(44), %s, %s::bigint)"
+
+# VWAP session upsert and candle vwapvalue update as one statement
+_SQL_UPSERT_VWAP_SESSIONS_AND_CANDLES = (
+    "WITH upsertedsessions AS (" + _SQL_UPSERT_VWAP_SESSIONS + ")"
+    + _SQL_UPDATE_CANDLE_VALUE.format(column='vwapvalue', columnType=_CANDLE_VALUE_COLUMN_TYPES['vwapvalue'],
+                                      source=_CANDLE_VALUE_VALUES_SOURCE)
+)
+
+_SQL_UPSERT_RSI_STATE = """
+    INSERT INTO rsistates
+    (tokenaddress, pairaddress, timeframe, rsiinterval, rsiavailabletime,
+     rsivalue, avggain, avgloss, lastcloseprice, stochrsiinterval, stochrsivalue, rsivalues,
+     kinterval, kvalue, stochrsivalues, dinterval, dvalue, kvalues,
+     lastupdatedunix, nextfetchtime, paircreatedtime, status,
+     createdat, lastupdatedat)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
+    ON CONFLICT (tokenaddress, pairaddress, timeframe)
+    DO UPDATE SET
+        rsivalue = EXCLUDED.rsivalue,
+        avggain = EXCLUDED.avggain,
+        avgloss = EXCLUDED.avgloss,
+        lastcloseprice = EXCLUDED.lastcloseprice,
+        stochrsivalue = EXCLUDED.stochrsivalue,
+        rsivalues = EXCLUDED.rsivalues,
+        kvalue = EXCLUDED.kvalue,
+        stochrsivalues = EXCLUDED.stochrsivalues,
+        dvalue = EXCLUDED.dvalue,
+        kvalues = EXCLUDED.kvalues,
+        lastupdatedunix = EXCLUDED.lastupdatedunix,
+        nextfetchtime = EXCLUDED.nextfetchtime,
+        status = EXCLUDED.status,
+        lastupdatedat = NOW()
+"""
+
+_SQL_UPSERT_AVWAP_STATES = """
+    INSERT INTO avwapstates
+    (tokenaddress, pairaddress, timeframe, avwap, cumulativepv, cumulativevolume,
+     lastupdatedunix, nextfetchtime, createdat, lastupdatedat)
+    VALUES %s
+    ON CONFLICT (tokenaddress, timeframe)
+    DO UPDATE SET
+        avwap = EXCLUDED.avwap,
+        cumulativepv = EXCLUDED.cumulativepv,
+        cumulativevolume = EXCLUDED.cumulativevolume,
+        lastupdatedunix = EXCLUDED.lastupdatedunix,
+        nextfetchtime = EXCLUDED.nextfetchtime,
+        lastupdatedat = NOW()
+"""
+
+_SQL_UPDATE_AVWAP_STATES = """
+    UPDATE avwapstates
+    SET avwap = v.avwap,
+        cumulativepv = v.cumulativepv,
+        cumulativevolume = v.cumulativevolume,
+        lastupdatedunix = v.lastupdatedunix,
+        nextfetchtime = v.nextfetchtime,
+        lastupdatedat = NOW()
+    FROM (VALUES %s) AS v(tokenaddress, pairaddress, timeframe, avwap, cumulativepv,
+                          cumulativevolume, lastupdatedunix, nextfetchtime)
+    WHERE avwapstates.tokenaddress = v.tokenaddress
+      AND avwapstates.timeframe = v.timeframe
+"""
+
+_SQL_UPSERT_ALERT = """
+    INSERT INTO alerts
+    (tokenid, tokenaddress, pairaddress, timeframe, vwap, ema12, ema21, ema34, avwap,
+     rsivalue, stochrsivalue, stochrsik, stochrsid, avwappriceposition,
+     lastupdatedunix, trend, status, trend12, status12, touchcount, latesttouchunix,
+     touchcount12, latesttouchunix12, createdat, lastupdatedat)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
+    ON CONFLICT (tokenaddress, timeframe)
+    DO UPDATE SET
+        vwap = EXCLUDED.vwap,
+        ema12 = EXCLUDED.ema12,
+        ema21 = EXCLUDED.ema21,
+        ema34 = EXCLUDED.ema34,
+        avwap = EXCLUDED.avwap,
+        rsivalue = EXCLUDED.rsivalue,
+        stochrsivalue = EXCLUDED.stochrsivalue,
+        stochrsik = EXCLUDED.stochrsik,
+        stochrsid = EXCLUDED.stochrsid,
+        avwappriceposition = EXCLUDED.avwappriceposition,
+        lastupdatedunix = EXCLUDED.lastupdatedunix,
+        trend = EXCLUDED.trend,
+        status = EXCLUDED.status,
+        trend12 = EXCLUDED.trend12,
+        status12 = EXCLUDED.status12,
+        touchcount = EXCLUDED.touchcount,
+        latesttouchunix = EXCLUDED.latesttouchunix,
+        touchcount12 = EXCLUDED.touchcount12,
+        latesttouchunix12 = EXCLUDED.latesttouchunix12,
+        lastupdatedat = NOW()
+"""
 
 
 class TradingHandler(BaseDBHandler):
+    # Schema setup state shared by every instance in the process
+    _tablesCreated = False
+    _tablesLock = threading.Lock()
+    # (expiresAt, activeTokens) - getActiveTokens result, shared so the API and action handlers agree;
+    # the generation is bumped on every invalidation so a read that raced a write is not cached
+    _activeTokensCache = None
+    _activeTokensGeneration = 0
+    _activeTokensLock = threading.Lock()
+
     def __init__(self, conn_manager=None):
         if conn_manager is None:
             conn_manager = DatabaseConnectionManager()
         super().__init__(conn_manager)
-        self._createTables()
+        self.schema = TABLE_DOCUMENTATION
+        self._ensureTables()
+
+    def _ensureTables(self):
+        """Run the schema setup once per process - every handler instance shares the same tables"""
+        if TradingHandler._tablesCreated:
+            return
+        with TradingHandler._tablesLock:
+            if not TradingHandler._tablesCreated:
+                TradingHandler._tablesCreated = self._createTables()
+
+    @staticmethod
+    def _invalidateActiveTokensCache():
+        """Drop the cached active token listing once tokens or their timeframes change"""
+        with TradingHandler._activeTokensLock:
+            TradingHandler._activeTokensCache = None
+            TradingHandler._activeTokensGeneration += 1
 
-    def _createTables(self):
+    @contextmanager
+    def _activeTokensTransaction(self):
+        """Transaction for writes that change the active token listing - the cache is dropped once it commits"""
+        with self.conn_manager.transaction() as cursor:
+            yield cursor
+        self._invalidateActiveTokensCache()
+
+    def _createTables(self) -> bool:
         """Creates all necessary tables for the crypto trading system"""
         try:
             with self.conn_manager.transaction() as cursor:
                 logger.info("Creating crypto trading system tables...")
                 self._createBasicTables(cursor)
+            return True
                     
         except Exception as e:
-            logger.info(f"Error creating trading tables: {e}")      
+            logger.info(f"Error creating trading tables: {e}")
+            return False
 
     def _createBasicTables(self, cursor):
         """Create basic tables if schema file is not available"""
@@ -98,42 +1129,15 @@ class TradingHandler(BaseDBHandler):
             )
         """))
         
-        # 3. OHLCV Details
-        cursor.execute(text("""
-            CREATE TABLE IF NOT EXISTS ohlcvdetails (
-                id BIGSERIAL PRIMARY KEY,
-                timeframeid BIGINT NOT NULL REFERENCES timeframemetadata(id),
-                tokenaddress CHAR(44) NOT NULL,
-                pairaddress CHAR(44) NOT NULL,
-                timeframe VARCHAR(10) NOT NULL,
-                unixtime BIGINT NOT NULL,
-                timebucket BIGINT NOT NULL,
-                openprice DECIMAL(20,8) NOT NULL,
-                highprice DECIMAL(20,8) NOT NULL,
-                lowprice DECIMAL(20,8) NOT NULL,
-                closeprice DECIMAL(20,8) NOT NULL,
-                volume DECIMAL(20,4) NOT NULL,
-                trades INTEGER DEFAULT 0,
-                vwapvalue DECIMAL(20,8),
-                avwapvalue DECIMAL(20,8),
-                ema12value DECIMAL(20,8),
-                ema21value DECIMAL(20,8),
-                ema34value DECIMAL(20,8),
-                rsivalue DECIMAL(10,4),
-                stochrsivalue DECIMAL(10,4),
-                stochrsik DECIMAL(10,4),
-                stochrsid DECIMAL(10,4),
-                trend VARCHAR(20),
-                status VARCHAR(50),
-                trend12 VARCHAR(20),
-                status12 VARCHAR(50),
-                iscomplete BOOLEAN DEFAULT TRUE,
-                datasource VARCHAR(20) DEFAULT 'api',
-                createdat TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-                lastupdatedat TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-                UNIQUE(tokenaddress, timeframe, unixtime)
-            )
-        """))
+        # 3. OHLCV Details - list partitioned by timeframe
+        cursor.execute(_SQL_CREATE_OHLCV_DETAILS)
+        if self._isOhlcvDetailsPartitioned(cursor):
+            self._createOhlcvDetailsPartitions(cursor)
+        else:
+            # Deployments created before partitioning keep their plain table until the one-off
+            # migration moves it over - copying the hottest table does not belong in construction
+            logger.warning("ohlcvdetails is not partitioned yet - run python -m database.trading.TradingSchemaMigration")
+            cursor.execute("ALTER TABLE ohlcvdetails SET (fillfactor = 70)")
         
         # 4. EMA States (replaces indicatorstates and indicatorconfigs)
         cursor.execute(text("""
@@ -162,9 +1166,9 @@ class TradingHandler(BaseDBHandler):
                 timeframe VARCHAR(10),
                 sessionstartunix BIGINT,
                 sessionendunix BIGINT,
-                cumulativepv DECIMAL(30,8),
-                cumulativevolume DECIMAL(30,8),
-                currentvwap DECIMAL(20,8),
+                cumulativepv DOUBLE PRECISION,
+                cumulativevolume DOUBLE PRECISION,
+                currentvwap DOUBLE PRECISION,
                 lastcandleunix BIGINT,
                 nextcandlefetch BIGINT,
                 createdat TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
@@ -238,13 +1242,13 @@ class TradingHandler(BaseDBHandler):
                 lastcloseprice DECIMAL(20,8),
                 stochrsiinterval INTEGER NOT NULL DEFAULT 14,
                 stochrsivalue DECIMAL(10,4),
-                rsivalues TEXT,
+                rsivalues DOUBLE PRECISION[],
                 kinterval INTEGER NOT NULL DEFAULT 3,
                 kvalue DECIMAL(10,4),
-                stochrsivalues TEXT,
+                stochrsivalues DOUBLE PRECISION[],
                 dinterval INTEGER NOT NULL DEFAULT 3,
                 dvalue DECIMAL(10,4),
-                kvalues TEXT,
+                kvalues DOUBLE PRECISION[],
                 lastupdatedunix BIGINT,
                 nextfetchtime BIGINT,
                 paircreatedtime BIGINT,
@@ -254,7 +1258,177 @@ class TradingHandler(BaseDBHandler):
                 UNIQUE(tokenaddress, pairaddress, timeframe)
             )
         """))
-        
+
+        self._migrateRSIWindowColumnsToArray(cursor)
+        if self._hasOutdatedTimeBucket(cursor):
+            # Candle inserts no longer write timebucket; the one-off migration makes it generated
+            logger.warning("ohlcvdetails.timebucket is not generated from the timeframe map yet - run python -m database.trading.TradingSchemaMigration")
+
+        # 9. Indexes for scheduler read paths
+        cursor.execute(_SQL_CREATE_OHLCV_TFID_TIME_INDEX)
+        cursor.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_timeframemetadata_token
+            ON timeframemetadata (tokenaddress, timeframe)
+            INCLUDE (id, lastfetchedat)
+        """))
+        cursor.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_vwapsessions_token_tf
+            ON vwapsessions (tokenaddress, timeframe)
+            INCLUDE (pairaddress, cumulativepv, cumulativevolume, currentvwap, lastcandleunix, nextcandlefetch)
+        """))
+        # Partial covering indexes so the ready-for-fetch scan is index-only and
+        # already ordered by nextfetchat (created in-transaction, hence not CONCURRENTLY)
+        cursor.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_tmf_ready
+            ON timeframemetadata (nextfetchat)
+            INCLUDE (id, tokenaddress, pairaddress, timeframe, lastfetchedat, createdat)
+            WHERE isactive = TRUE
+        """))
+        cursor.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_tt_status_cover
+            ON trackedtokens (tokenaddress)
+            INCLUDE (pairaddress, symbol, name, paircreatedtime, trackedtokenid, createdat)
+            WHERE status = 1
+        """))
+
+        cursor.execute(_SQL_CREATE_EMA_SCHEDULER_FUNCTION)
+        # Targets are joined live now; the function no longer reads the old view
+        cursor.execute(text("DROP MATERIALIZED VIEW IF EXISTS mv_active_ema_targets"))
+
+    def _isOhlcvDetailsPartitioned(self, cursor) -> bool:
+        cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'ohlcvdetails'::regclass")
+        return cursor.fetchone() is not None
+
+    def _createOhlcvDetailsPartitions(self, cursor):
+        """Create the per-timeframe and default partitions of the partitioned ohlcvdetails"""
+        for timeframe in TimeframeConstants.VALID_NEW_TOKEN_TIMEFRAMES:
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS ohlcvdetails_{timeframe}
+                PARTITION OF ohlcvdetails FOR VALUES IN ('{timeframe}')
+            """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ohlcvdetails_default PARTITION OF ohlcvdetails DEFAULT
+        """)
+        ohlcvHeaps = [f"ohlcvdetails_{timeframe}" for timeframe in TimeframeConstants.VALID_NEW_TOKEN_TIMEFRAMES]
+        ohlcvHeaps.append("ohlcvdetails_default")
+        # Every candle is rewritten by the indicator UPDATEs after insert; none of them touch an
+        # indexed column, so free page space lets Postgres keep those as HOT updates
+        # (applies to newly written pages; storage parameters live on the partitions, not the parent)
+        for ohlcvHeap in ohlcvHeaps:
+            cursor.execute(f"ALTER TABLE {ohlcvHeap} SET (fillfactor = 70)")
+
+    def runSchemaMigrations(self) -> bool:
+        """
+        Apply the one-off table migrations (entry point: database/trading/TradingSchemaMigration.py)
+
+        Each migration runs in its own transaction and is a no-op once applied, so a failure
+        keeps the earlier ones and can simply be retried.
+        """
+        for migration in (self._migrateOhlcvDetailsToPartitioned,
+                          self._migrateRunningValueColumnsToDouble,
+                          self._migrateTimeBucketToGenerated):
+            try:
+                with self.conn_manager.transaction() as cursor:
+                    migration(cursor)
+            except Exception as e:
+                logger.info(f"Error running schema migration {migration.__name__}: {e}")
+                return False
+        return True
+
+    def _migrateOhlcvDetailsToPartitioned(self, cursor):
+        """
+        Move a pre-partitioning ohlcvdetails table into the partitioned layout.
+        Ids are kept and the new id sequence is advanced past them; the legacy table (with its indexes) is dropped.
+        """
+        if self._isOhlcvDetailsPartitioned(cursor):
+            return
+        cursor.execute("ALTER TABLE ohlcvdetails RENAME TO ohlcvdetails_legacy")
+        cursor.execute(_SQL_CREATE_OHLCV_DETAILS)
+        self._createOhlcvDetailsPartitions(cursor)
+        cursor.execute(text("""
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_name = 'ohlcvdetails_legacy'
+              AND column_name IN (
+                  SELECT column_name FROM information_schema.columns
+                  WHERE table_name = 'ohlcvdetails' AND is_generated = 'NEVER'
+              )
+            ORDER BY ordinal_position
+        """))
+        columns = ", ".join(row['column_name'] for row in cursor.fetchall())
+        logger.info("Migrating ohlcvdetails to the timeframe-partitioned layout")
+        cursor.execute(f"INSERT INTO ohlcvdetails ({columns}) SELECT {columns} FROM ohlcvdetails_legacy")
+        logger.info(f"Copied {cursor.rowcount} candles into partitioned ohlcvdetails")
+        cursor.execute(text("""
+            SELECT setval(pg_get_serial_sequence('ohlcvdetails', 'id'), COALESCE(MAX(id), 0) + 1, false)
+            FROM ohlcvdetails
+        """))
+        cursor.execute("DROP TABLE ohlcvdetails_legacy")
+        # The legacy table's indexes went with it
+        cursor.execute(_SQL_CREATE_OHLCV_TFID_TIME_INDEX)
+
+    def _migrateRunningValueColumnsToDouble(self, cursor):
+        """
+        Convert VWAP/EMA running value columns of existing tables from DECIMAL to DOUBLE PRECISION.
+        Only columns still typed numeric are altered, so this is a no-op once migrated.
+        """
+        cursor.execute(text("""
+            SELECT table_name, column_name
+            FROM information_schema.columns
+            WHERE data_type = 'numeric'
+              AND (
+                    (table_name = 'vwapsessions' AND column_name IN ('cumulativepv', 'cumulativevolume', 'currentvwap'))
+                 OR (table_name = 'ohlcvdetails' AND column_name IN ('vwapvalue', 'ema12value', 'ema21value', 'ema34value'))
+              )
+        """))
+        for row in cursor.fetchall():
+            logger.info(f"Migrating {row['table_name']}.{row['column_name']} to DOUBLE PRECISION")
+            cursor.execute(
+                f"ALTER TABLE {row['table_name']} ALTER COLUMN {row['column_name']} TYPE DOUBLE PRECISION"
+            )
+
+    def _migrateRSIWindowColumnsToArray(self, cursor):
+        """
+        Convert the rsistates rolling windows of existing tables from JSON text to DOUBLE PRECISION[].
+        The stored '[a, b]' JSON becomes the '{a, b}' array literal; already-migrated columns are skipped.
+        """
+        cursor.execute(text("""
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE data_type = 'text'
+              AND table_name = 'rsistates'
+              AND column_name IN ('rsivalues', 'stochrsivalues', 'kvalues')
+        """))
+        for row in cursor.fetchall():
+            logger.info(f"Migrating rsistates.{row['column_name']} to DOUBLE PRECISION[]")
+            cursor.execute(
+                f"ALTER TABLE rsistates ALTER COLUMN {row['column_name']} TYPE DOUBLE PRECISION[] "
+                f"USING NULLIF(translate({row['column_name']}, '[]', '{{}}'), '')::double precision[]"
+            )
+
+    def _hasOutdatedTimeBucket(self, cursor) -> bool:
+        """True while timebucket is client-written or still generated with the old 1-second fallback"""
+        cursor.execute(text("""
+            SELECT 1
+            FROM information_schema.columns
+            WHERE table_name = 'ohlcvdetails'
+              AND column_name = 'timebucket'
+              AND (is_generated = 'NEVER' OR generation_expression ~ 'ELSE 1\\s+END')
+        """))
+        return cursor.fetchone() is not None
+
+    def _migrateTimeBucketToGenerated(self, cursor):
+        """
+        Replace the client-written ohlcvdetails.timebucket of existing tables with the generated column.
+        The column is dropped and re-added (rewriting the table once); up-to-date columns are skipped.
+        Fails without changes if any stored candle has a timeframe missing from _TIMEFRAME_SECONDS.
+        """
+        if self._hasOutdatedTimeBucket(cursor):
+            logger.info("Migrating ohlcvdetails.timebucket to a generated column")
+            cursor.execute(
+                f"ALTER TABLE ohlcvdetails DROP COLUMN timebucket, "
+                f"ADD COLUMN timebucket BIGINT NOT NULL GENERATED ALWAYS AS ({_TIMEBUCKET_EXPRESSION}) STORED"
+            )
 
     def getTableDocumentation(self, tableName: str) -> dict:
         """Get documentation for a specific table"""
@@ -291,32 +1465,17 @@ class TradingHandler(BaseDBHandler):
 
             logger.info(f"TRADING API :: Adding token {symbol} - tracked token - started")
             
-            with self.conn_manager.transaction() as cursor:
+            with self._activeTokensTransaction() as cursor:
                 # Use UPSERT (INSERT ... ON CONFLICT ... DO UPDATE)
                 cursor.execute(
-                    text("""
-                        INSERT INTO trackedtokens 
-                        (tokenaddress, symbol, name, pairaddress, paircreatedtime, additionsource, addedby, metadata, createdat, lastupdatedat, status, enabledat)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 1, %s)
-                        ON CONFLICT (tokenaddress) 
-                        DO UPDATE SET
-                            symbol = EXCLUDED.symbol,
-                            name = EXCLUDED.name,
-                            pairaddress = EXCLUDED.pairaddress,
-                            paircreatedtime = EXCLUDED.paircreatedtime,
-                            additionsource = EXCLUDED.additionsource,
-                            addedby = EXCLUDED.addedby,
-                            metadata = EXCLUDED.metadata,
-                            lastupdatedat = EXCLUDED.lastupdatedat,
-                            status = 1,
-                            enabledat = EXCLUDED.enabledat,
-                            disabledat = NULL
-                        RETURNING trackedtokenid
-                    """),
+                    _SQL_ADD_TOKEN,
                     (tokenAddress, symbol, name, pairAddress, pairCreatedTime, int(additionSource), addedBy, 
-                     json.dumps(metadata) if metadata else None, now, now, now)
+                     Json(metadata) if metadata else None, now, now, now)
                 )
                 result = cursor.fetchone()
+                if result is None:
+                    logger.warning(f"TRADING API :: Adding token {symbol} - tracked token - already active")
+                    return None
                 tokenId = result[TradingHandlerConstants.TrackedTokens.TRACKED_TOKEN_ID]
                 logger.info(f"TRADING API :: Adding token {symbol} - tracked token - completed")
                 return tokenId
@@ -340,15 +1499,10 @@ class TradingHandler(BaseDBHandler):
         try:
             now = datetime.now(timezone.utc)
             
-            with self.conn_manager.transaction() as cursor:
+            with self._activeTokensTransaction() as cursor:
                 # Update token status and return token info in one query
                 cursor.execute(
-                    text("""
-                        UPDATE trackedtokens 
-                        SET status = 2, disabledat = %s, disabledby = %s, lastupdatedat = %s
-                        WHERE tokenaddress = %s AND status = 1
-                        RETURNING trackedtokenid, symbol, name, tokenaddress
-                    """),
+                    _SQL_DISABLE_TOKEN,
                     (now, disabledBy, now, tokenAddress)
                 )
                 result = cursor.fetchone()
@@ -398,15 +1552,10 @@ class TradingHandler(BaseDBHandler):
         try:
             now = datetime.now(timezone.utc)
             
-            with self.conn_manager.transaction() as cursor:
+            with self._activeTokensTransaction() as cursor:
                 # Update token status and return token info in one query
                 cursor.execute(
-                    text("""
-                        UPDATE trackedtokens 
-                        SET status = 1, enabledat = %s, disabledat = NULL, disabledby = NULL, lastupdatedat = %s
-                        WHERE tokenaddress = %s AND status = 2
-                        RETURNING trackedtokenid, symbol, name, tokenaddress
-                    """),
+                    _SQL_ENABLE_TOKEN,
                     (now, now, tokenAddress)
                 )
                 result = cursor.fetchone()
@@ -453,19 +1602,12 @@ class TradingHandler(BaseDBHandler):
             Dict containing success status, token info, and records deleted count
         """
         try:
-            with self.conn_manager.transaction() as cursor:
-                # Step 1: Get token info before deletion
-                cursor.execute(
-                    text("""
-                        SELECT trackedtokenid, symbol, name, tokenaddress
-                        FROM trackedtokens 
-                        WHERE tokenaddress = %s
-                    """),
-                    (tokenAddress,)
-                )
-                result = cursor.fetchone()
+            with self._activeTokensTransaction() as cursor:
+                # Look up the token and delete all related data in a single query using CTEs
+                cursor.execute(_SQL_DELETE_TOKEN_CASCADE, (tokenAddress,))
+                deletionResult = cursor.fetchone()
                 
-                if not result:
+                if not deletionResult:
                     logger.warning(f"Token {tokenAddress} not found")
                     return {
                         'success': False,
@@ -475,54 +1617,12 @@ class TradingHandler(BaseDBHandler):
                     }
                 
                 tokenInfo = {
-                    'trackedtokenid': result['trackedtokenid'],
-                    'symbol': result['symbol'],
-                    'name': result['name'],
-                    'tokenaddress': result['tokenaddress']
+                    'trackedtokenid': deletionResult['trackedtokenid'],
+                    'symbol': deletionResult['symbol'],
+                    'name': deletionResult['name'],
+                    'tokenaddress': deletionResult['tokenaddress']
                 }
                 
-                # Step 2: Delete all related data in a single optimized query using CTEs
-                cursor.execute(
-                    text("""
-                        WITH deleted_alerts AS (
-                            DELETE FROM alerts WHERE tokenaddress = %s RETURNING 1
-                        ),
-                        deleted_rsistates AS (
-                            DELETE FROM rsistates WHERE tokenaddress = %s RETURNING 1
-                        ),
-                        deleted_avwapstates AS (
-                            DELETE FROM avwapstates WHERE tokenaddress = %s RETURNING 1
-                        ),
-                        deleted_vwapsessions AS (
-                            DELETE FROM vwapsessions WHERE tokenaddress = %s RETURNING 1
-                        ),
-                        deleted_emastates AS (
-                            DELETE FROM emastates WHERE tokenaddress = %s RETURNING 1
-                        ),
-                        deleted_ohlcvdetails AS (
-                            DELETE FROM ohlcvdetails WHERE tokenaddress = %s RETURNING 1
-                        ),
-                        deleted_timeframemetadata AS (
-                            DELETE FROM timeframemetadata WHERE tokenaddress = %s RETURNING 1
-                        ),
-                        deleted_trackedtokens AS (
-                            DELETE FROM trackedtokens WHERE tokenaddress = %s RETURNING 1
-                        )
-                        SELECT 
-                            (SELECT COUNT(*) FROM deleted_alerts) as alerts_deleted,
-                            (SELECT COUNT(*) FROM deleted_rsistates) as rsistates_deleted,
-                            (SELECT COUNT(*) FROM deleted_avwapstates) as avwapstates_deleted,
-                            (SELECT COUNT(*) FROM deleted_vwapsessions) as vwapsessions_deleted,
-                            (SELECT COUNT(*) FROM deleted_emastates) as emastates_deleted,
-                            (SELECT COUNT(*) FROM deleted_ohlcvdetails) as ohlcvdetails_deleted,
-                            (SELECT COUNT(*) FROM deleted_timeframemetadata) as timeframemetadata_deleted,
-                            (SELECT COUNT(*) FROM deleted_trackedtokens) as trackedtokens_deleted
-                    """),
-                    (tokenAddress, tokenAddress, tokenAddress, tokenAddress, 
-                     tokenAddress, tokenAddress, tokenAddress, tokenAddress)
-                )
-                
-                deletionResult = cursor.fetchone()
                 recordsDeleted = {
                     'alerts': deletionResult['alerts_deleted'],
                     'rsiStates': deletionResult['rsistates_deleted'],
@@ -564,21 +1664,21 @@ class TradingHandler(BaseDBHandler):
 
     def getActiveTokens(self) -> List[Dict]:
         """Get all active tracked tokens with their metadata"""
+        cache = TradingHandler._activeTokensCache
+        if cache and cache[0] > time.monotonic():
+            return cache[1]
+        generation = TradingHandler._activeTokensGeneration
         try:
             with self.conn_manager.transaction() as cursor:
                 cursor.execute(
-                    text("""
-                        SELECT t.*, 
-                               COUNT(tm.id) as active_timeframes
-                        FROM trackedtokens t
-                        LEFT JOIN timeframemetadata tm ON t.tokenaddress = tm.tokenaddress
-                        WHERE t.status = 1
-                        GROUP BY t.trackedtokenid
-                        ORDER BY t.createdat DESC
-                    """)
+                    _SQL_GET_ACTIVE_TOKENS
                 )
-                results = cursor.fetchall()
-                return [dict(row) for row in results]
+                # RealDictRow is already a dict - no need to copy every row
+                activeTokens = cursor.fetchall()
+            with TradingHandler._activeTokensLock:
+                if generation == TradingHandler._activeTokensGeneration:
+                    TradingHandler._activeTokensCache = (time.monotonic() + _ACTIVE_TOKENS_CACHE_TTL_SECONDS, activeTokens)
+            return activeTokens
         except Exception as e:
             logger.info(f"Error getting active tokens: {e}")
             return []
@@ -588,18 +1688,10 @@ class TradingHandler(BaseDBHandler):
         try:
             with self.conn_manager.transaction() as cursor:
                 cursor.execute(
-                    text("""
-                        SELECT t.*, 
-                               COUNT(tm.id) as active_timeframes
-                        FROM trackedtokens t
-                        LEFT JOIN timeframemetadata tm ON t.tokenaddress = tm.tokenaddress
-                        WHERE t.status = 2
-                        GROUP BY t.trackedtokenid
-                        ORDER BY t.disabledat DESC
-                    """)
+                    _SQL_GET_DISABLED_TOKENS
                 )
-                results = cursor.fetchall()
-                return [dict(row) for row in results]
+                # RealDictRow is already a dict - no need to copy every row
+                return cursor.fetchall()
         except Exception as e:
             logger.info(f"Error getting disabled tokens: {e}")
             return []
@@ -615,14 +1707,9 @@ class TradingHandler(BaseDBHandler):
             Token ID if found and enabled, None if not found
         """
         try:
-            with self.conn_manager.transaction() as cursor:
+            with self._activeTokensTransaction() as cursor:
                 cursor.execute(
-                    text("""
-                        UPDATE trackedtokens 
-                        SET status = 1, enabledat = NOW(), disabledat = NULL, disabledby = NULL, lastupdatedat = NOW()
-                        WHERE tokenaddress = %s
-                        RETURNING trackedtokenid
-                    """),
+                    _SQL_ENABLE_TOKEN_IF_EXISTS,
                     (tokenAddress,)
                 )
                 result = cursor.fetchone()
@@ -633,140 +1720,122 @@ class TradingHandler(BaseDBHandler):
             return None
 
     
-    def _calculateTimeBucket(self, unixtime: int, timeframe: str) -> int:
-        """Calculate timebucket based on timeframe - delegates to CommonUtil"""
-        return CommonUtil.calculateInitialStartTime(unixtime, timeframe)
+    def _candlePersistRows(self, timeframeRecord, candles: List['OHLCVDetails']) -> List[Tuple]:
+        """
+        Build batchInsertCandles tuples for one timeframe's candles
+
+        timebucket is not part of the tuple - ohlcvdetails generates it from unixtime and timeframe.
+        """
+        timeframeId = timeframeRecord.timeframeId
+        tokenAddress = timeframeRecord.tokenAddress
+        pairAddress = timeframeRecord.pairAddress
+        timeframe = timeframeRecord.timeframe
+        return [(
+            timeframeId,
+            tokenAddress,
+            pairAddress,
+            timeframe,
+            candle.unixTime,
+            candle.openPrice,
+            candle.highPrice,
+            candle.lowPrice,
+            candle.closePrice,
+            candle.volume,
+            candle.trades,
+            candle.vwapValue,
+            candle.avwapValue,
+            candle.ema12Value,
+            candle.ema21Value,
+            candle.ema34Value,
+            candle.rsiValue,
+            candle.stochRSIValue,
+            candle.stochRSIK,
+            candle.stochRSID,
+            candle.trend,
+            candle.status,
+            candle.trend12,
+            candle.status12,
+            candle.dataSource
+        ) for candle in candles]
 
     
     def getAllVWAPDataForScheduler(self) -> List['TrackedToken']:
+        """
+        Get all active token timeframes with their VWAP session and unprocessed candles
 
+        Returns one row per (token, timeframe) session; the unprocessed candles come back
+        as parallel arrays from a LATERAL subquery instead of one row per candle.
+        """
         logger.info(f"TRADING SCHEDULER :: getting all VWAP data for scheduler started")
         try:
-            with self.conn_manager.transaction() as cursor:
-                # Get all active tokens with their timeframes and VWAP session data
-                cursor.execute(text("""
-                    SELECT 
-                        tt.tokenaddress,
-                        tt.pairaddress,
-                        tm.id as timeframeid,
-                        tt.symbol,
-                        tt.name,
-                        tm.timeframe,
-                        tm.lastfetchedat,
-                        vs.sessionstartunix,
-                        vs.sessionendunix,
-                        vs.cumulativepv,
-                        vs.cumulativevolume,
-                        vs.currentvwap,
-                        vs.lastcandleunix,
-                        vs.nextcandlefetch,
-                        ohlcv.unixtime,
-                        ohlcv.openprice,
-                        ohlcv.highprice,
-                        ohlcv.lowprice,
-                        ohlcv.closeprice,
-                        ohlcv.volume
-                    FROM trackedtokens tt
-                    INNER JOIN timeframemetadata tm ON tt.tokenaddress = tm.tokenaddress
-                    LEFT JOIN vwapsessions vs ON tt.tokenaddress = vs.tokenaddress 
-                        AND tt.pairaddress = vs.pairaddress 
-                        AND tm.timeframe = vs.timeframe
-                    LEFT JOIN ohlcvdetails ohlcv ON tt.tokenaddress = ohlcv.tokenaddress 
-                        AND tm.id = ohlcv.timeframeid 
-                        AND ohlcv.unixtime > COALESCE(vs.lastcandleunix, 0)
-                    WHERE tt.status = 1
-                    ORDER BY tt.tokenaddress, tm.timeframe, ohlcv.unixtime
-                """))
-                
-                records = cursor.fetchall()
-                
-                # Track seen candle timestamps per timeframe to prevent duplicates (space and time efficient)
-                seenCandles = {}  # {tokenAddress: {timeframe: set(unixTimes)}}
-                trackedTokensMap = {}
-                
-                for record in records:
-                    tokenAddress = record[TradingHandlerConstants.TrackedTokens.TOKEN_ADDRESS]
-                    pairAddress = record[TradingHandlerConstants.TrackedTokens.PAIR_ADDRESS]
-                    timeframe = record[TradingHandlerConstants.TimeframeMetadata.TIMEFRAME]
-                    timeframeId = record['timeframeid']
-                    
-                    # Create or get existing TrackedToken
-                    if tokenAddress not in trackedTokensMap:
-                        trackedTokensMap[tokenAddress] = TrackedToken(
-                            trackedTokenId=record.get(TradingHandlerConstants.TrackedTokens.TRACKED_TOKEN_ID, 0),
+            trackedTokens = []
+            trackedToken = None
+            timeframeRecord = None
+
+            # Stream rows from a server-side cursor - each row carries its candle arrays, so the
+            # whole result is never buffered at once; rows are only read by column name, so
+            # tuples are cheaper than dicts
+            with self.conn_manager.server_cursor('vwap_sched_cur', itersize=500,
+                                                 cursor_factory=NamedTupleCursor) as cursor:
+                cursor.execute(_SQL_GET_ALL_VWAP_DATA)
+
+                for record in cursor:
+                    tokenAddress = record.tokenaddress
+                    pairAddress = record.pairaddress
+                    timeframe = record.timeframe
+
+                    # Rows arrive ORDER BY tokenaddress, timeframe, so a token's rows and each of its
+                    # timeframes are contiguous - compare with the current record instead of a map lookup
+                    if trackedToken is None or trackedToken.tokenAddress != tokenAddress:
+                        trackedToken = TrackedToken(
+                            trackedTokenId=record.trackedtokenid,
                             tokenAddress=tokenAddress,
-                            symbol=record.get(TradingHandlerConstants.TrackedTokens.SYMBOL, ''),
-                            name=record.get(TradingHandlerConstants.TrackedTokens.NAME, ''),
+                            symbol=record.symbol,
+                            name=record.name,
                             pairAddress=pairAddress,
-                            pairCreatedTime=record.get(TradingHandlerConstants.TrackedTokens.PAIR_CREATED_TIME, 0),
+                            pairCreatedTime=record.paircreatedtime,
                             addedBy='scheduler'
                         )
-                    
-                    # Get or create TimeframeRecord
-                    timeframeRecord = trackedTokensMap[tokenAddress].getTimeframeRecord(timeframe)
-                    if not timeframeRecord:
+                        trackedTokens.append(trackedToken)
+                        timeframeRecord = None
+
+                    if timeframeRecord is None or timeframeRecord.timeframe != timeframe:
                         timeframeRecord = TimeframeRecord(
-                            timeframeId=timeframeId,
+                            timeframeId=record.timeframeid,
                             tokenAddress=tokenAddress,
                             pairAddress=pairAddress,
                             timeframe=timeframe,
-                            lastFetchedAt=record[TradingHandlerConstants.TimeframeMetadata.LAST_FETCHED_AT],
+                            lastFetchedAt=record.lastfetchedat,
                             isActive=True
                         )
-                        trackedTokensMap[tokenAddress].addTimeframeRecord(timeframeRecord)
-                    
-                    # Create VWAPSession POJO
-                    if not timeframeRecord.vwapSession:
+                        trackedToken.addTimeframeRecord(timeframeRecord)
+
                         timeframeRecord.vwapSession = VWAPSession(
                             tokenAddress=tokenAddress,
                             pairAddress=pairAddress,
                             timeframe=timeframe,
-                            sessionStartUnix=record[TradingHandlerConstants.VWAPSessions.SESSION_START_UNIX],
-                            sessionEndUnix=record[TradingHandlerConstants.VWAPSessions.SESSION_END_UNIX],
-                            cumulativePV=record[TradingHandlerConstants.VWAPSessions.CUMULATIVE_PV],
-                            cumulativeVolume=record[TradingHandlerConstants.VWAPSessions.CUMULATIVE_VOLUME],
-                            currentVWAP=record[TradingHandlerConstants.VWAPSessions.CURRENT_VWAP],
-                            lastCandleUnix=record[TradingHandlerConstants.VWAPSessions.LAST_CANDLE_UNIX] or 0,
-                            nextCandleFetch=record[TradingHandlerConstants.VWAPSessions.NEXT_CANDLE_FETCH]
+                            sessionStartUnix=record.sessionstartunix,
+                            sessionEndUnix=record.sessionendunix,
+                            cumulativePV=record.cumulativepv,
+                            cumulativeVolume=record.cumulativevolume,
+                            currentVWAP=record.currentvwap,
+                            lastCandleUnix=record.lastcandleunix or 0,
+                            nextCandleFetch=record.nextcandlefetch
                         )
-                    
-                    # Add candle data if available
-                    if record[TradingHandlerConstants.OHLCVDetails.UNIX_TIME] is not None:
-                        candleUnixTime = record[TradingHandlerConstants.OHLCVDetails.UNIX_TIME]
-                        
-                        # Initialize seenCandles structure if needed
-                        if tokenAddress not in seenCandles:
-                            seenCandles[tokenAddress] = {}
-                        if timeframe not in seenCandles[tokenAddress]:
-                            seenCandles[tokenAddress][timeframe] = set()
-                        
-                        # O(1) check if candle already exists using set
-                        if candleUnixTime not in seenCandles[tokenAddress][timeframe]:
-                            # Mark as seen
-                            seenCandles[tokenAddress][timeframe].add(candleUnixTime)
-                            
-                            ohlcvDetail = OHLCVDetails(
-                                tokenAddress=tokenAddress,
-                                pairAddress=pairAddress,
-                                timeframe=timeframe,
-                                unixTime=candleUnixTime,
-                                timeBucket=CommonUtil.calculateInitialStartTime(candleUnixTime, timeframe),
-                                openPrice=record[TradingHandlerConstants.OHLCVDetails.OPEN_PRICE],
-                                highPrice=record[TradingHandlerConstants.OHLCVDetails.HIGH_PRICE],
-                                lowPrice=record[TradingHandlerConstants.OHLCVDetails.LOW_PRICE],
-                                closePrice=record[TradingHandlerConstants.OHLCVDetails.CLOSE_PRICE],
-                                volume=record[TradingHandlerConstants.OHLCVDetails.VOLUME],
-                                trades=record.get(TradingHandlerConstants.OHLCVDetails.TRADES, 0),
-                                isComplete=True,
-                                dataSource=record.get(TradingHandlerConstants.OHLCVDetails.DATA_SOURCE, 'moralis')
-                            )
-                            timeframeRecord.addOHLCVDetail(ohlcvDetail)
-                
-                trackedTokens = list(trackedTokensMap.values())
 
-                logger.info(f"TRADING SCHEDULER :: getting all VWAP data for scheduler completed")
-                return trackedTokens
-                
+                    # Unprocessed candles arrive as parallel arrays ordered by unixtime (NULL when none);
+                    # VWAP only needs these columns, so keep them as numpy arrays instead of OHLCVDetails
+                    if not record.unixtimes:
+                        continue
+
+                    timeframeRecord.ohlcvArrays = OHLCVArrays.fromColumns(
+                        record.unixtimes, record.highprices, record.lowprices,
+                        record.closeprices, record.volumes
+                    )
+
+            logger.info(f"TRADING SCHEDULER :: getting all VWAP data for scheduler completed")
+            return trackedTokens
+
         except Exception as e:
             logger.info(f"TRADING SCHEDULER :: Error getting all VWAP data for scheduler: {e}")
             return []
@@ -780,7 +1849,8 @@ class TradingHandler(BaseDBHandler):
         This method implements the new optimized approach:
         1. JOIN emastates with trackedtokens to get only active tokens
         2. JOIN with timeframemetadata to get lastfetchedat for each timeframe
-        3. JOIN with ohlcvdetails to get candles where unixtime > lastupdatedunix
+        3. LATERAL-aggregate ohlcvdetails candles where unixtime > lastupdatedunix into
+           parallel arrays, so each (token, timeframe, emakey) is a single row
         4. All in one highly optimized query for scalability
         
         Returns:
@@ -788,165 +1858,112 @@ class TradingHandler(BaseDBHandler):
         """
         logger.info(f"TRADING SCHEDULER :: getting all EMA data for scheduler started")
         try:        
-            with self.conn_manager.transaction() as cursor:
+            # Stream rows from a server-side cursor instead of buffering the whole result
+            with self.conn_manager.server_cursor('ema_sched_cur') as cursor:
                 # Single optimized query with JOINs
-                cursor.execute(text("""
-                    WITH ema_data AS (
-                        SELECT 
-                            es.tokenaddress, -- add name and symbol to the query
-                            es.pairaddress,
-                            es.timeframe,
-                            es.emakey,
-                            es.emavalue,
-                            es.status,
-                            es.lastupdatedunix,
-                            es.emaavailabletime,
-                            tmf.id as timeframeid,
-                            tmf.lastfetchedat,
-                            CASE 
-                                WHEN es.status = 2 THEN es.lastupdatedunix  -- AVAILABLE: get candles after last updated
-                                WHEN es.status = 1 AND tmf.lastfetchedat >= es.emaavailabletime THEN 0  -- NOT_AVAILABLE_READY: get ALL candles (for initial SMA calculation)
-                                ELSE 0  -- NOT_AVAILABLE_INSUFFICIENT: no candles needed
-                            END as candle_from_time,
-                            tt.symbol,
-                            tt.name
-                        FROM emastates es
-                        INNER JOIN trackedtokens tt ON es.tokenaddress = tt.tokenaddress AND es.pairaddress = tt.pairaddress
-                        INNER JOIN timeframemetadata tmf ON es.tokenaddress = tmf.tokenaddress AND es.timeframe = tmf.timeframe
-                        WHERE tt.status = 1
-                          AND tmf.isactive = TRUE
-                    ),
-                    candle_data AS (
-                        SELECT 
-                            ed.tokenaddress,
-                            ed.pairaddress,
-                            ed.timeframe,
-                            ed.emakey,
-                            o.unixtime,
-                            o.closeprice
-                        FROM ema_data ed
-                        INNER JOIN ohlcvdetails o ON ed.tokenaddress = o.tokenaddress AND ed.timeframe = o.timeframe
-                        WHERE ed.candle_from_time >= 0 
-                          AND (ed.candle_from_time = 0 OR o.unixtime > ed.candle_from_time)
-                          AND o.iscomplete = TRUE
-                    )
-                    SELECT 
-                        ed.tokenaddress,
-                        ed.pairaddress,
-                        ed.timeframe,
-                        ed.timeframeid,
-                        ed.emakey,
-                        ed.emavalue,
-                        ed.status,
-                        ed.lastupdatedunix,
-                        ed.emaavailabletime,
-                        ed.lastfetchedat,
-                        cd.unixtime as candle_unixtime,
-                        cd.closeprice as candle_closeprice,
-                        ed.symbol,
-                        ed.name
-                    FROM ema_data ed
-                    LEFT JOIN candle_data cd ON ed.tokenaddress = cd.tokenaddress 
-                        AND ed.timeframe = cd.timeframe 
-                        AND ed.emakey = cd.emakey
-                    WHERE ed.candle_from_time >= 0
-                    ORDER BY ed.tokenaddress, ed.timeframe, ed.emakey, cd.unixtime ASC
-                """))
+                cursor.execute(_SQL_GET_ALL_EMA_DATA)
                 
                 # Organize results into POJOs
                 trackedTokens = {}
-                # Track seen candle timestamps per timeframe to prevent duplicates (space and time efficient)
-                seenCandles = {}  # {tokenAddress: {timeframe: set(unixTimes)}}
-
-                records = cursor.fetchall()
-                
-                for row in records:
-                    tokenAddress = row[TradingHandlerConstants.EMAStates.TOKEN_ADDRESS]
-                    pairAddress = row[TradingHandlerConstants.EMAStates.PAIR_ADDRESS]
-                    timeframe = row[TradingHandlerConstants.EMAStates.TIMEFRAME]
-                    timeframeId = row['timeframeid'] 
-                    emaKey = row[TradingHandlerConstants.EMAStates.EMA_KEY]
-                    emaPeriod = int(emaKey)
+
+                # Resolve column keys and bound methods once - the loop then reads plain locals
+                tokenAddressCol = TradingHandlerConstants.EMAStates.TOKEN_ADDRESS
+                pairAddressCol = TradingHandlerConstants.EMAStates.PAIR_ADDRESS
+                timeframeCol = TradingHandlerConstants.EMAStates.TIMEFRAME
+                emaKeyCol = TradingHandlerConstants.EMAStates.EMA_KEY
+                emaValueCol = TradingHandlerConstants.EMAStates.EMA_VALUE
+                lastUpdatedUnixCol = TradingHandlerConstants.EMAStates.LAST_UPDATED_UNIX
+                emaAvailableTimeCol = TradingHandlerConstants.EMAStates.EMA_AVAILABLE_TIME
+                statusCol = TradingHandlerConstants.EMAStates.STATUS
+                lastFetchedAtCol = TradingHandlerConstants.TimeframeMetadata.LAST_FETCHED_AT
+                candleUnixTimesCol = IndicatorConstants.EMAStates.CANDLE_UNIX_TIMES
+                candleClosePricesCol = IndicatorConstants.EMAStates.CANDLE_CLOSE_PRICES
+
+                # Rows arrive ORDER BY tokenaddress, timeframe, emakey, so each (token, timeframe)
+                # is one contiguous group - its TimeframeRecord is built exactly once
+                for (tokenAddress, timeframe), emaRows in groupby(cursor, key=itemgetter(tokenAddressCol, timeframeCol)):
+                    firstRow = next(emaRows)
+                    pairAddress = firstRow[pairAddressCol]
                     
                     # Initialize TrackedToken if not exists
-                    if tokenAddress not in trackedTokens:
-                        trackedTokens[tokenAddress] = TrackedToken(
+                    trackedToken = trackedTokens.get(tokenAddress)
+                    if trackedToken is None:
+                        trackedToken = trackedTokens[tokenAddress] = TrackedToken(
                             trackedTokenId=0,  # Will be set from database if needed
                             tokenAddress=tokenAddress,
-                            symbol=row['symbol'],
-                            name=row['name'],
+                            symbol=firstRow['symbol'],
+                            name=firstRow['name'],
                             pairAddress=pairAddress,
                             addedBy='scheduler'
                         )
                     
-                    # Get or create TimeframeRecord for this timeframe
-                    timeframeRecord = trackedTokens[tokenAddress].getTimeframeRecord(timeframe)
-                    if not timeframeRecord:
-                        timeframeRecord = TimeframeRecord(
-                            timeframeId=timeframeId,
-                            tokenAddress=tokenAddress,
-                            pairAddress=pairAddress,
-                            timeframe=timeframe,
-                            nextFetchAt=row[TradingHandlerConstants.TimeframeMetadata.LAST_FETCHED_AT] or 0,
-                            lastFetchedAt=row[TradingHandlerConstants.TimeframeMetadata.LAST_FETCHED_AT],
-                            isActive=True
-                        )
-                        trackedTokens[tokenAddress].addTimeframeRecord(timeframeRecord)
-                    
-                    # Create or update EMAState
-                    emaState = EMAState(
+                    # Create TimeframeRecord for this timeframe
+                    timeframeRecord = TimeframeRecord(
+                        timeframeId=firstRow['timeframeid'],
                         tokenAddress=tokenAddress,
                         pairAddress=pairAddress,
                         timeframe=timeframe,
-                        emaKey=emaKey,
-                        emaValue=float(row[TradingHandlerConstants.EMAStates.EMA_VALUE]) if row[TradingHandlerConstants.EMAStates.EMA_VALUE] else None,
-                        lastUpdatedUnix=row[TradingHandlerConstants.EMAStates.LAST_UPDATED_UNIX],
-                        nextFetchTime=None,  # Will be calculated during processing
-                        emaAvailableTime=row[TradingHandlerConstants.EMAStates.EMA_AVAILABLE_TIME],
-                        pairCreatedTime=None,  # Not needed for EMA processing
-                        status=row[TradingHandlerConstants.EMAStates.STATUS]
+                        nextFetchAt=firstRow[lastFetchedAtCol] or 0,
+                        lastFetchedAt=firstRow[lastFetchedAtCol],
+                        isActive=True
                     )
+                    trackedToken.addTimeframeRecord(timeframeRecord)
+                    addCandle = timeframeRecord.addOHLCVDetail
+                    # EMA periods of one timeframe can share candles - keep each unixtime once
+                    seenForTimeframe = set()
                     
-                    # Set EMAState in TimeframeRecord
-                    if emaPeriod == 12:
-                        timeframeRecord.ema12State = emaState
-                    elif emaPeriod == 21:
-                        timeframeRecord.ema21State = emaState
-                    elif emaPeriod == 34:
-                        timeframeRecord.ema34State = emaState
-                    
-                    # Add candle data if exists (only close price needed for EMA)
-                    if row[IndicatorConstants.EMAStates.CANDLE_UNIX_TIME]:
-                        candleUnixTime = row[IndicatorConstants.EMAStates.CANDLE_UNIX_TIME]
+                    for row in chain((firstRow,), emaRows):
+                        emaKey = row[emaKeyCol]
+                        emaPeriod = int(emaKey)
+                        
+                        # Create EMAState
+                        emaState = EMAState(
+                            tokenAddress=tokenAddress,
+                            pairAddress=pairAddress,
+                            timeframe=timeframe,
+                            emaKey=emaKey,
+                            emaValue=row[emaValueCol] or None,  # float8 from the query; 0/NULL = not calculated
+                            lastUpdatedUnix=row[lastUpdatedUnixCol],
+                            nextFetchTime=None,  # Will be calculated during processing
+                            emaAvailableTime=row[emaAvailableTimeCol],
+                            pairCreatedTime=None,  # Not needed for EMA processing
+                            status=row[statusCol]
+                        )
                         
-                        # Initialize seenCandles structure if needed
-                        if tokenAddress not in seenCandles:
-                            seenCandles[tokenAddress] = {}
-                        if timeframe not in seenCandles[tokenAddress]:
-                            seenCandles[tokenAddress][timeframe] = set()
+                        # Set EMAState in TimeframeRecord
+                        if emaPeriod == 12:
+                            timeframeRecord.ema12State = emaState
+                        elif emaPeriod == 21:
+                            timeframeRecord.ema21State = emaState
+                        elif emaPeriod == 34:
+                            timeframeRecord.ema34State = emaState
                         
-                        # O(1) check if candle already exists using set
-                        if candleUnixTime not in seenCandles[tokenAddress][timeframe]:
-                            # Mark as seen
-                            seenCandles[tokenAddress][timeframe].add(candleUnixTime)
+                        # Add candle data if exists (only close price needed for EMA) - NULL arrays when none
+                        candleUnixTimes = row[candleUnixTimesCol]
+                        if not candleUnixTimes:
+                            continue
+                        
+                        for candleUnixTime, closePrice in zip(candleUnixTimes, row[candleClosePricesCol]):
+                            if candleUnixTime in seenForTimeframe:
+                                continue
+                            seenForTimeframe.add(candleUnixTime)
                             
                             # Create OHLCVDetails with only close price (EMA only needs close price)
-                            candle = OHLCVDetails(
+                            addCandle(OHLCVDetails(
                                 tokenAddress=tokenAddress,
                                 pairAddress=pairAddress,
                                 timeframe=timeframe,
                                 unixTime=candleUnixTime,
-                                timeBucket=self._calculateTimeBucket(candleUnixTime, timeframe),
+                                timeBucket=0,   # Not needed for EMA (generated by ohlcvdetails)
                                 openPrice=0.0,  # Not needed for EMA
                                 highPrice=0.0,  # Not needed for EMA
                                 lowPrice=0.0,   # Not needed for EMA
-                                closePrice=float(row[IndicatorConstants.EMAStates.CANDLE_CLOSE_PRICE]),
+                                closePrice=closePrice,  # already float8 from the query
                                 volume=0.0,     # Not needed for EMA
                                 trades=0,       # Not needed for EMA
                                 isComplete=True,
                                 dataSource='database'
-                            )
-                            timeframeRecord.addOHLCVDetail(candle)
+                            ))
                 
                 logger.info(f"TRADING SCHEDULER :: getting all EMA data for scheduler completed")
                 return list(trackedTokens.values())
@@ -1015,40 +2032,32 @@ class TradingHandler(BaseDBHandler):
     
     def collectDataForInitialTimeframeEntry(self, tokenAddress: str, pairAddress: str, 
                                timeframes: List[str], pairCreatedTime: int) -> List[Tuple]:
-        """Build timeframe record data for batch insertion"""
-        timeframeRecords = []
-        
-        for timeframe in timeframes:
-            nextFetchTime = CommonUtil.calculateNextFetchTimeForInitialTimeframeRecord(pairCreatedTime, timeframe)
-            
-            timeframeRecords.append((
-                tokenAddress, pairAddress, timeframe, nextFetchTime
-            ))
-        
-        return timeframeRecords
+        """
+        Build timeframe record data for batch insertion
+
+        nextFetchAt is the end of the candle containing pairCreatedTime, same as
+        CommonUtil.calculateNextFetchTimeForInitialTimeframeRecord
+        """
+        return [
+            (tokenAddress, pairAddress, timeframe, (pairCreatedTime // seconds + 1) * seconds)
+            for timeframe, seconds in (
+                (timeframe, _TIMEFRAME_SECONDS.get(timeframe) or CommonUtil.getTimeframeSeconds(timeframe))
+                for timeframe in timeframes
+            )
+        ]
 
     
     def recordInitialTimeframeEntry(self, cursor, timeframeRecords: List[Tuple]):
-        """Insert timeframe records in batch and return persisted data"""
-        # Insert records one by one to get RETURNING results
-        persistedRecords = []
-        for record in timeframeRecords:
-            cursor.execute("""
-                INSERT INTO timeframemetadata 
-                (tokenaddress, pairaddress, timeframe, nextfetchat, createdat, lastupdatedat)
-                VALUES (%s, %s, %s, %s, NOW(), NOW())
-                ON CONFLICT (tokenaddress, pairaddress, timeframe) 
-                DO UPDATE SET 
-                    nextfetchat = EXCLUDED.nextfetchat,
-                    lastupdatedat = NOW()
-                RETURNING id, tokenaddress, pairaddress, timeframe, nextfetchat
-            """, record)
-            
-            result = cursor.fetchone()
-            if result:
-                persistedRecords.append(result)
-        
-        return persistedRecords
+        """
+        Insert timeframe records with one INSERT and return persisted data
+
+        Rows are bound as one array per column, so the statement text is the same for any
+        number of timeframes and runs as a prepared statement. RETURNING rows come back in
+        a single fetch as a list; callers read columns from each row.
+        """
+        self.conn_manager.execute_prepared(cursor, 'tmeta_initial_insert', _SQL_INSERT_INITIAL_TIMEFRAME_METADATA,
+                                           self._columnArrays(timeframeRecords))
+        return cursor.fetchall()
     
 
 
@@ -1059,63 +2068,44 @@ class TradingHandler(BaseDBHandler):
 
             logger.info(f"TRADING SCHEDULER: Initiating DB call to get the tokens that needs API candle fetch")
             
-            with self.conn_manager.transaction() as cursor:
-                cursor.execute(text("""
-                    SELECT tm.id as timeframeid,
-                           tm.tokenaddress, 
-                           tm.pairaddress,
-                           tm.timeframe,
-                           tm.nextfetchat,
-                           tm.lastfetchedat,
-                           tt.symbol,
-                           tt.name,
-                           tt.paircreatedtime,
-                           tt.createdat,
-                           tt.trackedtokenid
-                    FROM timeframemetadata tm
-                    INNER JOIN trackedtokens tt ON tm.tokenaddress = tt.tokenaddress
-                    WHERE tm.isactive = TRUE 
-                        AND tt.status = 1
-                        AND tm.nextfetchat <= %s
-                        AND tt.createdat <= to_timestamp(%s)
-                    ORDER BY tm.nextfetchat ASC
-                """), (currentTime, bufferTime))
-                
-                results = cursor.fetchall()
+            # Rows are only read by column name here, so tuples are cheaper than dicts
+            with self.conn_manager.transaction(cursor_factory=NamedTupleCursor) as cursor:
+                self.conn_manager.execute_prepared(cursor, 'ready_tmf', _SQL_GET_TIMEFRAMES_READY_FOR_FETCHING, (currentTime, bufferTime))
                 
                 # Convert directly to TrackedToken POJOs
                 from api.trading.request import TrackedToken, TimeframeRecord
                 
                 trackedTokensMap = {}
                 
-                for row in results:
-                    tokenAddress = row[TradingHandlerConstants.TimeframeMetadata.TOKEN_ADDRESS]
+                for row in cursor:
+                    tokenAddress = row.tokenaddress
                     
                     # Create or get existing TrackedToken
-                    if tokenAddress not in trackedTokensMap:
-                        trackedTokensMap[tokenAddress] = TrackedToken(
-                            trackedTokenId=row[TradingHandlerConstants.TrackedTokens.TRACKED_TOKEN_ID],
+                    trackedToken = trackedTokensMap.get(tokenAddress)
+                    if trackedToken is None:
+                        trackedToken = trackedTokensMap[tokenAddress] = TrackedToken(
+                            trackedTokenId=row.trackedtokenid,
                             tokenAddress=tokenAddress,
-                            symbol=row[TradingHandlerConstants.TrackedTokens.SYMBOL],
-                            name=row[TradingHandlerConstants.TrackedTokens.NAME],
-                            pairAddress=row[TradingHandlerConstants.TimeframeMetadata.PAIR_ADDRESS],
-                            pairCreatedTime=row[TradingHandlerConstants.TrackedTokens.PAIR_CREATED_TIME],
+                            symbol=row.symbol,
+                            name=row.name,
+                            pairAddress=row.pairaddress,
+                            pairCreatedTime=row.paircreatedtime,
                             addedBy='scheduler'
                         )
                     
                     # Create TimeframeRecord POJO
                     timeframeRecord = TimeframeRecord(
-                        timeframeId=row[TradingHandlerConstants.TimeframeMetadata.TIMEFRAME_ID],
+                        timeframeId=row.timeframeid,
                         tokenAddress=tokenAddress,
-                        pairAddress=row[TradingHandlerConstants.TimeframeMetadata.PAIR_ADDRESS],
-                        timeframe=row[TradingHandlerConstants.TimeframeMetadata.TIMEFRAME],
-                        nextFetchAt=row[TradingHandlerConstants.TimeframeMetadata.NEXT_FETCH_AT],
-                        lastFetchedAt=row[TradingHandlerConstants.TimeframeMetadata.LAST_FETCHED_AT],
+                        pairAddress=row.pairaddress,
+                        timeframe=row.timeframe,
+                        nextFetchAt=row.nextfetchat,
+                        lastFetchedAt=row.lastfetchedat,
                         isActive=True
                     )
                     
                     # Add to tracked token
-                    trackedTokensMap[tokenAddress].addTimeframeRecord(timeframeRecord)
+                    trackedToken.addTimeframeRecord(timeframeRecord)
                 
                 trackedTokens = list(trackedTokensMap.values())
                 logger.info(f"TRADING SCHEDULER: Found {len(trackedTokens)}")
@@ -1133,7 +2123,7 @@ class TradingHandler(BaseDBHandler):
             
             logger.info(f"TRADING API :: Transaction initiated to persist calculated token data")
             
-            with self.conn_manager.transaction() as cursor:
+            with self._activeTokensTransaction() as cursor:
                 # Collect all data for batch operations
                 timeframeMetadataData = []
                 candleData = []
@@ -1155,37 +2145,9 @@ class TradingHandler(BaseDBHandler):
                     # Get candles for persistence using TimeframeRecord method
                     candlesToPersist = timeframeRecord.getCandlesForPersistence(maxCandlesPerTimeframe)
                     
-                    for candle in candlesToPersist:
-                        candleData.append((
-                            timeframeRecord.timeframeId,  # Add timeframeid
-                            timeframeRecord.tokenAddress,
-                            timeframeRecord.pairAddress,
-                            timeframeRecord.timeframe,
-                            candle.unixTime,
-                            self._calculateTimeBucket(candle.unixTime, timeframeRecord.timeframe),
-                            candle.openPrice,
-                            candle.highPrice,
-                            candle.lowPrice,
-                            candle.closePrice,
-                            candle.volume,
-                            candle.trades,
-                            candle.vwapValue,
-                            candle.avwapValue,
-                            candle.ema12Value,
-                            candle.ema21Value,
-                            candle.ema34Value,
-                            candle.rsiValue,
-                            candle.stochRSIValue,
-                            candle.stochRSIK,
-                            candle.stochRSID,
-                            candle.trend,
-                            candle.status,
-                            candle.trend12,
-                            candle.status12,
-                            candle.isComplete,
-                            candle.dataSource
-                        ))
-                        totalCandlesInserted += 1
+                    candleRows = self._candlePersistRows(timeframeRecord, candlesToPersist)
+                    candleData.extend(candleRows)
+                    totalCandlesInserted += len(candleRows)
                     
                     # Collect VWAP session data
                     if timeframeRecord.vwapSession:
@@ -1272,13 +2234,13 @@ class TradingHandler(BaseDBHandler):
                             timeframeRecord.rsiState.lastClosePrice,
                             timeframeRecord.rsiState.stochRSIInterval,
                             timeframeRecord.rsiState.stochRSIValue,
-                            json.dumps(timeframeRecord.rsiState.rsiValues),
+                            list(timeframeRecord.rsiState.rsiValues),
                             timeframeRecord.rsiState.kInterval,
                             timeframeRecord.rsiState.kValue,
-                            json.dumps(timeframeRecord.rsiState.stochRSIValues),
+                            list(timeframeRecord.rsiState.stochRSIValues),
                             timeframeRecord.rsiState.dInterval,
                             timeframeRecord.rsiState.dValue,
-                            json.dumps(timeframeRecord.rsiState.kValues),
+                            list(timeframeRecord.rsiState.kValues),
                             timeframeRecord.rsiState.lastUpdatedUnix,
                             timeframeRecord.rsiState.nextFetchTime,
                             timeframeRecord.rsiState.pairCreatedTime,
@@ -1286,11 +2248,7 @@ class TradingHandler(BaseDBHandler):
                         ))
                 
                 # Execute all batch operations
-                if timeframeMetadataData:
-                    self.batchUpdateTimeframeMetadata(cursor, timeframeMetadataData)
-                
-                if candleData:
-                    self.batchInsertCandles(cursor, candleData)
+                self.batchUpsertTimeframeMetadataAndCandles(cursor, timeframeMetadataData, candleData)
                 
                 if vwapSessionData:
                     self.batchInsertVWAPSessions(cursor, vwapSessionData)
@@ -1311,14 +2269,19 @@ class TradingHandler(BaseDBHandler):
             logger.info(f"TRADING API :: Error in batch persist calculated token data: {e}")
             return 0
 
-    def batchPersistNewlyFetchedCandlesData(self, trackedTokens: List['TrackedToken'], maxCandlesPerTimeframe: int = None) -> int:
-        
+    def batchPersistNewlyFetchedCandlesData(self, trackedTokens: List['TrackedToken'], maxCandlesPerTimeframe: int = None,
+                                            cursor=None) -> int:
+        """
+        Persist newly fetched candles with their timeframe metadata and indicator states
+
+        Pass cursor to write inside an existing transaction (see bulk_session).
+        """
         try:
             totalCandlesInserted = 0
 
             logger.info(f"TRADING SCHEDULER :: Transaction initiated to persist newly fetched candles")
             
-            with self.conn_manager.transaction() as cursor:
+            with self._cursor_or_transaction(cursor) as cursor:
                 # Collect all data for batch operations
                 timeframeMetadataData = []
                 candleData = []
@@ -1341,37 +2304,9 @@ class TradingHandler(BaseDBHandler):
                         # Get candles for persistence using TimeframeRecord method
                         candlesToPersist = timeframeRecord.getCandlesForPersistence(maxCandlesPerTimeframe)
                         
-                        for candle in candlesToPersist:
-                            candleData.append((
-                                timeframeRecord.timeframeId,  # Add timeframeid
-                                timeframeRecord.tokenAddress,
-                                timeframeRecord.pairAddress,
-                                timeframeRecord.timeframe,
-                                candle.unixTime,
-                                self._calculateTimeBucket(candle.unixTime, timeframeRecord.timeframe),
-                                candle.openPrice,
-                                candle.highPrice,
-                                candle.lowPrice,
-                                candle.closePrice,
-                                candle.volume,
-                                candle.trades,
-                                candle.vwapValue,
-                                candle.avwapValue,
-                                candle.ema12Value,
-                                candle.ema21Value,
-                                candle.ema34Value,
-                                candle.rsiValue,
-                                candle.stochRSIValue,
-                                candle.stochRSIK,
-                                candle.stochRSID,
-                                candle.trend,
-                                candle.status,
-                                candle.trend12,
-                                candle.status12,
-                                candle.isComplete,
-                                candle.dataSource
-                            ))
-                            totalCandlesInserted += 1
+                        candleRows = self._candlePersistRows(timeframeRecord, candlesToPersist)
+                        candleData.extend(candleRows)
+                        totalCandlesInserted += len(candleRows)
                         
                         # Collect VWAP session data
                         if timeframeRecord.vwapSession:
@@ -1458,13 +2393,13 @@ class TradingHandler(BaseDBHandler):
                                 timeframeRecord.rsiState.lastClosePrice,
                                 timeframeRecord.rsiState.stochRSIInterval,
                                 timeframeRecord.rsiState.stochRSIValue,
-                                json.dumps(timeframeRecord.rsiState.rsiValues),
+                                list(timeframeRecord.rsiState.rsiValues),
                                 timeframeRecord.rsiState.kInterval,
                                 timeframeRecord.rsiState.kValue,
-                                json.dumps(timeframeRecord.rsiState.stochRSIValues),
+                                list(timeframeRecord.rsiState.stochRSIValues),
                                 timeframeRecord.rsiState.dInterval,
                                 timeframeRecord.rsiState.dValue,
-                                json.dumps(timeframeRecord.rsiState.kValues),
+                                list(timeframeRecord.rsiState.kValues),
                                 timeframeRecord.rsiState.lastUpdatedUnix,
                                 timeframeRecord.rsiState.nextFetchTime,
                                 timeframeRecord.rsiState.pairCreatedTime,
@@ -1472,11 +2407,7 @@ class TradingHandler(BaseDBHandler):
                             ))
                 
                 # Execute all batch operations
-                if timeframeMetadataData:
-                    self.batchUpdateTimeframeMetadata(cursor, timeframeMetadataData)
-                
-                if candleData:
-                    self.batchInsertCandles(cursor, candleData)
+                self.batchUpsertTimeframeMetadataAndCandles(cursor, timeframeMetadataData, candleData)
                 
                 if vwapSessionData:
                     self.batchInsertVWAPSessions(cursor, vwapSessionData)
@@ -1497,147 +2428,113 @@ class TradingHandler(BaseDBHandler):
             logger.info(f"TRADING SCHEDULER :: Error in batch persist newly fetched candles: {e}")
             return 0
 
-    def batchPersistEMAData(self, trackedTokens: List['TrackedToken']) -> int:
+    def batchPersistEMAData(self, trackedTokens: List['TrackedToken'], cursor=None) -> int:
         """
-        OPTIMIZED: Batch persist EMA data using temporary tables for maximum performance
+        OPTIMIZED: Batch persist EMA data with set-based updates for maximum performance
         
         Performance improvements:
-        - Uses temporary tables instead of individual UPDATE statements
+        - EMA12/21/34 candle values are written by one UPDATE ... FROM (VALUES ...) statement
         - Single batch operation instead of thousands of individual updates
         - Reduces network round trips from N to 1
         - Eliminates individual query parsing and planning overhead
+        - Up to _CANDLE_COPY_THRESHOLD candles, states and candles go out as one statement
+        - Larger batches build candle rows on a worker thread while the state UPDATE runs on the server
+        - Pass cursor to write inside an existing transaction (see bulk_session)
         """
         try:
-            totalEMAStatesUpdated = 0
-
             logger.info(f"TRADING SCHEDULER :: Transaction initiated to persist EMA data")
             
-            with self.conn_manager.transaction() as cursor:
-                emaStateData = []
-                ema12CandleUpdates = []
-                ema21CandleUpdates = []
-                ema34CandleUpdates = []
-                
-                for trackedToken in trackedTokens:
-                    for timeframeRecord in trackedToken.timeframeRecords:
-                        # Collect EMA12 state data
-                        if timeframeRecord.ema12State:
-                            emaStateData.append((
-                                timeframeRecord.ema12State.tokenAddress,
-                                timeframeRecord.ema12State.pairAddress,
-                                timeframeRecord.ema12State.timeframe,
-                                timeframeRecord.ema12State.emaKey,
-                                timeframeRecord.ema12State.emaValue,
-                                timeframeRecord.ema12State.lastUpdatedUnix,
-                                timeframeRecord.ema12State.nextFetchTime,
-                                timeframeRecord.ema12State.emaAvailableTime,
-                                timeframeRecord.ema12State.pairCreatedTime,
-                                timeframeRecord.ema12State.status
-                            ))
-                            totalEMAStatesUpdated += 1
-                            
-                            # Collect EMA12 candle updates
-                            for candle in timeframeRecord.ohlcvDetails:
-                                if candle.ema12Value is not None:
-                                    ema12CandleUpdates.append((
-                                        candle.ema12Value,
-                                        candle.tokenAddress,
-                                        candle.timeframe,
-                                        candle.unixTime
-                                    ))
-                        
-                        # Collect EMA21 state data
-                        if timeframeRecord.ema21State:
-                            emaStateData.append((
-                                timeframeRecord.ema21State.tokenAddress,
-                                timeframeRecord.ema21State.pairAddress,
-                                timeframeRecord.ema21State.timeframe,
-                                timeframeRecord.ema21State.emaKey,
-                                timeframeRecord.ema21State.emaValue,
-                                timeframeRecord.ema21State.lastUpdatedUnix,
-                                timeframeRecord.ema21State.nextFetchTime,
-                                timeframeRecord.ema21State.emaAvailableTime,
-                                timeframeRecord.ema21State.pairCreatedTime,
-                                timeframeRecord.ema21State.status
-                            ))
-                            totalEMAStatesUpdated += 1
-                            
-                            # Collect EMA21 candle updates
-                            for candle in timeframeRecord.ohlcvDetails:
-                                if candle.ema21Value is not None:
-                                    ema21CandleUpdates.append((
-                                        candle.ema21Value,
-                                        candle.tokenAddress,
-                                        candle.timeframe,
-                                        candle.unixTime
-                                    ))
-                        
-                        # Collect EMA34 state data
-                        if timeframeRecord.ema34State:
-                            emaStateData.append((
-                                timeframeRecord.ema34State.tokenAddress,
-                                timeframeRecord.ema34State.pairAddress,
-                                timeframeRecord.ema34State.timeframe,
-                                timeframeRecord.ema34State.emaKey,
-                                timeframeRecord.ema34State.emaValue,
-                                timeframeRecord.ema34State.lastUpdatedUnix,
-                                timeframeRecord.ema34State.nextFetchTime,
-                                timeframeRecord.ema34State.emaAvailableTime,
-                                timeframeRecord.ema34State.pairCreatedTime,
-                                timeframeRecord.ema34State.status
-                            ))
-                            totalEMAStatesUpdated += 1
-                            
-                            # Collect EMA34 candle updates
-                            for candle in timeframeRecord.ohlcvDetails:
-                                if candle.ema34Value is not None:
-                                    ema34CandleUpdates.append((
-                                        candle.ema34Value,
-                                        candle.tokenAddress,
-                                        candle.timeframe,
-                                        candle.unixTime
-                                    ))
-                
-                # Execute EMA-specific batch operations
-                if emaStateData:
-                    self.batchInsertEMAStates(cursor, emaStateData)
-                
-                # OPTIMIZED: Use temporary tables for candle updates
-                if ema12CandleUpdates:
-                    self.batchUpdateCandlesWithTempTable(cursor, ema12CandleUpdates, 'ema12value')
-                    logger.info(f"TRADING SCHEDULER :: Batch updated {len(ema12CandleUpdates)} EMA12 candle values")
-                
-                if ema21CandleUpdates:
-                    self.batchUpdateCandlesWithTempTable(cursor, ema21CandleUpdates, 'ema21value')
-                    logger.info(f"TRADING SCHEDULER :: Batch updated {len(ema21CandleUpdates)} EMA21 candle values")
-                
-                if ema34CandleUpdates:
-                    self.batchUpdateCandlesWithTempTable(cursor, ema34CandleUpdates, 'ema34value')
-                    logger.info(f"TRADING SCHEDULER :: Batch updated {len(ema34CandleUpdates)} EMA34 candle values")
-                
+            timeframeRecords = [
+                timeframeRecord
+                for trackedToken in trackedTokens
+                for timeframeRecord in trackedToken.timeframeRecords
+            ]
+            emaStateData = [
+                _EMA_STATE_ROW(emaState)
+                for timeframeRecord in timeframeRecords
+                for emaState in (timeframeRecord.ema12State, timeframeRecord.ema21State, timeframeRecord.ema34State)
+                if emaState
+            ]
+            
+            if sum(len(timeframeRecord.ohlcvDetails) for timeframeRecord in timeframeRecords) <= _CANDLE_COPY_THRESHOLD:
+                emaCandleUpdates = self._collectEMACandleUpdates(timeframeRecords)
+                with self._cursor_or_transaction(cursor) as cursor:
+                    self.batchUpdateEMAStatesAndCandleValues(cursor, emaStateData, emaCandleUpdates)
                 logger.info(f"TRADING SCHEDULER :: Transaction completed to persist EMA data")
-            return totalEMAStatesUpdated
+                return len(emaStateData)
+            
+            # psycopg2 releases the GIL while waiting on the server, so the worker thread
+            # packs candle rows during the state UPDATE round trip
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                emaCandleFuture = executor.submit(self._collectEMACandleUpdates, timeframeRecords)
+                
+                with self._cursor_or_transaction(cursor) as cursor:
+                    # Execute EMA-specific batch operations - scheduler states already exist, so update in place
+                    if emaStateData:
+                        self.batchUpdateEMAStates(cursor, emaStateData)
+                    
+                    # OPTIMIZED: One joined UPDATE covers all three EMA columns
+                    emaCandleUpdates = emaCandleFuture.result()
+                    if emaCandleUpdates:
+                        self.batchUpdateEMACandleValues(cursor, emaCandleUpdates)
+                        logger.info(f"TRADING SCHEDULER :: Batch updated {len(emaCandleUpdates)} EMA candle values")
+                    
+                    logger.info(f"TRADING SCHEDULER :: Transaction completed to persist EMA data")
+            return len(emaStateData)
             
         except Exception as e:
             logger.info(f"TRADING SCHEDULER :: Error in batch persist EMA data: {e}")
             return 0
 
-    def batchPersistVWAPData(self, trackedTokens: List['TrackedToken']) -> int:
+    def _collectEMACandleUpdates(self, timeframeRecords: List['TimeframeRecord']) -> List[Tuple]:
         """
-        OPTIMIZED: Batch persist VWAP data using temporary tables for maximum performance
+        Collect EMA12/21/34 candle updates - one row per candle for all periods, so a
+        candle carrying several periods is a single heap update
+
+        Returns:
+            List of tuples (tokenAddress, timeframe, unixTime, ema12Value, ema21Value, ema34Value)
+        """
+        emaCandleUpdates = []
+        for timeframeRecord in timeframeRecords:
+            hasEMA12 = timeframeRecord.ema12State is not None
+            hasEMA21 = timeframeRecord.ema21State is not None
+            hasEMA34 = timeframeRecord.ema34State is not None
+            if not (hasEMA12 or hasEMA21 or hasEMA34):
+                continue
+            
+            rows = map(_EMA_CANDLE_ROW, timeframeRecord.ohlcvDetails)
+            if not (hasEMA12 and hasEMA21 and hasEMA34):
+                # Periods without a state are not written
+                rows = (
+                    (tokenAddress, timeframe, unixTime,
+                     ema12Value if hasEMA12 else None,
+                     ema21Value if hasEMA21 else None,
+                     ema34Value if hasEMA34 else None)
+                    for tokenAddress, timeframe, unixTime, ema12Value, ema21Value, ema34Value in rows
+                )
+            emaCandleUpdates.extend(
+                row for row in rows
+                if row[3] is not None or row[4] is not None or row[5] is not None
+            )
+        return emaCandleUpdates
+
+    def batchPersistVWAPData(self, trackedTokens: List['TrackedToken'], cursor=None) -> int:
+        """
+        OPTIMIZED: Batch persist VWAP data with multi-row statements for maximum performance
         
         Performance improvements:
-        - Uses temporary tables instead of individual UPDATE statements
+        - Sessions and candle VWAP values are written with one statement (one round trip)
         - Single batch operation instead of thousands of individual updates
         - Reduces network round trips from N to 1
         - Eliminates individual query parsing and planning overhead
+        - Pass cursor to write inside an existing transaction (see bulk_session)
         """
         try:
             totalVWAPSessionsUpdated = 0
 
             logger.info(f"TRADING SCHEDULER :: Transaction initiated to persist VWAP data")
             
-            with self.conn_manager.transaction() as cursor:
+            with self._cursor_or_transaction(cursor) as cursor:
                 # Collect VWAP-specific data for batch operations
                 vwapSessionData = []
                 vwapCandleUpdates = []
@@ -1661,21 +2558,20 @@ class TradingHandler(BaseDBHandler):
                             totalVWAPSessionsUpdated += 1
                             
                             # Collect VWAP candle updates
-                            for candle in timeframeRecord.ohlcvDetails:
-                                if candle.vwapValue is not None:
-                                    vwapCandleUpdates.append((
-                                        candle.vwapValue,
-                                        candle.tokenAddress,
-                                        candle.timeframe,
-                                        candle.unixTime
-                                    ))
+                            candleArrays = timeframeRecord.ohlcvArrays
+                            if candleArrays is not None and candleArrays.vwapValues is not None:
+                                # NaN marks candles with no cumulative volume yet - nothing to write
+                                hasVWAP = ~np.isnan(candleArrays.vwapValues)
+                                # Rows are packed by zip with repeated token/timeframe - no per-candle lookups
+                                vwapCandleUpdates.extend(zip(
+                                    candleArrays.vwapValues[hasVWAP].tolist(),
+                                    repeat(timeframeRecord.tokenAddress),
+                                    repeat(timeframeRecord.timeframe),
+                                    candleArrays.unixTimes[hasVWAP].tolist()
+                                ))
                 
                 # Execute VWAP-specific batch operations
-                if vwapSessionData:
-                    self.batchInsertVWAPSessions(cursor, vwapSessionData)
-                
-                if vwapCandleUpdates:
-                    self.batchUpdateCandlesWithTempTable(cursor, vwapCandleUpdates, 'vwapvalue')
+                self.batchUpsertVWAPSessionsAndCandleValues(cursor, vwapSessionData, vwapCandleUpdates)
             
                 
                 logger.info(f"TRADING SCHEDULER :: Transaction completed to persist VWAP data") 
@@ -1685,6 +2581,38 @@ class TradingHandler(BaseDBHandler):
             logger.info(f"TRADING SCHEDULER :: Error in batch persist VWAP data: {e}")
             return 0
 
+    def batchAdvanceVWAPInDatabase(self) -> int:
+        """
+        Advance VWAP for all active token timeframes entirely inside PostgreSQL
+
+        Same result as getAllVWAPDataForScheduler + VWAPProcessor + batchPersistVWAPData,
+        without shipping candles to Python:
+        - Running PV/volume sums are window functions partitioned by timeframe and session day
+        - Candles up to the stored session's day continue from its cumulative values and
+          bounds, candles on a later day start a fresh session (IndicatorKernels.vwapUpdate)
+        - ohlcvdetails.vwapvalue is set per candle and vwapsessions is upserted from the
+          latest candle of each timeframe
+
+        Returns:
+            int: Number of VWAP sessions updated
+        """
+        try:
+            logger.info(f"TRADING SCHEDULER :: Transaction initiated to advance VWAP in database")
+
+            with self.conn_manager.transaction() as cursor:
+                # Timeframe lengths are parsed in Python and joined in as an array table for
+                # nextcandlefetch - no separate lookup of the timeframes in use
+                cursor.execute(_SQL_ADVANCE_VWAP, (list(_TIMEFRAME_SECONDS), list(_TIMEFRAME_SECONDS.values())))
+                result = cursor.fetchone()
+
+            logger.info(f"TRADING SCHEDULER :: Advanced VWAP in database - "
+                        f"{result['candlesupdated']} candles, {result['sessionsupdated']} sessions")
+            return result['sessionsupdated']
+
+        except Exception as e:
+            logger.info(f"TRADING SCHEDULER :: Error advancing VWAP in database: {e}")
+            return 0
+
     def getAllAVWAPDataForScheduler(self) -> List['TrackedToken']:
         """
         SINGLE OPTIMIZED QUERY: Get all AVWAP data with corresponding candles for scheduler
@@ -1692,7 +2620,8 @@ class TradingHandler(BaseDBHandler):
         This method implements the new optimized approach:
         1. JOIN avwapstates with trackedtokens to get only active tokens
         2. JOIN with timeframemetadata to get lastfetchedat for each timeframe
-        3. JOIN with ohlcvdetails to get candles where unixtime > lastupdatedunix
+        3. LATERAL-aggregate ohlcvdetails candles where unixtime > lastupdatedunix into
+           parallel arrays, so each (token, timeframe) is a single row
         4. All in one highly optimized query for scalability
         
         Returns:
@@ -1702,94 +2631,21 @@ class TradingHandler(BaseDBHandler):
         try:        
             with self.conn_manager.transaction() as cursor:
                 # Single optimized query with JOINs for AVWAP data
-                cursor.execute(text("""
-                    WITH avwap_data AS (
-                        SELECT 
-                            avs.tokenaddress,
-                            avs.pairaddress,
-                            avs.timeframe,
-                            avs.avwap,
-                            avs.cumulativepv,
-                            avs.cumulativevolume,
-                            avs.lastupdatedunix,
-                            avs.nextfetchtime,
-                            tmf.id as timeframeid,
-                            tmf.lastfetchedat,
-                            tt.symbol,
-                            tt.name,
-                            CASE 
-                                WHEN avs.lastupdatedunix IS NOT NULL THEN avs.lastupdatedunix  -- Get candles after last updated
-                                ELSE 0  -- Get all candles if no previous update
-                            END as candle_from_time
-                        FROM avwapstates avs
-                        INNER JOIN trackedtokens tt ON avs.tokenaddress = tt.tokenaddress AND avs.pairaddress = tt.pairaddress
-                        INNER JOIN timeframemetadata tmf ON avs.tokenaddress = tmf.tokenaddress AND avs.timeframe = tmf.timeframe
-                        WHERE tt.status = 1
-                          AND tmf.isactive = TRUE
-                    ),
-                    candle_data AS (
-                        SELECT 
-                            ad.tokenaddress,
-                            ad.pairaddress,
-                            ad.timeframe,
-                            o.unixtime,
-                            o.timebucket,
-                            o.openprice,
-                            o.highprice,
-                            o.lowprice,
-                            o.closeprice,
-                            o.volume,
-                            o.trades,
-                            o.iscomplete,
-                            o.datasource
-                        FROM avwap_data ad
-                        INNER JOIN ohlcvdetails o ON ad.tokenaddress = o.tokenaddress AND ad.timeframe = o.timeframe
-                        WHERE o.unixtime > ad.candle_from_time
-                          AND o.iscomplete = TRUE
-                    )
-                    SELECT 
-                        ad.tokenaddress,
-                        ad.pairaddress,
-                        ad.timeframe,
-                        ad.timeframeid,
-                        ad.avwap,
-                        ad.cumulativepv,
-                        ad.cumulativevolume,
-                        ad.lastupdatedunix,
-                        ad.nextfetchtime,
-                        ad.lastfetchedat,
-                        cd.unixtime as candle_unixtime,
-                        cd.timebucket as candle_timebucket,
-                        cd.openprice as candle_openprice,
-                        cd.highprice as candle_highprice,
-                        cd.lowprice as candle_lowprice,
-                        cd.closeprice as candle_closeprice,
-                        cd.volume as candle_volume,
-                        cd.trades as candle_trades,
-                        cd.iscomplete as candle_iscomplete,
-                        cd.datasource as candle_datasource,
-                        ad.symbol,
-                        ad.name
-                    FROM avwap_data ad
-                    LEFT JOIN candle_data cd ON ad.tokenaddress = cd.tokenaddress 
-                        AND ad.timeframe = cd.timeframe
-                    ORDER BY ad.tokenaddress, ad.timeframe, cd.unixtime ASC
-                """))
+                self.conn_manager.execute_prepared(cursor, 'avwap_sched', _SQL_GET_ALL_AVWAP_DATA)
                 
-                # Organize results into POJOs
+                # Organize results into POJOs - avwapstates has one row per (token, timeframe)
                 trackedTokens = {}
-                # Track seen candle timestamps per timeframe to prevent duplicates (space and time efficient)
-                seenCandles = {}  # {tokenAddress: {timeframe: set(unixTimes)}}
                 
-                for row in cursor.fetchall():
+                for row in cursor:
                     tokenAddress = row['tokenaddress']
                     pairAddress = row['pairaddress']
                     timeframe = row['timeframe']
                     timeframeId = row['timeframeid']
                     
                     # Initialize TrackedToken if not exists
-                    if tokenAddress not in trackedTokens:
-                        trackedTokens[tokenAddress] = TrackedToken(
+                    trackedToken = trackedTokens.get(tokenAddress)
+                    if trackedToken is None:
+                        trackedToken = trackedTokens[tokenAddress] = TrackedToken(
                             trackedTokenId=0,  # Will be set from database if needed
                             tokenAddress=tokenAddress,
                             symbol=row['symbol'],  
@@ -1798,28 +2654,26 @@ class TradingHandler(BaseDBHandler):
                             addedBy='scheduler'
                         )
                     
-                    # Get or create TimeframeRecord for this timeframe
-                    timeframeRecord = trackedTokens[tokenAddress].getTimeframeRecord(timeframe)
-                    if not timeframeRecord:
-                        timeframeRecord = TimeframeRecord(
-                            timeframeId=timeframeId,
-                            tokenAddress=tokenAddress,
-                            pairAddress=pairAddress,
-                            timeframe=timeframe,
-                            nextFetchAt=row['lastfetchedat'] or 0,
-                            lastFetchedAt=row['lastfetchedat'],
-                            isActive=True
-                        )
-                        trackedTokens[tokenAddress].addTimeframeRecord(timeframeRecord)
+                    # Create TimeframeRecord for this timeframe
+                    timeframeRecord = TimeframeRecord(
+                        timeframeId=timeframeId,
+                        tokenAddress=tokenAddress,
+                        pairAddress=pairAddress,
+                        timeframe=timeframe,
+                        nextFetchAt=row['lastfetchedat'] or 0,
+                        lastFetchedAt=row['lastfetchedat'],
+                        isActive=True
+                    )
+                    trackedToken.addTimeframeRecord(timeframeRecord)
                     
                     # Create or update AVWAPState
                     avwapState = AVWAPState(
                         tokenAddress=tokenAddress,
                         pairAddress=pairAddress,
                         timeframe=timeframe,
-                        avwap=float(row['avwap']) if row['avwap'] else None,
-                        cumulativePV=float(row['cumulativepv']) if row['cumulativepv'] else None,
-                        cumulativeVolume=float(row['cumulativevolume']) if row['cumulativevolume'] else None,
+                        avwap=row['avwap'] or None,
+                        cumulativePV=row['cumulativepv'] or None,
+                        cumulativeVolume=row['cumulativevolume'] or None,
                         lastUpdatedUnix=row['lastupdatedunix'],
                         nextFetchTime=row['nextfetchtime']
                     )
@@ -1827,38 +2681,30 @@ class TradingHandler(BaseDBHandler):
                     # Set AVWAPState in TimeframeRecord
                     timeframeRecord.avwapState = avwapState
                     
-                    # Add candle data if exists
-                    if row['candle_unixtime']:
-                        candleUnixTime = row['candle_unixtime']
-                        
-                        # Initialize seenCandles structure if needed
-                        if tokenAddress not in seenCandles:
-                            seenCandles[tokenAddress] = {}
-                        if timeframe not in seenCandles[tokenAddress]:
-                            seenCandles[tokenAddress][timeframe] = set()
-                        
-                        # O(1) check if candle already exists using set
-                        if candleUnixTime not in seenCandles[tokenAddress][timeframe]:
-                            # Mark as seen
-                            seenCandles[tokenAddress][timeframe].add(candleUnixTime)
-                            
-                            # Create OHLCVDetails with all candle data (AVWAP needs full OHLCV data)
-                            candle = OHLCVDetails(
-                                tokenAddress=tokenAddress,
-                                pairAddress=pairAddress,
-                                timeframe=timeframe,
-                                unixTime=candleUnixTime,
-                                timeBucket=row['candle_timebucket'],
-                                openPrice=float(row['candle_openprice']),
-                                highPrice=float(row['candle_highprice']),
-                                lowPrice=float(row['candle_lowprice']),
-                                closePrice=float(row['candle_closeprice']),
-                                volume=float(row['candle_volume']),
-                                trades=row['candle_trades'],
-                                isComplete=row['candle_iscomplete'],
-                                dataSource=row['candle_datasource']
-                            )
-                            timeframeRecord.addOHLCVDetail(candle)
+                    # Add candle data if exists - NULL arrays when none
+                    if not row['candle_unixtimes']:
+                        continue
+                    
+                    for candleUnixTime, timeBucket, openPrice, highPrice, lowPrice, closePrice, volume, trades, dataSource in zip(
+                            row['candle_unixtimes'], row['candle_timebuckets'], row['candle_openprices'],
+                            row['candle_highprices'], row['candle_lowprices'], row['candle_closeprices'],
+                            row['candle_volumes'], row['candle_trades'], row['candle_datasources']):
+                        # Create OHLCVDetails with all candle data (AVWAP needs full OHLCV data)
+                        timeframeRecord.addOHLCVDetail(OHLCVDetails(
+                            tokenAddress=tokenAddress,
+                            pairAddress=pairAddress,
+                            timeframe=timeframe,
+                            unixTime=candleUnixTime,
+                            timeBucket=timeBucket,
+                            openPrice=openPrice,  # prices/volume already float8 from the query
+                            highPrice=highPrice,
+                            lowPrice=lowPrice,
+                            closePrice=closePrice,
+                            volume=volume,
+                            trades=trades,
+                            isComplete=True,  # only complete candles are aggregated
+                            dataSource=dataSource
+                        ))
                 
                 logger.info(f"TRADING SCHEDULER :: getting all AVWAP data for scheduler completed")
                 return list(trackedTokens.values())
@@ -1867,73 +2713,102 @@ class TradingHandler(BaseDBHandler):
             logger.info(f"TRADING SCHEDULER :: Error getting AVWAP data with candles for scheduler: {e}")
             return []
 
-    def batchPersistAVWAPData(self, trackedTokens: List['TrackedToken']) -> int:
+    def batchPersistAVWAPData(self, trackedTokens: List['TrackedToken'], cursor=None) -> int:
         """
-        OPTIMIZED: Batch persist AVWAP data using temporary tables for maximum performance
+        OPTIMIZED: Batch persist AVWAP data with multi-row statements for maximum performance
         
         Performance improvements:
-        - Uses temporary tables instead of individual UPDATE statements
+        - Candle AVWAP values are written with one UPDATE ... FROM (VALUES ...) per page
         - Single batch operation instead of thousands of individual updates
         - Reduces network round trips from N to 1
         - Eliminates individual query parsing and planning overhead
+        - Pass cursor to write inside an existing transaction (see bulk_session)
         
         Args:
             trackedTokens: List of TrackedToken POJOs with AVWAP data
+            cursor: Optional caller cursor; candles are then written in its transaction, not sharded
             
         Returns:
             int: Number of AVWAP states updated
         """
         try:
-            totalAVWAPStatesUpdated = 0
-
             logger.info(f"TRADING SCHEDULER :: Transaction initiated to persist AVWAP data")
             
-            with self.conn_manager.transaction() as cursor:
-                # Collect AVWAP-specific data for batch operations
-                avwapStateData = []
-                avwapCandleUpdates = []
-                
-                for trackedToken in trackedTokens:
-                    for timeframeRecord in trackedToken.timeframeRecords:
-                        # Collect AVWAP state data
-                        if timeframeRecord.avwapState:
-                            avwapStateData.append((
-                                timeframeRecord.avwapState.tokenAddress,
-                                timeframeRecord.avwapState.pairAddress,
-                                timeframeRecord.avwapState.timeframe,
-                                timeframeRecord.avwapState.avwap,
-                                timeframeRecord.avwapState.cumulativePV,
-                                timeframeRecord.avwapState.cumulativeVolume,
-                                timeframeRecord.avwapState.lastUpdatedUnix,
-                                timeframeRecord.avwapState.nextFetchTime
-                            ))
-                            totalAVWAPStatesUpdated += 1
-                            
-                            # Collect AVWAP candle updates
-                            for candle in timeframeRecord.ohlcvDetails:
-                                if candle.avwapValue is not None:
-                                    avwapCandleUpdates.append((
-                                        candle.avwapValue,
-                                        candle.tokenAddress,
-                                        candle.timeframe,
-                                        candle.unixTime
-                                    ))
-                
-                # Execute AVWAP-specific batch operations
-                if avwapStateData:
-                    self.batchInsertAVWAPStates(cursor, avwapStateData)
-                
-                # OPTIMIZED: Use temporary table for candle updates
-                if avwapCandleUpdates:
-                    self.batchUpdateCandlesWithTempTable(cursor, avwapCandleUpdates, 'avwapvalue')
-                
-                logger.info(f"TRADING SCHEDULER :: Transaction completed to persist AVWAP data")
-                return totalAVWAPStatesUpdated
+            # Collect AVWAP-specific data for batch operations
+            avwapRecords = [
+                timeframeRecord
+                for trackedToken in trackedTokens
+                for timeframeRecord in trackedToken.timeframeRecords
+                if timeframeRecord.avwapState
+            ]
+            avwapStateData = [_AVWAP_STATE_ROW(timeframeRecord.avwapState) for timeframeRecord in avwapRecords]
+            totalAVWAPStatesUpdated = len(avwapStateData)
+            
+            # Large candle batches are written first, in parallel token shards; states only
+            # advance once every shard committed, so a failed shard is redone next tick
+            if cursor is None and sum(len(timeframeRecord.ohlcvDetails) for timeframeRecord in avwapRecords) > _CANDLE_PARALLEL_UPDATE_THRESHOLD:
+                self._parallelUpdateCandleValues(self._collectAVWAPCandleUpdates(avwapRecords), 'avwapvalue')
+                avwapRecords = []
+            
+            # psycopg2 releases the GIL while waiting on the server, so the worker thread
+            # packs candle rows during the state UPDATE round trip
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                avwapCandleFuture = executor.submit(self._collectAVWAPCandleUpdates, avwapRecords)
+                
+                with self._cursor_or_transaction(cursor) as cursor:
+                    # Execute AVWAP-specific batch operations - scheduler states already exist, so update in place
+                    if avwapStateData:
+                        self.batchUpdateAVWAPStates(cursor, avwapStateData)
+                    
+                    avwapCandleUpdates = avwapCandleFuture.result()
+                    if avwapCandleUpdates:
+                        self.batchUpdateCandleValues(cursor, avwapCandleUpdates, 'avwapvalue')
+                    
+                    logger.info(f"TRADING SCHEDULER :: Transaction completed to persist AVWAP data")
+            return totalAVWAPStatesUpdated
                 
         except Exception as e:
             logger.info(f"TRADING SCHEDULER :: Error in batch persist AVWAP data: {e}")
             return 0
 
+    def _collectAVWAPCandleUpdates(self, avwapRecords: List['TimeframeRecord']) -> List[Tuple]:
+        """Collect (avwapValue, tokenAddress, timeframe, unixTime) rows for candles with an AVWAP value"""
+        return [
+            _AVWAP_CANDLE_ROW(candle)
+            for timeframeRecord in avwapRecords
+            for candle in timeframeRecord.ohlcvDetails
+            if candle.avwapValue is not None
+        ]
+
+    def _parallelUpdateCandleValues(self, candleUpdates: List[Tuple], columnName: str):
+        """
+        Apply candle value updates in token shards, each in its own pooled transaction
+
+        Tokens touch disjoint ohlcvdetails rows, so shards never contend for the same
+        tuples. Raises the first shard failure after all shards finished.
+
+        Args:
+            candleUpdates: List of tuples (value, tokenAddress, timeframe, unixTime)
+            columnName: Column name to update (e.g., 'avwapvalue')
+        """
+        # Sized from the pool this handler's connection manager was built with
+        config = self.conn_manager.config
+        shardCount = max(1, min(_MAX_CANDLE_UPDATE_SHARDS, (config.DB_POOL_SIZE + config.DB_MAX_OVERFLOW) // 2))
+        shards = [[] for _ in range(shardCount)]
+        for row in candleUpdates:
+            shards[hash(row[1]) % shardCount].append(row)
+
+        def applyShard(shard):
+            with self.conn_manager.transaction() as cursor:
+                self.batchUpdateCandleValues(cursor, shard, columnName)
+
+        logger.info(f"TRADING SCHEDULER :: Parallel update of {len(candleUpdates)} candle {columnName} values - started")
+        with ThreadPoolExecutor(max_workers=shardCount) as executor:
+            futures = [executor.submit(applyShard, shard) for shard in shards if shard]
+        for future in futures:
+            future.result()
+        logger.info(f"TRADING SCHEDULER :: Parallel update of {len(candleUpdates)} candle {columnName} values - completed")
+
     def getAllRSIDataForScheduler(self) -> List['TrackedToken']:
         """
         Get all RSI data with corresponding candles for scheduler processing
@@ -1945,118 +2820,27 @@ class TradingHandler(BaseDBHandler):
         try:
             with self.conn_manager.transaction() as cursor:
                 # Query to get RSI states with candles
-                cursor.execute(text("""
-                    WITH rsi_data AS (
-                        SELECT 
-                            rs.tokenaddress,
-                            rs.pairaddress,
-                            rs.timeframe,
-                            rs.rsiinterval,
-                            rs.rsiavailabletime,
-                            rs.rsivalue,
-                            rs.avggain,
-                            rs.avgloss,
-                            rs.lastcloseprice,
-                            rs.stochrsiinterval,
-                            rs.stochrsivalue,
-                            rs.rsivalues,
-                            rs.kinterval,
-                            rs.kvalue,
-                            rs.stochrsivalues,
-                            rs.dinterval,
-                            rs.dvalue,
-                            rs.kvalues,
-                            rs.lastupdatedunix,
-                            rs.nextfetchtime,
-                            rs.paircreatedtime,
-                            rs.status,
-                            tmf.id as timeframeid,
-                            tmf.lastfetchedat,
-                            CASE 
-                                WHEN rs.status = 2 THEN rs.lastupdatedunix
-                                WHEN rs.status = 1 AND tmf.lastfetchedat >= rs.rsiavailabletime THEN 0
-                                ELSE -1
-                            END as candle_from_time,
-                            tt.symbol,
-                            tt.name
-                        FROM rsistates rs
-                        INNER JOIN trackedtokens tt ON rs.tokenaddress = tt.tokenaddress AND rs.pairaddress = tt.pairaddress
-                        INNER JOIN timeframemetadata tmf ON rs.tokenaddress = tmf.tokenaddress AND rs.timeframe = tmf.timeframe
-                        WHERE tt.status = 1
-                          AND tmf.isactive = TRUE
-                    ),
-                    candle_data AS (
-                        SELECT 
-                            rd.tokenaddress,
-                            rd.pairaddress,
-                            rd.timeframe,
-                            o.unixtime,
-                            o.closeprice,
-                            o.highprice,
-                            o.lowprice,
-                            o.volume
-                        FROM rsi_data rd
-                        INNER JOIN ohlcvdetails o ON rd.tokenaddress = o.tokenaddress AND rd.timeframe = o.timeframe
-                        WHERE rd.candle_from_time >= 0 
-                          AND (rd.candle_from_time = 0 OR o.unixtime > rd.candle_from_time)
-                          AND o.iscomplete = TRUE
-                    )
-                    SELECT 
-                        rd.tokenaddress,
-                        rd.pairaddress,
-                        rd.timeframe,
-                        rd.timeframeid,
-                        rd.rsiinterval,
-                        rd.rsiavailabletime,
-                        rd.rsivalue,
-                        rd.avggain,
-                        rd.avgloss,
-                        rd.lastcloseprice,
-                        rd.stochrsiinterval,
-                        rd.stochrsivalue,
-                        rd.rsivalues,
-                        rd.kinterval,
-                        rd.kvalue,
-                        rd.stochrsivalues,
-                        rd.dinterval,
-                        rd.dvalue,
-                        rd.kvalues,
-                        rd.lastupdatedunix,
-                        rd.nextfetchtime,
-                        rd.paircreatedtime,
-                        rd.status,
-                        rd.lastfetchedat,
-                        cd.unixtime as candle_unixtime,
-                        cd.closeprice as candle_closeprice,
-                        cd.highprice as candle_highprice,
-                        cd.lowprice as candle_lowprice,
-                        cd.volume as candle_volume,
-                        rd.symbol,
-                        rd.name
-                    FROM rsi_data rd
-                    LEFT JOIN candle_data cd ON rd.tokenaddress = cd.tokenaddress 
-                        AND rd.timeframe = cd.timeframe
-                    WHERE rd.candle_from_time >= 0
-                    ORDER BY rd.tokenaddress, rd.timeframe, cd.unixtime ASC
-                """))
+                self.conn_manager.execute_prepared(cursor, 'rsi_sched', _SQL_GET_ALL_RSI_DATA)
                 
                 # Organize results into POJOs
             
                 
                 trackedTokens = {}
-                seenCandles = {}
+                seenCandles = {}  # {(tokenAddress, timeframe): set(unixTimes)}
+                timeframeRecords = {}  # {(tokenAddress, timeframe): TimeframeRecord}
                 
-                records = cursor.fetchall()
-                
-                for row in records:
+                # Iterate the cursor instead of fetchall() - one row dict is built at a time rather than
+                # a list of every candle row (a named cursor would stream too, but cannot run EXECUTE)
+                for row in cursor:
                     tokenAddress = row['tokenaddress']
                     pairAddress = row['pairaddress']
                     timeframe = row['timeframe']
                     timeframeId = row['timeframeid']
                     
                     # Initialize TrackedToken if not exists
-                    if tokenAddress not in trackedTokens:
-                        trackedTokens[tokenAddress] = TrackedToken(
+                    trackedToken = trackedTokens.get(tokenAddress)
+                    if trackedToken is None:
+                        trackedToken = trackedTokens[tokenAddress] = TrackedToken(
                             trackedTokenId=0,
                             tokenAddress=tokenAddress,
                             symbol=row['symbol'],
@@ -2065,12 +2849,8 @@ class TradingHandler(BaseDBHandler):
                             addedBy='scheduler'
                         )
                     
-                    trackedToken = trackedTokens[tokenAddress]
-                    
                     # Find or create TimeframeRecord
-                    timeframeRecord = next(
-                        (tr for tr in trackedToken.timeframeRecords if tr.timeframe == timeframe), None
-                    )
+                    timeframeRecord = timeframeRecords.get((tokenAddress, timeframe))
                     
                     if not timeframeRecord:
                         timeframeRecord = TimeframeRecord(
@@ -2082,11 +2862,13 @@ class TradingHandler(BaseDBHandler):
                             lastFetchedAt=row['lastfetchedat']
                         )
                         trackedToken.timeframeRecords.append(timeframeRecord)
+                        timeframeRecords[(tokenAddress, timeframe)] = timeframeRecord
                         
                         # Create RSI state
-                        rsiValues = json.loads(row['rsivalues']) if row['rsivalues'] else []
-                        stochRSIValues = json.loads(row['stochrsivalues']) if row['stochrsivalues'] else []
-                        kValues = json.loads(row['kvalues']) if row['kvalues'] else []
+                        # float8[] columns come back as Python lists - no JSON decode
+                        rsiValues = row['rsivalues'] or []
+                        stochRSIValues = row['stochrsivalues'] or []
+                        kValues = row['kvalues'] or []
                         
                         timeframeRecord.rsiState = RSIState(
                             tokenAddress=tokenAddress,
@@ -2114,27 +2896,24 @@ class TradingHandler(BaseDBHandler):
                         )
                         
                         # Initialize seen candles tracker
-                        if tokenAddress not in seenCandles:
-                            seenCandles[tokenAddress] = {}
-                        if timeframe not in seenCandles[tokenAddress]:
-                            seenCandles[tokenAddress][timeframe] = set()
+                        seenCandles[(tokenAddress, timeframe)] = set()
                     
                     # Add candle data if present and not duplicate
                     candleUnixTime = row['candle_unixtime']
-                    if candleUnixTime and candleUnixTime not in seenCandles[tokenAddress][timeframe]:
+                    if candleUnixTime and candleUnixTime not in seenCandles[(tokenAddress, timeframe)]:
                         ohlcvDetail = OHLCVDetails(
                             timeframeId=timeframeId,
                             tokenAddress=tokenAddress,
                             pairAddress=pairAddress,
                             timeframe=timeframe,
                             unixTime=candleUnixTime,
-                            closePrice=float(row['candle_closeprice']),
-                            highPrice=float(row['candle_highprice']),
-                            lowPrice=float(row['candle_lowprice']),
-                            volume=float(row['candle_volume'])
+                            closePrice=row['candle_closeprice'],
+                            highPrice=row['candle_highprice'],
+                            lowPrice=row['candle_lowprice'],
+                            volume=row['candle_volume']
                         )
                         timeframeRecord.addOHLCVDetail(ohlcvDetail)
-                        seenCandles[tokenAddress][timeframe].add(candleUnixTime)
+                        seenCandles[(tokenAddress, timeframe)].add(candleUnixTime)
                 
                 logger.info(f"TRADING SCHEDULER :: getting all RSI data for scheduler completed")
                 return list(trackedTokens.values())
@@ -2167,9 +2946,6 @@ class TradingHandler(BaseDBHandler):
             with self.conn_manager.transaction() as cursor:
                 rsiStateData = []
                 rsiCandleUpdates = []
-                stochRSICandleUpdates = []
-                stochRSIKCandleUpdates = []
-                stochRSIDCandleUpdates = []
                 
                 for trackedToken in trackedTokens:
                     for timeframeRecord in trackedToken.timeframeRecords:
@@ -2189,13 +2965,13 @@ class TradingHandler(BaseDBHandler):
                                 rsiState.lastClosePrice,
                                 rsiState.stochRSIInterval,
                                 rsiState.stochRSIValue,
-                                json.dumps(rsiState.rsiValues),
+                                list(rsiState.rsiValues),
                                 rsiState.kInterval,
                                 rsiState.kValue,
-                                json.dumps(rsiState.stochRSIValues),
+                                list(rsiState.stochRSIValues),
                                 rsiState.dInterval,
                                 rsiState.dValue,
-                                json.dumps(rsiState.kValues),
+                                list(rsiState.kValues),
                                 rsiState.lastUpdatedUnix,
                                 rsiState.nextFetchTime,
                                 rsiState.pairCreatedTime,
@@ -2203,60 +2979,19 @@ class TradingHandler(BaseDBHandler):
                             ))
                             totalRSIStatesUpdated += 1
                             
-                            # Collect RSI candle updates
-                            for candle in timeframeRecord.ohlcvDetails:
-                                if candle.rsiValue is not None:
-                                    rsiCandleUpdates.append((
-                                        candle.rsiValue,
-                                        candle.tokenAddress,
-                                        candle.timeframe,
-                                        candle.unixTime
-                                    ))
-                                
-                                if candle.stochRSIValue is not None:
-                                    stochRSICandleUpdates.append((
-                                        candle.stochRSIValue,
-                                        candle.tokenAddress,
-                                        candle.timeframe,
-                                        candle.unixTime
-                                    ))
-                                
-                                if candle.stochRSIK is not None:
-                                    stochRSIKCandleUpdates.append((
-                                        candle.stochRSIK,
-                                        candle.tokenAddress,
-                                        candle.timeframe,
-                                        candle.unixTime
-                                    ))
-                                
-                                if candle.stochRSID is not None:
-                                    stochRSIDCandleUpdates.append((
-                                        candle.stochRSID,
-                                        candle.tokenAddress,
-                                        candle.timeframe,
-                                        candle.unixTime
-                                    ))
+                            # Collect RSI candle updates - one row per candle carrying all four values
+                            rsiCandleUpdates.extend(
+                                row for row in map(_RSI_CANDLE_ROW, timeframeRecord.ohlcvDetails)
+                                if row[3] is not None or row[4] is not None or row[5] is not None or row[6] is not None
+                            )
                 
                 # Execute RSI batch operations
                 if rsiStateData:
                     self.batchInsertRSIStates(cursor, rsiStateData)
                 
-                # OPTIMIZED: Use temporary tables for candle updates
                 if rsiCandleUpdates:
-                    self.batchUpdateCandlesWithTempTable(cursor, rsiCandleUpdates, 'rsivalue')
-                    logger.info(f"Optimized batch updated {len(rsiCandleUpdates)} RSI candle values")
-                
-                if stochRSICandleUpdates:
-                    self.batchUpdateCandlesWithTempTable(cursor, stochRSICandleUpdates, 'stochrsivalue')
-                    logger.info(f"Optimized batch updated {len(stochRSICandleUpdates)} Stochastic RSI candle values")
-                
-                if stochRSIKCandleUpdates:
-                    self.batchUpdateCandlesWithTempTable(cursor, stochRSIKCandleUpdates, 'stochrsik')
-                    logger.info(f"Optimized batch updated {len(stochRSIKCandleUpdates)} Stochastic RSI %K candle values")
-                
-                if stochRSIDCandleUpdates:
-                    self.batchUpdateCandlesWithTempTable(cursor, stochRSIDCandleUpdates, 'stochrsid')
-                    logger.info(f"Optimized batch updated {len(stochRSIDCandleUpdates)} Stochastic RSI %D candle values")
+                    self.batchUpdateRSICandleValues(cursor, rsiCandleUpdates)
+                    logger.info(f"Batch updated {len(rsiCandleUpdates)} RSI / Stochastic RSI candles")
                 
                 logger.info(f"TRADING SCHEDULER :: Transaction completed to persist RSI data")
                 return totalRSIStatesUpdated
@@ -2268,139 +3003,405 @@ class TradingHandler(BaseDBHandler):
     def batchUpdateTimeframeMetadata(self, cursor, timeframeMetadataData: List[Tuple]):
         """Batch update timeframe metadata"""
         logger.info(f"TRADING SCHEDULER :: DB call to update timeframe metadata - started")
-        cursor.executemany("""
-            INSERT INTO timeframemetadata 
-            (tokenaddress, pairaddress, timeframe, lastfetchedat, nextfetchat, createdat, lastupdatedat)
-            VALUES (%s, %s, %s, %s, %s, NOW(), NOW())
-            ON CONFLICT (tokenaddress, pairaddress, timeframe) 
-            DO UPDATE SET 
-                lastfetchedat = EXCLUDED.lastfetchedat,
-                nextfetchat = EXCLUDED.nextfetchat,
-                lastupdatedat = NOW()
-        """, timeframeMetadataData)
+        # A single upsert statement cannot touch the same row twice - keep the last row per key
+        uniqueRows = list({(row[0], row[1], row[2]): row for row in timeframeMetadataData}.values())
+        # Only fall back to the upsert when some (token, pair, timeframe) row does not exist yet
+        if uniqueRows and self.batchUpdateTimeframeFetchStatus(cursor, uniqueRows) < len(uniqueRows):
+            self.conn_manager.execute_prepared(cursor, 'tmeta_upsert', _SQL_UPSERT_TIMEFRAME_METADATA,
+                                               self._columnArrays(uniqueRows))
         logger.info(f"TRADING SCHEDULER :: DB call to update timeframe metadata - completed")
 
+    def batchUpdateTimeframeFetchStatus(self, cursor, fetchStatusRows: List[Tuple]) -> int:
+        """
+        Advance lastfetchedat / nextfetchat of existing timeframe metadata rows in one UPDATE
+
+        Args:
+            cursor: Database cursor
+            fetchStatusRows: (tokenaddress, pairaddress, timeframe, lastfetchedat, nextfetchat) tuples,
+                one per key
+
+        Returns:
+            int: Number of rows updated
+        """
+        self.conn_manager.execute_prepared(cursor, 'tmeta_fetch_status', _SQL_UPDATE_TIMEFRAME_FETCH_STATUS,
+                                           self._columnArrays(fetchStatusRows))
+        return cursor.rowcount
+
     def batchInsertCandles(self, cursor, candleData: List[Tuple]):
-        """Batch insert candles with indicator values"""
+        """
+        Batch insert candles with indicator values
+
+        Small batches go through a multi-row execute_values upsert; batches above
+        _CANDLE_INSERT_COPY_THRESHOLD are streamed with COPY into a staging table and
+        upserted from there in one INSERT ... SELECT.
+        """
         logger.info(f"TRADING SCHEDULER :: DB call to insert candles - started")
-        cursor.executemany("""
-            INSERT INTO ohlcvdetails 
-            (timeframeid, tokenaddress, pairaddress, timeframe, unixtime, timebucket, 
-             openprice, highprice, lowprice, closeprice, volume, trades,
-             vwapvalue, avwapvalue, ema12value, ema21value, ema34value, 
-             rsivalue, stochrsivalue, stochrsik, stochrsid,
-             trend, status, trend12, status12, iscomplete, datasource,
-             createdat, lastupdatedat)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-            ON CONFLICT (tokenaddress, timeframe, unixtime) 
-            DO UPDATE SET 
-                vwapvalue = EXCLUDED.vwapvalue,
-                avwapvalue = EXCLUDED.avwapvalue,
-                ema12value = EXCLUDED.ema12value,
-                ema21value = EXCLUDED.ema21value,
-                ema34value = EXCLUDED.ema34value,
-                rsivalue = EXCLUDED.rsivalue,
-                stochrsivalue = EXCLUDED.stochrsivalue,
-                stochrsik = EXCLUDED.stochrsik,
-                stochrsid = EXCLUDED.stochrsid,
-                trend = EXCLUDED.trend,
-                status = EXCLUDED.status,
-                trend12 = EXCLUDED.trend12,
-                status12 = EXCLUDED.status12,
-                lastupdatedat = NOW()
-        """, candleData)
+
+        # A single upsert statement cannot touch the same row twice - keep the last value per candle
+        uniqueCandles = list({(row[1], row[3], row[4]): row for row in candleData}.values())
+
+        if len(uniqueCandles) > _CANDLE_INSERT_COPY_THRESHOLD:
+            self._copyInsertCandles(cursor, uniqueCandles)
+        else:
+            execute_values(cursor, _SQL_UPSERT_CANDLES, uniqueCandles,
+                template=_OHLCV_VALUES_TEMPLATE,
+                page_size=_CANDLE_PAGE_SIZE)
         logger.info(f"TRADING SCHEDULER :: DB call to insert candles - completed")
 
+    def batchUpsertTimeframeMetadataAndCandles(self, cursor, timeframeMetadataData: List[Tuple],
+                                               candleData: List[Tuple]):
+        """
+        Upsert timeframe metadata and candles with one statement (one round trip)
+
+        Batches above _CANDLE_INSERT_COPY_THRESHOLD candles fall back to
+        batchUpdateTimeframeMetadata + batchInsertCandles, so large inserts still use COPY.
+
+        Args:
+            cursor: Database cursor
+            timeframeMetadataData: Same tuples as batchUpdateTimeframeMetadata
+            candleData: Same tuples as batchInsertCandles
+        """
+        if not timeframeMetadataData or not candleData or len(candleData) > _CANDLE_INSERT_COPY_THRESHOLD:
+            if timeframeMetadataData:
+                self.batchUpdateTimeframeMetadata(cursor, timeframeMetadataData)
+            if candleData:
+                self.batchInsertCandles(cursor, candleData)
+            return
+        
+        logger.info(f"TRADING SCHEDULER :: DB call to upsert timeframe metadata and candles - started")
+        # A single upsert statement cannot touch the same row twice - keep the last row per key
+        uniqueMetadata = list({(row[0], row[1], row[2]): row for row in timeframeMetadataData}.values())
+        uniqueCandles = list({(row[1], row[3], row[4]): row for row in candleData}.values())
+        cursor.execute(_SQL_UPSERT_TIMEFRAME_METADATA_AND_CANDLES, (
+            *self._columnArrays(uniqueMetadata),
+            self._mogrifyValues(cursor, _OHLCV_VALUES_TEMPLATE, uniqueCandles)
+        ))
+        logger.info(f"TRADING SCHEDULER :: DB call to upsert timeframe metadata and candles - completed")
+
+    def _copyInsertCandles(self, cursor, candleData: List[Tuple]):
+        """
+        Stream candles into a staging table with COPY and upsert them into ohlcvdetails
+
+        The staging table holds only the copied columns, typed like ohlcvdetails but without its
+        defaults and constraints - staged rows neither draw ids from the ohlcvdetails sequence
+        nor compute the generated timebucket.
+        """
+        logger.info(f"TRADING SCHEDULER :: COPY {len(candleData)} candles into staging table - started")
+        cursor.execute(f"""
+            CREATE TEMPORARY TABLE _stage_ohlcv ON COMMIT DROP AS
+            SELECT {_OHLCV_INSERT_COLUMNS} FROM ohlcvdetails WITH NO DATA
+        """)
+
+        self._copyCandleRowsInChunks(
+            cursor, f"COPY _stage_ohlcv ({_OHLCV_INSERT_COLUMNS}) FROM STDIN WITH (FORMAT CSV)", candleData
+        )
+
+        cursor.execute(_SQL_UPSERT_CANDLES_FROM_STAGE)
+        logger.info(f"TRADING SCHEDULER :: COPY {len(candleData)} candles into staging table - completed")
+
     def batchInsertVWAPSessions(self, cursor, vwapSessionData: List[Tuple]):
         """Batch insert/update VWAP sessions"""
         logger.info(f"TRADING SCHEDULER :: DB call to insert VWAP sessions - started")
-        cursor.executemany("""
-            INSERT INTO vwapsessions 
-            (tokenaddress, pairaddress, timeframe, sessionstartunix, sessionendunix,
-             cumulativepv, cumulativevolume, currentvwap, lastcandleunix, nextcandlefetch,
-             createdat, lastupdatedat)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-            ON CONFLICT (tokenaddress, timeframe) 
-            DO UPDATE SET 
-                sessionstartunix = EXCLUDED.sessionstartunix,
-                sessionendunix = EXCLUDED.sessionendunix,
-                cumulativepv = EXCLUDED.cumulativepv,
-                cumulativevolume = EXCLUDED.cumulativevolume,
-                currentvwap = EXCLUDED.currentvwap,
-                lastcandleunix = EXCLUDED.lastcandleunix,
-                nextcandlefetch = EXCLUDED.nextcandlefetch,
-                lastupdatedat = NOW()
-        """, vwapSessionData)
+        # A single upsert statement cannot touch the same row twice - keep the last row per key
+        uniqueRows = list({(row[0], row[2]): row for row in vwapSessionData}.values())
+        execute_values(cursor, _SQL_UPSERT_VWAP_SESSIONS, uniqueRows,
+            template=_VWAP_SESSION_VALUES_TEMPLATE,
+            page_size=_STATE_PAGE_SIZE)
         logger.info(f"TRADING SCHEDULER :: DB call to insert VWAP sessions - completed")
 
+    def batchUpsertVWAPSessionsAndCandleValues(self, cursor, vwapSessionData: List[Tuple],
+                                               vwapCandleUpdates: List[Tuple]):
+        """
+        Upsert VWAP sessions and update candle vwapvalue with one statement (one round trip)
+
+        Batches above _CANDLE_COPY_THRESHOLD candles fall back to batchInsertVWAPSessions +
+        batchUpdateCandleValues, so large updates still go through the COPY staging table.
+
+        Args:
+            cursor: Database cursor
+            vwapSessionData: Same tuples as batchInsertVWAPSessions
+            vwapCandleUpdates: Same tuples as batchUpdateCandleValues
+        """
+        if not vwapSessionData or not vwapCandleUpdates or len(vwapCandleUpdates) > _CANDLE_COPY_THRESHOLD:
+            if vwapSessionData:
+                self.batchInsertVWAPSessions(cursor, vwapSessionData)
+            if vwapCandleUpdates:
+                self.batchUpdateCandleValues(cursor, vwapCandleUpdates, 'vwapvalue')
+            return
+
+        logger.info(f"TRADING SCHEDULER :: DB call to upsert VWAP sessions and candle values - started")
+        # A single upsert statement cannot touch the same row twice - keep the last row per key
+        uniqueSessions = list({(row[0], row[2]): row for row in vwapSessionData}.values())
+        cursor.execute(_SQL_UPSERT_VWAP_SESSIONS_AND_CANDLES, (
+            self._mogrifyValues(cursor, _VWAP_SESSION_VALUES_TEMPLATE, uniqueSessions),
+            self._mogrifyValues(cursor, _CANDLE_VALUE_VALUES_TEMPLATE, sorted(vwapCandleUpdates, key=itemgetter(1, 2, 3)))
+        ))
+        logger.info(f"TRADING SCHEDULER :: DB call to upsert VWAP sessions and candle values - completed")
+
     def batchInsertEMAStates(self, cursor, emaStateData: List[Tuple]):
         """Batch insert/update EMA states"""
         logger.info(f"TRADING SCHEDULER :: DB call to insert EMA states - started")
-        cursor.executemany("""
-            INSERT INTO emastates 
-            (tokenaddress, pairaddress, timeframe, emakey, emavalue, 
-             lastupdatedunix, nextfetchtime, emaavailabletime, paircreatedtime, status,
-             createdat, lastupdatedat)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-            ON CONFLICT (tokenaddress, timeframe, emakey) 
-            DO UPDATE SET 
-                emavalue = EXCLUDED.emavalue,
-                lastupdatedunix = EXCLUDED.lastupdatedunix,
-                nextfetchtime = EXCLUDED.nextfetchtime,
-                status = EXCLUDED.status,
-                lastupdatedat = NOW()
-        """, emaStateData)
+        # A single upsert statement cannot touch the same row twice - keep the last row per key
+        uniqueRows = list({(row[0], row[2], row[3]): row for row in emaStateData}.values())
+        execute_values(cursor, _SQL_UPSERT_EMA_STATES, uniqueRows,
+            template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())",
+            page_size=_STATE_PAGE_SIZE)
         logger.info(f"TRADING SCHEDULER :: DB call to insert EMA states - completed")
 
+    def batchUpdateEMAStates(self, cursor, emaStateData: List[Tuple]):
+        """
+        Batch update existing EMA states with a single UPDATE ... FROM (VALUES ...) statement
+
+        Args:
+            cursor: Database cursor
+            emaStateData: Same tuples as batchInsertEMAStates
+                (tokenAddress, pairAddress, timeframe, emaKey, emaValue, lastUpdatedUnix,
+                 nextFetchTime, emaAvailableTime, pairCreatedTime, status)
+        """
+        logger.info(f"TRADING SCHEDULER :: DB call to update EMA states - started")
+        execute_values(cursor, _SQL_UPDATE_EMA_STATES.format(source=_EMA_STATE_VALUES_SOURCE),
+                       self._emaStateUpdateRows(emaStateData),
+                       template=_EMA_STATE_VALUES_TEMPLATE,
+                       page_size=_STATE_PAGE_SIZE)
+        logger.info(f"TRADING SCHEDULER :: DB call to update EMA states - completed")
+
+    def _emaStateUpdateRows(self, emaStateData: List[Tuple]) -> List[Tuple]:
+        """Project EMA state tuples onto the in-place UPDATE columns, one row per key in key order"""
+        # UPDATE ... FROM applies an arbitrary row when a key repeats - keep the last row per key
+        uniqueRows = {(row[0], row[2], row[3]): row for row in emaStateData}.values()
+        return sorted((
+            (tokenAddress, timeframe, emaKey, emaValue, lastUpdatedUnix, nextFetchTime, status)
+            for (tokenAddress, _, timeframe, emaKey, emaValue, lastUpdatedUnix,
+                 nextFetchTime, _, _, status) in uniqueRows
+        ), key=itemgetter(0, 1, 2))
+
+    def batchUpdateEMACandleValues(self, cursor, emaCandleUpdates: List[Tuple]):
+        """
+        Batch update EMA12/21/34 candle values with a single UPDATE ... FROM statement
+
+        Rows come from a VALUES list, or from a COPY-loaded staging table for batches
+        above _CANDLE_COPY_THRESHOLD.
+
+        Args:
+            cursor: Database cursor
+            emaCandleUpdates: List of tuples (tokenAddress, timeframe, unixTime, ema12Value, ema21Value, ema34Value);
+                None leaves that period's stored value unchanged
+        """
+        logger.info(f"TRADING SCHEDULER :: DB call to update EMA candle values - started")
+        # Key order makes consecutive rows hit the same index leaf and heap pages
+        emaCandleUpdates = sorted(emaCandleUpdates, key=itemgetter(0, 1, 2))
+        if len(emaCandleUpdates) > _CANDLE_COPY_THRESHOLD:
+            self._copyCandleUpdatesToStage(cursor, '_stage_ema_updates', """
+                tokenaddress CHAR(44), timeframe VARCHAR(10), unixtime BIGINT,
+                ema12value DOUBLE PRECISION, ema21value DOUBLE PRECISION, ema34value DOUBLE PRECISION
+            """, emaCandleUpdates)
+            # Apply and drop the stage in one round trip
+            cursor.execute(_SQL_UPDATE_EMA_CANDLES.format(source="_stage_ema_updates v") + "; DROP TABLE _stage_ema_updates")
+        else:
+            execute_values(cursor, _SQL_UPDATE_EMA_CANDLES.format(source=_EMA_CANDLE_VALUES_SOURCE),
+                           emaCandleUpdates,
+                           template=_EMA_CANDLE_VALUES_TEMPLATE,
+                           page_size=_CANDLE_PAGE_SIZE)
+        logger.info(f"TRADING SCHEDULER :: DB call to update EMA candle values - completed")
+
+    def batchUpdateEMAStatesAndCandleValues(self, cursor, emaStateData: List[Tuple], emaCandleUpdates: List[Tuple]):
+        """
+        Update EMA states and EMA candle values with one statement (one plan, one round trip)
+
+        Both VALUES lists are inlined into a single data-modifying CTE, so batches above
+        _CANDLE_COPY_THRESHOLD candles fall back to batchUpdateEMAStates +
+        batchUpdateEMACandleValues, which page and COPY them.
+
+        Args:
+            cursor: Database cursor
+            emaStateData: Same tuples as batchUpdateEMAStates
+            emaCandleUpdates: Same tuples as batchUpdateEMACandleValues
+        """
+        if not emaStateData or not emaCandleUpdates or len(emaCandleUpdates) > _CANDLE_COPY_THRESHOLD:
+            if emaStateData:
+                self.batchUpdateEMAStates(cursor, emaStateData)
+            if emaCandleUpdates:
+                self.batchUpdateEMACandleValues(cursor, emaCandleUpdates)
+            return
+        
+        logger.info(f"TRADING SCHEDULER :: DB call to update EMA states and candle values - started")
+        cursor.execute(_SQL_UPDATE_EMA_STATES_AND_CANDLES, (
+            self._mogrifyValues(cursor, _EMA_STATE_VALUES_TEMPLATE, self._emaStateUpdateRows(emaStateData)),
+            self._mogrifyValues(cursor, _EMA_CANDLE_VALUES_TEMPLATE, sorted(emaCandleUpdates, key=itemgetter(0, 1, 2)))
+        ))
+        logger.info(f"TRADING SCHEDULER :: DB call to update EMA states and candle values - completed")
+
+    def _mogrifyValues(self, cursor, template: str, rows: List[Tuple]) -> AsIs:
+        """Render rows as a VALUES list for statements that inline more than one list (execute_values takes one)"""
+        values = b','.join(cursor.mogrify(template, row) for row in rows)
+        return AsIs(values.decode(encodings[cursor.connection.encoding]))
+
+    def _columnArrays(self, rows: List[Tuple]) -> List[list]:
+        """Transpose rows into one list per column for unnest(%s::type[], ...) parameters"""
+        return [list(column) for column in zip(*rows)]
+
+    def batchUpdateRSICandleValues(self, cursor, rsiCandleUpdates: List[Tuple]):
+        """
+        Batch update RSI, Stochastic RSI, %K and %D candle values with a single UPDATE ... FROM statement
+
+        Rows come from a VALUES list, or from a COPY-loaded staging table for batches
+        above _CANDLE_COPY_THRESHOLD.
+
+        Args:
+            cursor: Database cursor
+            rsiCandleUpdates: List of tuples (tokenAddress, timeframe, unixTime, rsiValue, stochRSIValue, stochRSIK, stochRSID);
+                None leaves that stored value unchanged
+        """
+        logger.info(f"TRADING SCHEDULER :: DB call to update RSI candle values - started")
+        # Key order makes consecutive rows hit the same index leaf and heap pages
+        rsiCandleUpdates = sorted(rsiCandleUpdates, key=itemgetter(0, 1, 2))
+        if len(rsiCandleUpdates) > _CANDLE_COPY_THRESHOLD:
+            self._copyCandleUpdatesToStage(cursor, '_stage_rsi_updates', """
+                tokenaddress CHAR(44), timeframe VARCHAR(10), unixtime BIGINT,
+                rsivalue DOUBLE PRECISION, stochrsivalue DOUBLE PRECISION,
+                stochrsik DOUBLE PRECISION, stochrsid DOUBLE PRECISION
+            """, rsiCandleUpdates)
+            # Apply and drop the stage in one round trip
+            cursor.execute(_SQL_UPDATE_RSI_CANDLES.format(source="_stage_rsi_updates v") + "; DROP TABLE _stage_rsi_updates")
+        else:
+            execute_values(cursor, _SQL_UPDATE_RSI_CANDLES.format(
+                source="(VALUES %s) AS v(tokenaddress, timeframe, unixtime, rsivalue, stochrsivalue, stochrsik, stochrsid)"
+            ), rsiCandleUpdates,
+                template="(%s::char(44), %s, %s::bigint, %s::double precision, %s::double precision, %s::double precision, %s::double precision)",
+                page_size=_CANDLE_PAGE_SIZE)
+        logger.info(f"TRADING SCHEDULER :: DB call to update RSI candle values - completed")
+
+    def batchUpdateCandleValues(self, cursor, candleUpdates: List[Tuple], columnName: str):
+        """
+        Batch update one numeric candle column with a single UPDATE ... FROM statement
+
+        Rows come from a VALUES list, or from a COPY-loaded staging table for batches
+        above _CANDLE_COPY_THRESHOLD.
+
+        Args:
+            cursor: Database cursor
+            candleUpdates: List of tuples (value, tokenAddress, timeframe, unixTime)
+            columnName: Column name to update, one of _CANDLE_VALUE_COLUMN_TYPES
+        """
+        logger.info(f"TRADING SCHEDULER :: DB call to update candle {columnName} - started")
+        # Key order makes consecutive rows hit the same index leaf and heap pages
+        candleUpdates = sorted(candleUpdates, key=itemgetter(1, 2, 3))
+        columnType = _CANDLE_VALUE_COLUMN_TYPES[columnName]
+        if len(candleUpdates) > _CANDLE_COPY_THRESHOLD:
+            self._copyCandleUpdatesToStage(cursor, '_stage_candle_updates', """
+                value DOUBLE PRECISION, tokenaddress CHAR(44), timeframe VARCHAR(10), unixtime BIGINT
+            """, candleUpdates)
+            # Apply and drop the stage in one round trip
+            cursor.execute(_SQL_UPDATE_CANDLE_VALUE.format(column=columnName, columnType=columnType,
+                                                           source="_stage_candle_updates v")
+                           + "; DROP TABLE _stage_candle_updates")
+        else:
+            execute_values(cursor, _SQL_UPDATE_CANDLE_VALUE.format(
+                column=columnName, columnType=columnType, source=_CANDLE_VALUE_VALUES_SOURCE
+            ), candleUpdates,
+                template=_CANDLE_VALUE_VALUES_TEMPLATE,
+                page_size=_CANDLE_PAGE_SIZE)
+        logger.info(f"TRADING SCHEDULER :: DB call to update candle {columnName} - completed")
+
+    def _copyCandleUpdatesToStage(self, cursor, stageTable: str, columnDefinitions: str, candleUpdates: List[Tuple]):
+        """Stream candle update rows into a transaction-scoped staging table with COPY"""
+        logger.info(f"TRADING SCHEDULER :: COPY {len(candleUpdates)} candle updates into {stageTable} - started")
+        cursor.execute(f"""
+            CREATE TEMPORARY TABLE {stageTable} ({columnDefinitions}) ON COMMIT DROP
+        """)
+
+        self._copyRowsInChunks(cursor, f"COPY {stageTable} FROM STDIN WITH (FORMAT CSV)", candleUpdates)
+        logger.info(f"TRADING SCHEDULER :: COPY {len(candleUpdates)} candle updates into {stageTable} - completed")
+
+    def _copyRowsInChunks(self, cursor, copySql: str, rows: List[Tuple]):
+        """
+        COPY rows in chunks of _CANDLE_COPY_CHUNK_ROWS so only one chunk of CSV text is held in memory
+
+        None is written as an empty unquoted field, which CSV COPY reads as NULL.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for start in range(0, len(rows), _CANDLE_COPY_CHUNK_ROWS):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(rows[start:start + _CANDLE_COPY_CHUNK_ROWS])
+            buffer.seek(0)
+            cursor.copy_expert(copySql, buffer)
+
+    def _copyCandleRowsInChunks(self, cursor, copySql: str, candleData: List[Tuple]):
+        """
+        COPY candle insert rows like _copyRowsInChunks, encoding each timeframe's shared columns once
+
+        Rows are built per timeframe record, so rows sharing _CANDLE_ROW_PREFIX are contiguous. The
+        prefix is rendered to CSV text once per group; only the per-candle columns go through the
+        writer for every row.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        prefixBuffer = io.StringIO()
+        prefixWriter = csv.writer(prefixBuffer, lineterminator=',')
+        bufferedRows = 0
+        for prefix, groupRows in groupby(candleData, key=_CANDLE_ROW_PREFIX):
+            prefixBuffer.seek(0)
+            prefixBuffer.truncate()
+            prefixWriter.writerow(prefix)
+            prefixText = prefixBuffer.getvalue()
+
+            for row in groupRows:
+                buffer.write(prefixText)
+                writer.writerow(row[4:])
+                bufferedRows += 1
+                if bufferedRows == _CANDLE_COPY_CHUNK_ROWS:
+                    buffer.seek(0)
+                    cursor.copy_expert(copySql, buffer)
+                    buffer.seek(0)
+                    buffer.truncate()
+                    bufferedRows = 0
+
+        if bufferedRows:
+            buffer.seek(0)
+            cursor.copy_expert(copySql, buffer)
+
     def batchInsertRSIStates(self, cursor, rsiStateData: List[Tuple]):
         """Batch insert/update RSI states"""
         logger.info(f"TRADING SCHEDULER :: DB call to insert RSI states - started")
-        cursor.executemany("""
-            INSERT INTO rsistates 
-            (tokenaddress, pairaddress, timeframe, rsiinterval, rsiavailabletime, 
-             rsivalue, avggain, avgloss, lastcloseprice, stochrsiinterval, stochrsivalue, rsivalues,
-             kinterval, kvalue, stochrsivalues, dinterval, dvalue, kvalues,
-             lastupdatedunix, nextfetchtime, paircreatedtime, status,
-             createdat, lastupdatedat)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-            ON CONFLICT (tokenaddress, pairaddress, timeframe) 
-            DO UPDATE SET 
-                rsivalue = EXCLUDED.rsivalue,
-                avggain = EXCLUDED.avggain,
-                avgloss = EXCLUDED.avgloss,
-                lastcloseprice = EXCLUDED.lastcloseprice,
-                stochrsivalue = EXCLUDED.stochrsivalue,
-                rsivalues = EXCLUDED.rsivalues,
-                kvalue = EXCLUDED.kvalue,
-                stochrsivalues = EXCLUDED.stochrsivalues,
-                dvalue = EXCLUDED.dvalue,
-                kvalues = EXCLUDED.kvalues,
-                lastupdatedunix = EXCLUDED.lastupdatedunix,
-                nextfetchtime = EXCLUDED.nextfetchtime,
-                status = EXCLUDED.status,
-                lastupdatedat = NOW()
-        """, rsiStateData)
+        # Only the last row per conflict key survives the upserts - skip the redundant ones
+        uniqueRows = list({(row[0], row[1], row[2]): row for row in rsiStateData}.values())
+        # One row per statement - prepared once per connection instead of parsed per row
+        self.conn_manager.execute_batch_prepared(cursor, 'rsi_state_upsert', _SQL_UPSERT_RSI_STATE, uniqueRows, page_size=500)
         logger.info(f"TRADING SCHEDULER :: DB call to insert RSI states - completed")
     
     def batchInsertAVWAPStates(self, cursor, avwapStateData: List[Tuple]):
         """Batch insert/update AVWAP states"""
         logger.info(f"TRADING SCHEDULER :: DB call to insert AVWAP states - started")
-        cursor.executemany("""
-            INSERT INTO avwapstates 
-            (tokenaddress, pairaddress, timeframe, avwap, cumulativepv, cumulativevolume, 
-             lastupdatedunix, nextfetchtime, createdat, lastupdatedat)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-            ON CONFLICT (tokenaddress, timeframe) 
-            DO UPDATE SET 
-                avwap = EXCLUDED.avwap,
-                cumulativepv = EXCLUDED.cumulativepv,
-                cumulativevolume = EXCLUDED.cumulativevolume,
-                lastupdatedunix = EXCLUDED.lastupdatedunix,
-                nextfetchtime = EXCLUDED.nextfetchtime,
-                lastupdatedat = NOW()
-        """, avwapStateData)
+        # A single upsert statement cannot touch the same row twice - keep the last row per key
+        uniqueRows = list({(row[0], row[2]): row for row in avwapStateData}.values())
+        execute_values(cursor, _SQL_UPSERT_AVWAP_STATES, uniqueRows,
+            template="(%s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())",
+            page_size=_STATE_PAGE_SIZE)
         logger.info(f"TRADING SCHEDULER :: DB call to insert AVWAP states - completed")
     
+    def batchUpdateAVWAPStates(self, cursor, avwapStateData: List[Tuple]):
+        """
+        Batch update existing AVWAP states with a single UPDATE ... FROM (VALUES ...) statement
+
+        Plain UPDATE skips the speculative index insertion of INSERT ... ON CONFLICT; use
+        batchInsertAVWAPStates when rows may not exist yet.
+
+        Args:
+            cursor: Database cursor
+            avwapStateData: Same tuples as batchInsertAVWAPStates
+                (tokenAddress, pairAddress, timeframe, avwap, cumulativePV, cumulativeVolume,
+                 lastUpdatedUnix, nextFetchTime)
+        """
+        logger.info(f"TRADING SCHEDULER :: DB call to update AVWAP states - started")
+        # UPDATE ... FROM applies an arbitrary row when a key repeats - keep the last row per key
+        uniqueRows = sorted({(row[0], row[2]): row for row in avwapStateData}.values(), key=itemgetter(0, 2))
+        execute_values(cursor, _SQL_UPDATE_AVWAP_STATES, uniqueRows,
+            template="(%s::char(44), %s, %s, %s::numeric, %s::numeric, %s::numeric, %s::bigint, %s::bigint)",
+            page_size=_STATE_PAGE_SIZE)
+        logger.info(f"TRADING SCHEDULER :: DB call to update AVWAP states - completed")
+
     def createInitialAlerts(self, tokenId: int, tokenAddress: str, pairAddress: str, 
                            timeframes: List[str]) -> bool:
         """
@@ -2429,13 +3430,14 @@ class TradingHandler(BaseDBHandler):
                         'NEUTRAL'
                     ))
                 
-                cursor.executemany("""
+                execute_values(cursor, """
                     INSERT INTO alerts 
                     (tokenid, tokenaddress, pairaddress, timeframe, trend, trend12,
                      touchcount, createdat, lastupdatedat)
-                    VALUES (%s, %s, %s, %s, %s, %s, 0, NOW(), NOW())
+                    VALUES %s
                     ON CONFLICT (tokenaddress, timeframe) DO NOTHING
-                """, alertData)
+                """, alertData,
+                    template="(%s, %s, %s, %s, %s, %s, 0, NOW(), NOW())")
                 
                 logger.info(f"TRADING API :: Created {len(alertData)} initial alerts for token {tokenAddress}")
                 return True
@@ -2509,38 +3511,9 @@ class TradingHandler(BaseDBHandler):
                                         candle.unixTime
                                     ))
                 
-                # Execute alert updates
+                # Execute alert updates - prepared once per connection instead of parsed per row
                 if alertData:
-                    cursor.executemany("""
-                        INSERT INTO alerts 
-                        (tokenid, tokenaddress, pairaddress, timeframe, vwap, ema12, ema21, ema34, avwap,
-                         rsivalue, stochrsivalue, stochrsik, stochrsid, avwappriceposition,
-                         lastupdatedunix, trend, status, trend12, status12, touchcount, latesttouchunix,
-                         touchcount12, latesttouchunix12, createdat, lastupdatedat)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-                        ON CONFLICT (tokenaddress, timeframe) 
-                        DO UPDATE SET 
-                            vwap = EXCLUDED.vwap,
-                            ema12 = EXCLUDED.ema12,
-                            ema21 = EXCLUDED.ema21,
-                            ema34 = EXCLUDED.ema34,
-                            avwap = EXCLUDED.avwap,
-                            rsivalue = EXCLUDED.rsivalue,
-                            stochrsivalue = EXCLUDED.stochrsivalue,
-                            stochrsik = EXCLUDED.stochrsik,
-                            stochrsid = EXCLUDED.stochrsid,
-                            avwappriceposition = EXCLUDED.avwappriceposition,
-                            lastupdatedunix = EXCLUDED.lastupdatedunix,
-                            trend = EXCLUDED.trend,
-                            status = EXCLUDED.status,
-                            trend12 = EXCLUDED.trend12,
-                            status12 = EXCLUDED.status12,
-                            touchcount = EXCLUDED.touchcount,
-                            latesttouchunix = EXCLUDED.latesttouchunix,
-                            touchcount12 = EXCLUDED.touchcount12,
-                            latesttouchunix12 = EXCLUDED.latesttouchunix12,
-                            lastupdatedat = NOW()
-                    """, alertData)
+                    self.conn_manager.execute_batch_prepared(cursor, 'alert_upsert', _SQL_UPSERT_ALERT, alertData, page_size=500)
                 
                 # Update candle trend/status using optimized temporary table method
                 if candleTrendStatusUpdates:
@@ -2561,111 +3534,28 @@ class TradingHandler(BaseDBHandler):
         try:
             logger.info(f"TRADING SCHEDULER :: Fetching alert state and new candles started")
             
-            with self.conn_manager.transaction() as cursor:
-                # Build where clause
-                whereClause = "WHERE tt.status = 1"
-                params = []
-                if tokenAddress:
-                    whereClause += " AND tt.tokenaddress = %s"
-                    params.append(tokenAddress)
-                
+            # Stream rows from a server-side cursor - one row per candle across all alerts
+            with self.conn_manager.server_cursor('alerts_sched_cur') as cursor:
                 # Get alerts and candles for processing
-                query = text(f"""
-                    WITH alert_data AS (
-                        SELECT 
-                            a.alertid,
-                            a.tokenid,
-                            a.tokenaddress,
-                            a.pairaddress,
-                            a.timeframe,
-                            a.vwap as alert_vwap,
-                            a.ema12 as alert_ema12,
-                            a.ema21 as alert_ema21,
-                            a.ema34 as alert_ema34,
-                            a.avwap as alert_avwap,
-                            a.rsivalue as alert_rsivalue,
-                            a.stochrsivalue as alert_stochrsivalue,
-                            a.stochrsik as alert_stochrsik,
-                            a.stochrsid as alert_stochrsid,
-                            a.avwappriceposition as alert_avwappriceposition,
-                            a.lastupdatedunix,
-                            a.trend as alert_trend,
-                            a.status as alert_status,
-                            a.trend12 as alert_trend12,
-                            a.status12 as alert_status12,
-                            a.touchcount,
-                            a.latesttouchunix,
-                            a.touchcount12,
-                            a.latesttouchunix12,
-                            tt.trackedtokenid,
-                            tt.symbol,
-                            tt.name,
-                            tm.id as timeframeid,
-                            tm.lastfetchedat,
-                            es12.emaavailabletime as ema12availabletime,
-                            es21.emaavailabletime as ema21availabletime,
-                            es34.emaavailabletime as ema34availabletime
-                        FROM alerts a
-                        INNER JOIN trackedtokens tt ON a.tokenid = tt.trackedtokenid
-                        INNER JOIN timeframemetadata tm ON a.tokenaddress = tm.tokenaddress 
-                            AND a.timeframe = tm.timeframe
-                        LEFT JOIN emastates es12 ON a.tokenaddress = es12.tokenaddress 
-                            AND a.timeframe = es12.timeframe AND es12.emakey = '12'
-                        LEFT JOIN emastates es21 ON a.tokenaddress = es21.tokenaddress 
-                            AND a.timeframe = es21.timeframe AND es21.emakey = '21'
-                        LEFT JOIN emastates es34 ON a.tokenaddress = es34.tokenaddress 
-                            AND a.timeframe = es34.timeframe AND es34.emakey = '34'
-                        {whereClause}
-                    )
-                    SELECT 
-                        ad.*,
-                        o.unixtime,
-                        o.timebucket,
-                        o.openprice,
-                        o.highprice,
-                        o.lowprice,
-                        o.closeprice,
-                        o.volume,
-                        o.trades,
-                        o.vwapvalue,
-                        o.avwapvalue,
-                        o.ema12value,
-                        o.ema21value,
-                        o.ema34value,
-                        o.rsivalue,
-                        o.stochrsivalue,
-                        o.stochrsik,
-                        o.stochrsid,
-                        o.trend as candle_trend,
-                        o.status as candle_status,
-                        o.trend12 as candle_trend12,
-                        o.status12 as candle_status12
-                    FROM alert_data ad
-                    LEFT JOIN ohlcvdetails o ON ad.tokenaddress = o.tokenaddress 
-                        AND ad.timeframe = o.timeframe
-                        AND o.unixtime > COALESCE(ad.lastupdatedunix, 0)
-                        AND o.vwapvalue IS NOT NULL
-                        AND o.avwapvalue IS NOT NULL
-                        AND (ad.ema12availabletime IS NULL OR o.unixtime < ad.ema12availabletime OR o.ema12value IS NOT NULL)
-                        AND (ad.ema21availabletime IS NULL OR o.unixtime < ad.ema21availabletime OR o.ema21value IS NOT NULL)
-                        AND (ad.ema34availabletime IS NULL OR o.unixtime < ad.ema34availabletime OR o.ema34value IS NOT NULL)
-                    ORDER BY ad.tokenaddress, ad.timeframe, o.unixtime
-                """)
-                
-                cursor.execute(query, params)
-                records = cursor.fetchall()
+                if tokenAddress:
+                    cursor.execute(_SQL_GET_ALERT_STATE_AND_NEW_CANDLES_FOR_TOKEN, (tokenAddress,))
+                else:
+                    cursor.execute(_SQL_GET_ALERT_STATE_AND_NEW_CANDLES)
                 
                 # Organize into POJOs
-                trackedTokens = {}
-                # Track seen candle timestamps per timeframe to prevent duplicates (space and time efficient)
-                seenCandles = {}  # {tokenAddress: {timeframe: set(unixTimes)}}
+                trackedTokens = []
+                trackedToken = None
+                timeframeRecord = None
+                lastCandleUnixTime = None
                 
-                for row in records:
+                for row in cursor:
                     tokenAddress = row['tokenaddress']
                     
-                    # Create or get TrackedToken
-                    if tokenAddress not in trackedTokens:
-                        trackedTokens[tokenAddress] = TrackedToken(
+                    # Rows arrive ORDER BY tokenaddress, timeframe, unixtime, so each token and each of
+                    # its timeframes is one contiguous group - only the current group is kept, instead of
+                    # per-(token, timeframe) maps and seen-candle sets for every group in the sweep
+                    if trackedToken is None or trackedToken.tokenAddress != tokenAddress:
+                        trackedToken = TrackedToken(
                             trackedTokenId=row['trackedtokenid'],
                             tokenAddress=tokenAddress,
                             symbol=row['symbol'],
@@ -2673,11 +3563,13 @@ class TradingHandler(BaseDBHandler):
                             pairAddress=row['pairaddress'],
                             addedBy='alert_processor'
                         )
+                        trackedTokens.append(trackedToken)
+                        timeframeRecord = None
                     
-                    # Get or create TimeframeRecord
+                    # Create TimeframeRecord on the first row of its group
                     timeframe = row['timeframe']
-                    timeframeRecord = trackedTokens[tokenAddress].getTimeframeRecord(timeframe)
-                    if not timeframeRecord:
+                    if timeframeRecord is None or timeframeRecord.timeframe != timeframe:
+                        lastCandleUnixTime = None
                         timeframeRecord = TimeframeRecord(
                             timeframeId=row['timeframeid'],
                             tokenAddress=tokenAddress,
@@ -2740,22 +3632,16 @@ class TradingHandler(BaseDBHandler):
                                 emaAvailableTime=row['ema34availabletime']
                             )
                         
-                        trackedTokens[tokenAddress].addTimeframeRecord(timeframeRecord)
+                        trackedToken.addTimeframeRecord(timeframeRecord)
                     
                     # Add candle data if exists
                     if row['unixtime']:
                         candleUnixTime = row['unixtime']
                         
-                        # Initialize seenCandles structure if needed
-                        if tokenAddress not in seenCandles:
-                            seenCandles[tokenAddress] = {}
-                        if timeframe not in seenCandles[tokenAddress]:
-                            seenCandles[tokenAddress][timeframe] = set()
-                        
-                        # O(1) check if candle already exists using set
-                        if candleUnixTime not in seenCandles[tokenAddress][timeframe]:
-                            # Mark as seen
-                            seenCandles[tokenAddress][timeframe].add(candleUnixTime)
+                        # Candles are ordered by unixtime within the group, so a duplicate is always
+                        # the row right after its first occurrence
+                        if candleUnixTime != lastCandleUnixTime:
+                            lastCandleUnixTime = candleUnixTime
                             
                             candle = OHLCVDetails(
                                 tokenAddress=tokenAddress,
@@ -2763,21 +3649,21 @@ class TradingHandler(BaseDBHandler):
                                 timeframe=timeframe,
                                 unixTime=candleUnixTime,
                                 timeBucket=row['timebucket'],
-                                openPrice=float(row['openprice']),
-                                highPrice=float(row['highprice']),
-                                lowPrice=float(row['lowprice']),
-                                closePrice=float(row['closeprice']),
-                                volume=float(row['volume']),
+                                openPrice=row['openprice'],
+                                highPrice=row['highprice'],
+                                lowPrice=row['lowprice'],
+                                closePrice=row['closeprice'],
+                                volume=row['volume'],
                                 trades=row['trades'],
-                                vwapValue=float(row['vwapvalue']) if row['vwapvalue'] else None,
-                                avwapValue=float(row['avwapvalue']) if row['avwapvalue'] else None,
-                                ema12Value=float(row['ema12value']) if row['ema12value'] else None,
-                                ema21Value=float(row['ema21value']) if row['ema21value'] else None,
-                                ema34Value=float(row['ema34value']) if row['ema34value'] else None,
-                                rsiValue=float(row['rsivalue']) if row.get('rsivalue') else None,
-                                stochRSIValue=float(row['stochrsivalue']) if row.get('stochrsivalue') else None,
-                                stochRSIK=float(row['stochrsik']) if row.get('stochrsik') else None,
-                                stochRSID=float(row['stochrsid']) if row.get('stochrsid') else None,
+                                vwapValue=row['vwapvalue'] or None,
+                                avwapValue=row['avwapvalue'] or None,
+                                ema12Value=row['ema12value'] or None,
+                                ema21Value=row['ema21value'] or None,
+                                ema34Value=row['ema34value'] or None,
+                                rsiValue=row.get('rsivalue') or None,
+                                stochRSIValue=row.get('stochrsivalue') or None,
+                                stochRSIK=row.get('stochrsik') or None,
+                                stochRSID=row.get('stochrsid') or None,
                                 trend=row['candle_trend'],
                                 status=row['candle_status'],
                                 trend12=row['candle_trend12'],
@@ -2788,7 +3674,7 @@ class TradingHandler(BaseDBHandler):
                             timeframeRecord.addOHLCVDetail(candle)
                 
                 logger.info(f"TRADING SCHEDULER :: Fetching alert state and new candles completed - found {len(trackedTokens)} tokens")
-                return list(trackedTokens.values())
+                return trackedTokens
                 
         except Exception as e:
             logger.info(f"TRADING SCHEDULER :: Error getting alerts for processing: {e}")
@@ -2841,11 +3727,11 @@ class TradingHandler(BaseDBHandler):
             
             # Step 2: Insert all updates into temporary table
             logger.info(f"TRADING SCHEDULER :: Inserting updates into temporary table started for multi-column update")
-            placeholders = ', '.join(['%s'] * len(columnNames) + ['%s', '%s', '%s'])
-            cursor.executemany(f"""
+            # One multi-row INSERT per page instead of one INSERT statement per row
+            execute_values(cursor, f"""
                 INSERT INTO {tempTableName} ({', '.join(columnNames)}, tokenaddress, timeframe, unixtime)
-                VALUES ({placeholders})
-            """, candleUpdates)
+                VALUES %s
+            """, candleUpdates, page_size=_CANDLE_PAGE_SIZE)
             logger.info(f"TRADING SCHEDULER :: Inserting updates into temporary table completed for multi-column update")
             
             # Step 3: Single batch UPDATE using JOIN
@@ -2862,7 +3748,7 @@ class TradingHandler(BaseDBHandler):
             logger.info(f"TRADING SCHEDULER :: Updating ohlcvdetails table completed for multi-column update")
             
         except Exception as e:
-            logger.inf0(f"TRADING SCHEDULER :: Error in optimized multi-column batch update: {e}")
+            logger.info(f"TRADING SCHEDULER :: Error in optimized multi-column batch update: {e}")
             raise
 
     def batchUpdateCandlesWithTempTable(self, cursor, candleUpdates: List[Tuple], columnName: str) -> None:
@@ -2894,7 +3780,7 @@ class TradingHandler(BaseDBHandler):
             tempTableName = f"temp_{columnName}_updates"
             cursor.execute(f"""
                 CREATE TEMPORARY TABLE {tempTableName} (
-                    {columnName} DECIMAL(20,8),
+                    {columnName} DOUBLE PRECISION,
                     tokenaddress CHAR(44),
                     timeframe VARCHAR(10),
                     unixtime BIGINT
@@ -2904,10 +3790,11 @@ class TradingHandler(BaseDBHandler):
             
             # Step 2: Insert all updates into temporary table
             logger.info(f"TRADING SCHEDULER :: Inserting updates into temporary table for {columnName} - started")
-            cursor.executemany(f"""
+            # One multi-row INSERT per page instead of one INSERT statement per row
+            execute_values(cursor, f"""
                 INSERT INTO {tempTableName} ({columnName}, tokenaddress, timeframe, unixtime)
-                VALUES (%s, %s, %s, %s)
-            """, candleUpdates)
+                VALUES %s
+            """, candleUpdates, page_size=_CANDLE_PAGE_SIZE)
             logger.info(f"TRADING SCHEDULER :: Inserting updates into temporary table for {columnName} - completed")
             
             # Step 3: Single batch UPDATE using JOIN
@@ -0,0 +1,28 @@
+"""
+One-off trading schema migrations
+
+Each migration copies or rewrites a whole table under an ACCESS EXCLUSIVE lock, so they are
+not run by TradingHandler construction. Run once per deployment while the trading scheduler
+is stopped:
+
+    python -m database.trading.TradingSchemaMigration
+"""
+
+import sys
+
+from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+from database.trading.TradingHandler import TradingHandler
+from logs.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def main() -> int:
+    logger.info("Trading schema migration started")
+    migrated = TradingHandler(DatabaseConnectionManager()).runSchemaMigrations()
+    logger.info(f"Trading schema migration {'completed' if migrated else 'failed'}")
+    return 0 if migrated else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
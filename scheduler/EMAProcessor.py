@@ -61,6 +61,7 @@ from typing import List, TYPE_CHECKING
 from logs.logger import get_logger
 from database.trading.TradingHandler import TradingHandler
 from utils.CommonUtil import CommonUtil
+from utils.IndicatorKernels import IndicatorKernels
 from database.trading.TradingHandler import EMAStatus
 from database.trading.TradingHandler import EMAStatus
 from api.trading.request import EMAState
@@ -191,7 +192,8 @@ class EMAProcessor:
         Perform incremental EMA update using POJOs and update them directly
         """
         try:
-            # Filter candles to only include new ones after lastUpdatedAt
+            # Filter candles to only include new ones after lastUpdatedAt - the record holds the
+            # candles of every EMA period of the timeframe in emakey order, not sorted by unixTime
             symbol = trackedToken.symbol
             newCandles = [c for c in timeframeRecord.ohlcvDetails if c.unixTime > lastUpdatedAt]
             
@@ -204,17 +206,15 @@ class EMAProcessor:
 
             logger.info(f"TRADING SCHEDULER :: Incremental EMA{emaPeriod} update for {symbol} - {timeframeRecord.timeframe} - started")
             
-            for candle in newCandles:
-                currentEMAValue = self.calculateEMAValue(currentEMAValue, candle.closePrice, emaPeriod)
-                latestUNIX = candle.unixTime
-                
-                # Update the candle POJO directly with EMA value
-                if emaPeriod == 12:
-                    candle.ema12Value = currentEMAValue
-                elif emaPeriod == 21:
-                    candle.ema21Value = currentEMAValue
-                elif emaPeriod == 34:
-                    candle.ema34Value = currentEMAValue
+            emaValues = IndicatorKernels.emaUpdate([c.closePrice for c in newCandles], currentEMAValue, emaPeriod)
+            currentEMAValue = emaValues[-1]
+            latestUNIX = newCandles[-1].unixTime
+            
+            # Update the candle POJOs directly with EMA value
+            emaAttribute = f'ema{emaPeriod}Value'
+            if emaPeriod in (12, 21, 34):
+                for candle, candleEMAValue in zip(newCandles, emaValues):
+                    setattr(candle, emaAttribute, candleEMAValue)
             
             # Update the EMAState POJO directly
             emaState = timeframeRecord.ema12State if emaPeriod == 12 else timeframeRecord.ema21State if emaPeriod == 21 else timeframeRecord.ema34State
@@ -280,33 +280,24 @@ class EMAProcessor:
                 logger.info(f"TRADING SCHEDULER :: Not enough candles for EMA{emaPeriod} calculation: {tokenAddress} - {timeframe}")
                 return False
 
-            currentEMA = None
-            latestUNIX = 0
-
-            for i, candle in enumerate(candles):
-                if i < emaPeriod - 1:
-                    # Skip first (emaPeriod-1) candles - no EMA value yet
-                    # For EMA21: Skip first 20 candles (index 0-19)
-                    continue
-                elif i == emaPeriod - 1:
-                    # emaPeriod-th candle: Calculate SMA as initial EMA value
-                    # For EMA21: 21st candle (index 20) gets SMA of first 21 candles
-                    sma = sum(candles[j].closePrice for j in range(i + 1)) / (i + 1)
-                    currentEMA = sma
-                else:
-                    # Subsequent candles: Calculate EMA using previous EMA value
-                    # For EMA21: 22nd+ candles use standard EMA formula
-                    currentEMA = self.calculateEMAValue(currentEMA, candle.closePrice, emaPeriod)
-
-                latestUNIX = candle.unixTime
+            # Skip first (emaPeriod-1) candles - no EMA value yet (for EMA21: index 0-19).
+            # emaPeriod-th candle gets the SMA of the first emaPeriod closes as initial EMA value,
+            # subsequent candles use the standard EMA formula
+            sma = sum(candles[j].closePrice for j in range(emaPeriod)) / emaPeriod
+            emaValues = [sma] + IndicatorKernels.emaUpdate(
+                [c.closePrice for c in candles[emaPeriod:]], sma, emaPeriod
+            )
+            currentEMA = emaValues[-1]
+            latestUNIX = candles[-1].unixTime
 
+            for candle, candleEMAValue in zip(candles[emaPeriod - 1:], emaValues):
                 # Update the candle POJO directly with EMA value
                 if emaPeriod == 12:
-                    candle.ema12Value = currentEMA
+                    candle.ema12Value = candleEMAValue
                 elif emaPeriod == 21:
-                    candle.ema21Value = currentEMA
+                    candle.ema21Value = candleEMAValue
                 elif emaPeriod == 34:
-                    candle.ema34Value = currentEMA
+                    candle.ema34Value = candleEMAValue
 
             if currentEMA is None:
                 logger.info(f"TRADING SCHEDULER :: No EMA values calculated for {tokenAddress} - {timeframe} EMA{emaPeriod}")
@@ -39,7 +39,7 @@ Minimum Candles Required:
 - %D: 34 candles (31 for %K + 3 more for SMA)
 """
 
-from typing import List, Optional, Tuple, TYPE_CHECKING
+from typing import Deque, List, Optional, Tuple, TYPE_CHECKING
 from logs.logger import get_logger
 from utils.CommonUtil import CommonUtil
 from api.trading.request.RSIState import RSIState
@@ -225,13 +225,15 @@ class RSIProcessor:
                 # Fallback: if not in state, get from previous candle in list
                 previousClose = self.getPreviousCloseFromCandles(candles, rsiState.lastUpdatedUnix)
             
-            # Process each new candle using modular flows
+            # Process each new candle using modular flows (bound methods hoisted out of the loop)
+            processRSI = self.processRSI
+            processStochasticRSI = self.processStochasticRSI
             for candle in newCandles:
                 # --- RSI FLOW ---
-                self.processRSI(rsiState, candle, previousClose)
+                processRSI(rsiState, candle, previousClose)
                 
                 # --- STOCHASTIC RSI, %K, %D FLOWS ---
-                self.processStochasticRSI(rsiState, candle, rsiState.rsiValue)
+                processStochasticRSI(rsiState, candle, rsiState.rsiValue)
                 
                 # Update previousClose for next iteration
                 previousClose = candle.closePrice
@@ -270,14 +272,15 @@ class RSIProcessor:
             gains = []
             losses = []
             
-            for i in range(1, self.RSI_INTERVAL + 1):
+            rsiInterval = self.RSI_INTERVAL
+            for i in range(1, rsiInterval + 1):
                 change = candles[i].closePrice - candles[i-1].closePrice
                 gains.append(change if change > 0 else 0)
                 losses.append(abs(change) if change < 0 else 0)
             
             # Calculate initial average gain/loss (SMA)
-            avgGain = sum(gains) / self.RSI_INTERVAL
-            avgLoss = sum(losses) / self.RSI_INTERVAL
+            avgGain = sum(gains) / rsiInterval
+            avgLoss = sum(losses) / rsiInterval
             
             # Calculate first RSI value
             firstRSI = self.calculateRSIValue(avgGain, avgLoss)
@@ -314,15 +317,14 @@ class RSIProcessor:
             )
             
             # ==================== STEP 3: Process Remaining Candles Using Modular Flows ====================
-            for i in range(self.RSI_INTERVAL + 1, len(candles)):
-                candle = candles[i]
-                previousClose = candles[i-1].closePrice
-                
+            processRSI = self.processRSI
+            processStochasticRSI = self.processStochasticRSI
+            for previousCandle, candle in zip(candles[rsiInterval:], candles[rsiInterval + 1:]):
                 # --- RSI FLOW ---
-                self.processRSI(rsiState, candle, previousClose)
+                processRSI(rsiState, candle, previousCandle.closePrice)
                 
                 # --- STOCHASTIC RSI, %K, %D FLOWS ---
-                self.processStochasticRSI(rsiState, candle, rsiState.rsiValue)
+                processStochasticRSI(rsiState, candle, rsiState.rsiValue)
             
             # Set RSI state in timeframe record
             timeframeRecord.rsiState = rsiState
@@ -412,8 +414,10 @@ class RSIProcessor:
         loss = abs(change) if change < 0 else 0
         
         # Update average gain/loss using Wilder's smoothing
-        rsiState.avgGain = self.calculateWildersSmoothing(rsiState.avgGain, gain, self.RSI_INTERVAL)
-        rsiState.avgLoss = self.calculateWildersSmoothing(rsiState.avgLoss, loss, self.RSI_INTERVAL)
+        rsiInterval = self.RSI_INTERVAL
+        calculateWildersSmoothing = self.calculateWildersSmoothing
+        rsiState.avgGain = calculateWildersSmoothing(rsiState.avgGain, gain, rsiInterval)
+        rsiState.avgLoss = calculateWildersSmoothing(rsiState.avgLoss, loss, rsiInterval)
         
         # Calculate RSI
         rsiValue = self.calculateRSIValue(rsiState.avgGain, rsiState.avgLoss)
@@ -451,14 +455,14 @@ class RSIProcessor:
         rsi = 100.0 - (100.0 / (1.0 + rs))
         return rsi
     
-    def calculateStochasticRSI(self, rsiValues: List[float]) -> float:
+    def calculateStochasticRSI(self, rsiValues: Deque[float]) -> float:
         """
         Calculate Stochastic RSI: ((Current RSI - Lowest RSI) / (Highest RSI - Lowest RSI)) × 100
         
         Returns value in 0-100 range to match DexScreener
         
         Args:
-            rsiValues: List of recent RSI values (last 14)
+            rsiValues: RSIState.rsiValues ring buffer (maxlen 14, so it holds exactly the window)
             
         Returns:
             Stochastic RSI value (0-100 range)
@@ -466,12 +470,9 @@ class RSIProcessor:
         if len(rsiValues) < self.STOCH_RSI_INTERVAL:
             return 0.0
         
-        # Use only the last 14 values for calculation
-        recentRSIValues = rsiValues[-self.STOCH_RSI_INTERVAL:]
-        
-        highestRSI = max(recentRSIValues)
-        lowestRSI = min(recentRSIValues)
-        currentRSI = recentRSIValues[-1]  # Most recent RSI
+        highestRSI = max(rsiValues)
+        lowestRSI = min(rsiValues)
+        currentRSI = rsiValues[-1]  # Most recent RSI
         
         if highestRSI == lowestRSI:
             return 50.0  # Neutral value when no range (50 in 0-100 range)
@@ -480,7 +481,7 @@ class RSIProcessor:
         stochRSI = ((currentRSI - lowestRSI) / (highestRSI - lowestRSI)) * 100.0
         return stochRSI
     
-    def calculateK(self, stochRSIValues: List[float]) -> Optional[float]:
+    def calculateK(self, stochRSIValues: Deque[float]) -> Optional[float]:
         """
         Calculate %K: 3-period SMA of Stochastic RSI
         
@@ -488,7 +489,7 @@ class RSIProcessor:
         If DexScreener shows values earlier, switch to calculateKProgressive()
         
         Args:
-            stochRSIValues: List of Stochastic RSI values (0-100 range)
+            stochRSIValues: RSIState.stochRSIValues ring buffer (maxlen 3, 0-100 range)
             
         Returns:
             %K value (0-100 range) or None if insufficient data
@@ -497,9 +498,9 @@ class RSIProcessor:
             return None
         
         # Standard SMA of last 3 Stochastic RSI values
-        return sum(stochRSIValues[-self.K_INTERVAL:]) / self.K_INTERVAL
+        return sum(stochRSIValues) / self.K_INTERVAL
     
-    def calculateKProgressive(self, stochRSIValues: List[float]) -> Optional[float]:
+    def calculateKProgressive(self, stochRSIValues: Deque[float]) -> Optional[float]:
         """
         Calculate %K: Progressive averaging (shows value immediately)
         
@@ -510,7 +511,7 @@ class RSIProcessor:
         Use this if DexScreener shows K values immediately after first Stochastic RSI
         
         Args:
-            stochRSIValues: List of Stochastic RSI values (0-100 range)
+            stochRSIValues: RSIState.stochRSIValues ring buffer (maxlen 3, 0-100 range)
             
         Returns:
             %K value (0-100 range) or None if no data
@@ -524,7 +525,7 @@ class RSIProcessor:
             return sum(stochRSIValues) / 2
         else:
             # Use last 3 values
-            return sum(stochRSIValues[-3:]) / 3
+            return sum(stochRSIValues) / 3
     
     def processStochasticRSI(self, rsiState: RSIState, candle: 'OHLCVDetails', rsi: float) -> None:
         """
@@ -563,7 +564,7 @@ class RSIProcessor:
                 
                 # Calculate %D if we have enough %K values (standard SMA of 3 %K values)
                 if len(rsiState.kValues) >= self.D_INTERVAL:
-                    dValue = sum(rsiState.kValues[-self.D_INTERVAL:]) / self.D_INTERVAL
+                    dValue = sum(rsiState.kValues) / self.D_INTERVAL
                     rsiState.dValue = dValue
                     candle.stochRSID = dValue
     
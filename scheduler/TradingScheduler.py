@@ -1,8 +1,10 @@
+from config.Config import get_config
 from database.operations.PortfolioDB import PortfolioDB
 from database.trading.TradingHandler import TradingHandler
 from logs.logger import get_logger
 from typing import List, Dict, Any
 import time
+from contextlib import nullcontext
 from actions.TradingActionEnhanced import TradingActionEnhanced
 from api.trading.request import TrackedToken, OHLCVDetails
 from scheduler.VWAPProcessor import VWAPProcessor
@@ -28,6 +30,8 @@ class TradingScheduler:
         self.rsi_processor = RSIProcessor(self.trading_handler)
         self.alerts_processor = AlertsProcessor(self.trading_handler)
         self.current_time = int(time.time())
+        # EMA/AVWAP rows are recomputable from ohlcvdetails, so they may skip the WAL flush wait
+        self.relaxed_indicator_durability = get_config().TRADING_RELAXED_DURABILITY
         
 
     def handleTradingUpdatesFromJob(self):
@@ -61,7 +65,10 @@ class TradingScheduler:
                 return
             
             self.fetchCandlesForTrackedTokens(trackedTokens)
-            self.trading_handler.batchPersistNewlyFetchedCandlesData(trackedTokens, maxCandlesPerTimeframe=None)
+            
+            # Candles can be re-fetched from lastfetchedat, so skip waiting for the WAL flush on commit
+            with self.trading_handler.bulk_session() as cursor:
+                self.trading_handler.batchPersistNewlyFetchedCandlesData(trackedTokens, maxCandlesPerTimeframe=None, cursor=cursor)
             
             
         except Exception as e:
@@ -93,7 +100,7 @@ class TradingScheduler:
                                     pairAddress=candle.pairAddress,
                                     timeframe=candle.timeframe,
                                     unixTime=candle.unixTime,
-                                    timeBucket=CommonUtil.calculateInitialStartTime(candle.unixTime, candle.timeframe),
+                                    timeBucket=0,  # Not persisted (generated by ohlcvdetails)
                                     openPrice=candle.openPrice,
                                     highPrice=candle.highPrice,
                                     lowPrice=candle.lowPrice,
@@ -123,6 +130,11 @@ class TradingScheduler:
         try:
             logger.info("TRADING SCHEDULER :: VWAP Calculation Started")
             
+            if get_config().TRADING_VWAP_IN_DATABASE:
+                self.trading_handler.batchAdvanceVWAPInDatabase()
+                logger.info(f"TRADING SCHEDULER :: VWAP Calculation Completed")
+                return
+            
             trackedTokens = self.trading_handler.getAllVWAPDataForScheduler()
             if not trackedTokens:
                 logger.info("TRADING SCHEDULER :: No VWAP data to process")
@@ -137,6 +149,15 @@ class TradingScheduler:
         except Exception as e:
             logger.info(f"TRADING SCHEDULER :: VWAP Calculation Failed: {e}")
 
+    def indicatorPersistSession(self):
+        """
+        bulk_session (no WAL flush wait) when TRADING_RELAXED_DURABILITY is set; otherwise
+        yields None so each persist opens its own fully durable transaction
+        """
+        if self.relaxed_indicator_durability:
+            return self.trading_handler.bulk_session()
+        return nullcontext()
+
     def calculateAndPersistEMAIndicators(self):
         try:
             logger.info("TRADING SCHEDULER :: EMA Calculation Started")
@@ -148,7 +169,8 @@ class TradingScheduler:
             
             self.ema_processor.calculateEMAForAllRetrievedTokens(trackedTokens)
             
-            self.trading_handler.batchPersistEMAData(trackedTokens)
+            with self.indicatorPersistSession() as cursor:
+                self.trading_handler.batchPersistEMAData(trackedTokens, cursor=cursor)
             
             logger.info(f"TRADING SCHEDULER :: EMA Calculation Completed")
             
@@ -168,7 +190,8 @@ class TradingScheduler:
             
             self.avwap_processor.calculateAVWAPForAllTrackedTokens(trackedTokens)
             
-            self.trading_handler.batchPersistAVWAPData(trackedTokens)
+            with self.indicatorPersistSession() as cursor:
+                self.trading_handler.batchPersistAVWAPData(trackedTokens, cursor=cursor)
             
             logger.info(f"TRADING SCHEDULER :: AVWAP Calculation Completed")
             
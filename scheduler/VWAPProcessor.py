@@ -9,6 +9,7 @@ EXAMPLE: Token ABC, 1hr timeframe, Current time: 15:00
 STEP 1: Get All VWAP Data (Single Query)
 - Fetch all active tokens with their timeframes and VWAP session data
 - Get unprocessed candles (where ohlcv.unixtime > COALESCE(vs.lastcandleunix, 0))
+  as per-(token, timeframe) numpy column arrays (TimeframeRecord.ohlcvArrays)
 - Single optimized query with LEFT JOINs for maximum efficiency
 
 STEP 2: Process Each Token/Timeframe
@@ -17,8 +18,8 @@ STEP 2: Process Each Token/Timeframe
   b) If existing: Use current cumulative values (incremental update)
   c) If not existing: Start fresh with today's day boundaries (full reset)
 
-STEP 3: Iterate Through Candles
-- Process each candle chronologically
+STEP 3: Iterate Through Candles (IndicatorKernels.vwapUpdate)
+- Process each candle chronologically, one cumulative sum per UTC day
 - Calculate typical_price = (high + low + close) / 3
 - Update cumulative: total_pv += (typical_price × volume)
 - Update cumulative: total_volume += volume
@@ -45,11 +46,11 @@ KEY SIMPLIFICATIONS:
 """
 
 from typing import List
-from decimal import Decimal
 
 from logs.logger import get_logger
 from database.trading.TradingHandler import TradingHandler
 from utils.CommonUtil import CommonUtil
+from utils.IndicatorKernels import IndicatorKernels
 import time
 from api.trading.request.VWAPSession import VWAPSession
 
@@ -86,84 +87,57 @@ class VWAPProcessor:
 
     def calculateVWAPFromScheduler(self, timeframeRecord, tokenAddress: str, pairAddress: str, symbol: str) -> None:
         try:
-            if not timeframeRecord.ohlcvDetails:
+            candleArrays = timeframeRecord.ohlcvArrays
+            if candleArrays is None or len(candleArrays) == 0:
                 logger.warning(f"TRADING SCHEDULER :: No candles available for VWAP {symbol} - {timeframeRecord.timeframe}")
                 return
             
-            # Sort candles by unixTime to ensure chronological processing
-            timeframeRecord.ohlcvDetails.sort(key=lambda x: x.unixTime)
-            candles = timeframeRecord.ohlcvDetails
-            
             # Initialize session state
             hasExistingSession = timeframeRecord.vwapSession is not None and timeframeRecord.vwapSession.lastCandleUnix is not None
             
             if hasExistingSession:
                 # Use existing session data
-                currentCumulativePV = timeframeRecord.vwapSession.cumulativePV or Decimal('0')
-                currentCumulativeVolume = timeframeRecord.vwapSession.cumulativeVolume or Decimal('0')
+                currentCumulativePV = float(timeframeRecord.vwapSession.cumulativePV or 0.0)
+                currentCumulativeVolume = float(timeframeRecord.vwapSession.cumulativeVolume or 0.0)
                 sessionStartUnix = timeframeRecord.vwapSession.sessionStartUnix
                 sessionEndUnix = timeframeRecord.vwapSession.sessionEndUnix
             else:
-                # No existing session - will be set when first candle is processed
-                currentCumulativePV = Decimal('0')
-                currentCumulativeVolume = Decimal('0')
+                # No existing session - the first candle opens one
+                currentCumulativePV = 0.0
+                currentCumulativeVolume = 0.0
                 sessionStartUnix = None
                 sessionEndUnix = None
             
-            # Process candles chronologically with day boundary detection
-            for candle in candles:
-                candleUnix = candle.unixTime
-                candleDay = candleUnix // 86400  # Get day number for this candle
-                
-                # Check if we need to reset VWAP session (new day)
+            # Candles arrive ordered by unixtime; the kernel resets the sums on each new UTC day
+            vwapValues, currentCumulativePV, currentCumulativeVolume, lastResetUnix = IndicatorKernels.vwapUpdate(
+                candleArrays.unixTimes, candleArrays.highPrices, candleArrays.lowPrices,
+                candleArrays.closePrices, candleArrays.volumes,
+                currentCumulativePV, currentCumulativeVolume, sessionEndUnix
+            )
+            candleArrays.vwapValues = vwapValues
+            
+            if lastResetUnix is not None:
                 if sessionEndUnix is not None:
-                    if CommonUtil.isNewDay(candleUnix, sessionEndUnix):
-                        # Day boundary crossed - reset VWAP session for new day
-                        logger.info(f"TRADING SCHEDULER :: Day boundary detected for {symbol} - {timeframeRecord.timeframe}: "
-                                  f"candle day {candleDay} > session day {sessionEndUnix // 86400}")
-                        
-                        # Reset for new day
-                        currentCumulativePV = Decimal('0')
-                        currentCumulativeVolume = Decimal('0')
-                        sessionStartUnix, sessionEndUnix = CommonUtil.getSessionStartAndEndUnix(candleUnix)
-                        hasExistingSession = False  # This is now a fresh session for new day
-                
-                # If no existing session, initialize day boundaries from first candle
-                if sessionStartUnix is None:
-                    sessionStartUnix, sessionEndUnix = CommonUtil.getSessionStartAndEndUnix(candleUnix)
-                
-                # Calculate VWAP for this candle
-                typicalPrice = (candle.highPrice + candle.lowPrice + candle.closePrice) / Decimal('3')
-                priceVolume = typicalPrice * candle.volume
-                
-                # Update cumulative values
-                currentCumulativePV += priceVolume
-                currentCumulativeVolume += candle.volume
-                
-                # Calculate current VWAP and update the candle POJO directly
-                if currentCumulativeVolume > 0:
-                    currentVWAP = currentCumulativePV / currentCumulativeVolume
-                    candle.updateVWAPValue(float(currentVWAP))
+                    logger.info(f"TRADING SCHEDULER :: Day boundary detected for {symbol} - {timeframeRecord.timeframe}: "
+                              f"candle day {lastResetUnix // 86400} > session day {sessionEndUnix // 86400}")
+                sessionStartUnix, sessionEndUnix = CommonUtil.getSessionStartAndEndUnix(lastResetUnix)
             
             # Update VWAPSession POJO with final session data
-            if candles:  # Only if we processed any candles
-                lastCandleUnix = candles[-1].unixTime
-                timeframeSeconds = CommonUtil.getTimeframeSeconds(timeframeRecord.timeframe)
-                
-                timeframeRecord.vwapSession = VWAPSession(
-                    tokenAddress=tokenAddress,
-                    pairAddress=pairAddress,
-                    timeframe=timeframeRecord.timeframe,
-                    sessionStartUnix=sessionStartUnix,
-                    sessionEndUnix=sessionEndUnix,
-                    cumulativePV=float(currentCumulativePV),
-                    cumulativeVolume=float(currentCumulativeVolume),
-                    currentVWAP=float(currentCumulativePV / currentCumulativeVolume) if currentCumulativeVolume > 0 else 0.0,
-                    lastCandleUnix=lastCandleUnix,
-                    nextCandleFetch=lastCandleUnix + timeframeSeconds
-                )
-
-                
+            lastCandleUnix = int(candleArrays.unixTimes[-1])
+            timeframeSeconds = CommonUtil.getTimeframeSeconds(timeframeRecord.timeframe)
+            
+            timeframeRecord.vwapSession = VWAPSession(
+                tokenAddress=tokenAddress,
+                pairAddress=pairAddress,
+                timeframe=timeframeRecord.timeframe,
+                sessionStartUnix=sessionStartUnix,
+                sessionEndUnix=sessionEndUnix,
+                cumulativePV=currentCumulativePV,
+                cumulativeVolume=currentCumulativeVolume,
+                currentVWAP=currentCumulativePV / currentCumulativeVolume if currentCumulativeVolume > 0 else 0.0,
+                lastCandleUnix=lastCandleUnix,
+                nextCandleFetch=lastCandleUnix + timeframeSeconds
+            )
             
         except Exception as e:
             logger.info(f"TRADING SCHEDULER :: Error calculating VWAP for {tokenAddress} - {timeframeRecord.timeframe}: {e}")
@@ -202,23 +176,23 @@ class VWAPProcessor:
             
             logger.info(f"TRADING API :: Processing VWAP {tokenAddress} - {timeframeRecord.timeframe} with {len(todayCandles)} today's candles")
             
-            # Calculate VWAP values for today's candles only
-            cumulativePV = Decimal('0')
-            cumulativeVolume = Decimal('0')
+            # Calculate VWAP values for today's candles only - plain float sums, the same
+            # precision the scheduler path (IndicatorKernels.vwapUpdate) and vwapvalue column use
+            cumulativePV = 0.0
+            cumulativeVolume = 0.0
             
             for candle in todayCandles:
                 # Calculate typical price (HLC/3)
-                typicalPrice = (Decimal(str(candle.highPrice)) + Decimal(str(candle.lowPrice)) + Decimal(str(candle.closePrice))) / Decimal('3')
-                priceVolume = typicalPrice * Decimal(str(candle.volume))
+                typicalPrice = (candle.highPrice + candle.lowPrice + candle.closePrice) / 3.0
                 
                 # Update cumulative values
-                cumulativePV += priceVolume
-                cumulativeVolume += Decimal(str(candle.volume))
+                cumulativePV += typicalPrice * candle.volume
+                cumulativeVolume += candle.volume
                 
                 # Calculate current VWAP and update the candle
                 if cumulativeVolume > 0:
                     currentVWAP = cumulativePV / cumulativeVolume
-                    candle.updateVWAPValue(float(currentVWAP))
+                    candle.updateVWAPValue(currentVWAP)
             
             
             
@@ -228,9 +202,9 @@ class VWAPProcessor:
                 timeframe=timeframeRecord.timeframe,
                 sessionStartUnix=dayStart,
                 sessionEndUnix=dayEnd,
-                cumulativePV=float(cumulativePV),
-                cumulativeVolume=float(cumulativeVolume),
-                currentVWAP=float(currentVWAP) if cumulativeVolume > 0 else 0.0,
+                cumulativePV=cumulativePV,
+                cumulativeVolume=cumulativeVolume,
+                currentVWAP=currentVWAP if cumulativeVolume > 0 else 0.0,
                 lastCandleUnix=todayCandles[-1].unixTime if todayCandles else None,
                 nextCandleFetch=todayCandles[-1].unixTime + timeframeSeconds if todayCandles else None
             )
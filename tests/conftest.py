@@ -0,0 +1,98 @@
+"""
+Shared fixtures for the database-backed trading tests
+
+The tests create, advance and delete tracked tokens, so they only run against a throwaway
+PostgreSQL database: point the DB_* variables (config/Config.py) at it and set
+TRADING_TEST_DATABASE=true. Without that flag, or without the database driver installed,
+every test is skipped.
+
+    TRADING_TEST_DATABASE=true DB_NAME=trading_test DB_SSLMODE=disable python -m pytest tests
+"""
+
+import os
+import random
+import secrets
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# Solana addresses are base58 - 32 byte keys encode to 43 or 44 characters
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+@pytest.fixture(scope="session")
+def tradingHandler():
+    """TradingHandler on the test database, with the trading tables created"""
+    if os.getenv("TRADING_TEST_DATABASE", "false").strip().lower() != "true":
+        pytest.skip("TRADING_TEST_DATABASE is not set - these tests need a throwaway PostgreSQL database")
+    for module in ("psycopg2", "numpy", "scipy", "sqlalchemy"):
+        pytest.importorskip(module)
+
+    from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+    from database.trading.TradingHandler import TradingHandler
+
+    handler = TradingHandler(DatabaseConnectionManager())
+    if not TradingHandler._tablesCreated:
+        pytest.fail("Trading tables could not be created - check the DB_* settings")
+    return handler
+
+
+@pytest.fixture
+def tokenAddress(tradingHandler):
+    """
+    Factory for unique addresses of the given length (44 by default)
+
+    Every tracked token created with one of them is deleted with all its data afterwards.
+    """
+    createdAddresses = []
+
+    def makeAddress(length: int = 44) -> str:
+        address = "".join(secrets.choice(_BASE58_ALPHABET) for _ in range(length))
+        createdAddresses.append(address)
+        return address
+
+    yield makeAddress
+
+    for address in createdAddresses:
+        tradingHandler.deleteToken(address)
+
+
+@pytest.fixture(scope="session")
+def candleSeries():
+    """
+    Factory for a deterministic random-walk candle series
+
+    Prices and volumes are rounded to the ohlcvdetails column scales, so values read back
+    from the database equal the ones built here.
+    """
+    from api.trading.request import OHLCVDetails
+    from utils.CommonUtil import CommonUtil
+
+    def buildCandles(tokenAddress: str, pairAddress: str, timeframe: str,
+                     startUnix: int, endUnix: int, seed: int = 0) -> list:
+        timeframeSeconds = CommonUtil.getTimeframeSeconds(timeframe)
+        rng = random.Random(seed)
+        closePrice = 1.0
+        candles = []
+        for unixTime in range(startUnix, endUnix, timeframeSeconds):
+            openPrice = closePrice
+            closePrice = max(0.0001, openPrice * (1 + rng.uniform(-0.04, 0.04)))
+            candles.append(OHLCVDetails(
+                tokenAddress=tokenAddress,
+                pairAddress=pairAddress,
+                timeframe=timeframe,
+                unixTime=unixTime,
+                openPrice=round(openPrice, 8),
+                highPrice=round(max(openPrice, closePrice) * (1 + rng.uniform(0, 0.02)), 8),
+                lowPrice=round(min(openPrice, closePrice) * (1 - rng.uniform(0, 0.02)), 8),
+                closePrice=round(closePrice, 8),
+                volume=round(rng.uniform(100, 10000), 4),
+                trades=rng.randint(1, 500)
+            ))
+        return candles
+
+    return buildCandles
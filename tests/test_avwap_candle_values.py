@@ -0,0 +1,55 @@
+"""
+AVWAP candle values for short token addresses
+
+A 43-character address is read back from the CHAR(44) columns blank-padded, and the scheduler
+writes candle values with that padded form. Every candle value update path must still find
+the token's ohlcvdetails rows.
+"""
+
+import pytest
+
+_TIMEFRAME = '30min'
+_TIMEFRAME_SECONDS = 1800
+# 2024-03-10 00:00:00 UTC
+_START_UNIX = 1710028800
+
+
+@pytest.mark.parametrize('updatePath', ['values', 'copy', 'parallelShards'])
+def testAVWAPCandleValuesReachPaddedShortAddress(tradingHandler, tokenAddress, candleSeries, updatePath):
+    from database.trading.TradingHandler import _CANDLE_COPY_THRESHOLD
+
+    address, pairAddress = tokenAddress(43), tokenAddress(43)
+    tradingHandler.addToken(address, 'AVWAP', 'AVWAP padding', pairAddress, pairCreatedTime=_START_UNIX)
+    [timeframeRecord] = tradingHandler.createTimeframeInitialRecords(address, pairAddress, [_TIMEFRAME], _START_UNIX)
+    assert timeframeRecord.tokenAddress == address + ' '
+
+    # Above the threshold batchUpdateCandleValues switches from a VALUES list to a COPY staging table
+    candleCount = _CANDLE_COPY_THRESHOLD + 1 if updatePath == 'copy' else 48
+    candles = candleSeries(timeframeRecord.tokenAddress, timeframeRecord.pairAddress, _TIMEFRAME,
+                           _START_UNIX, _START_UNIX + candleCount * _TIMEFRAME_SECONDS, seed=3)
+    with tradingHandler.conn_manager.transaction() as cursor:
+        tradingHandler.batchInsertCandles(cursor, tradingHandler._candlePersistRows(timeframeRecord, candles))
+
+    for index, candle in enumerate(candles):
+        candle.avwapValue = round(1.0 + index / 1000, 8)
+    timeframeRecord.ohlcvDetails = candles
+    candleUpdates = tradingHandler._collectAVWAPCandleUpdates([timeframeRecord])
+
+    if updatePath == 'parallelShards':
+        tradingHandler._parallelUpdateCandleValues(candleUpdates, 'avwapvalue')
+    else:
+        with tradingHandler.conn_manager.transaction() as cursor:
+            tradingHandler.batchUpdateCandleValues(cursor, candleUpdates, 'avwapvalue')
+
+    with tradingHandler.conn_manager.transaction() as cursor:
+        cursor.execute("""
+            SELECT unixtime, avwapvalue
+            FROM ohlcvdetails
+            WHERE tokenaddress = %s AND timeframe = %s
+            ORDER BY unixtime
+        """, (address, _TIMEFRAME))
+        storedValues = [(row['unixtime'], row['avwapvalue']) for row in cursor.fetchall()]
+
+    assert [(unixTime, None if value is None else float(value)) for unixTime, value in storedValues] == [
+        (candle.unixTime, candle.avwapValue) for candle in candles
+    ]
@@ -0,0 +1,141 @@
+"""
+Add token -> scheduler tick round trip for short token addresses
+
+A 43-character address is stored blank-padded in the CHAR(44) columns and read back padded,
+so every write keyed by token address has to compare as CHAR(44). Two tokens with identical
+candles - one with a 44-character address, one with a 43-character address - go through the
+add path and one scheduler tick; every indicator table must then hold the same rows for both.
+
+Only the candle API calls are replaced: the candles are generated and handed to the same
+steps that addTokenForTracking and fetchCandlesAndPersist run after fetching.
+"""
+
+import time
+
+_SECONDS_PER_DAY = 86400
+
+# Per-table sort key; the remaining columns are compared except identities, addresses and row timestamps
+_INDICATOR_TABLES = {
+    'timeframemetadata': 'timeframe',
+    'ohlcvdetails': 'timeframe, unixtime',
+    'vwapsessions': 'timeframe',
+    'emastates': 'timeframe, emakey',
+    'avwapstates': 'timeframe',
+    'rsistates': 'timeframe',
+    'alerts': 'timeframe',
+}
+_IGNORED_COLUMNS = frozenset({
+    'id', 'alertid', 'rsistateid', 'tokenid', 'timeframeid',
+    'tokenaddress', 'pairaddress', 'createdat', 'lastupdatedat'
+})
+
+
+def _indicatorSnapshot(tradingHandler, tokenAddress: str) -> dict:
+    snapshot = {}
+    with tradingHandler.conn_manager.transaction() as cursor:
+        for table, orderBy in _INDICATOR_TABLES.items():
+            cursor.execute(f"SELECT * FROM {table} WHERE tokenaddress = %s ORDER BY {orderBy}", (tokenAddress,))
+            snapshot[table] = [
+                {column: value for column, value in row.items() if column not in _IGNORED_COLUMNS}
+                for row in cursor.fetchall()
+            ]
+    return snapshot
+
+
+def _addTokenWithCandles(tradingAction, tokenAddress: str, pairAddress: str, timeframes,
+                         pairCreatedTime: int, candlesByTimeframe: dict):
+    """TradingActionEnhanced.addTokenForTracking with the candle fetch replaced by candlesByTimeframe"""
+    from utils.CommonUtil import CommonUtil
+
+    tokenId = tradingAction.addTokenToTrackedTokensDatabase(
+        tokenAddress, pairAddress, 'RT', 'Round trip', pairCreatedTime, 'round_trip_test'
+    )
+    timeframeRecords = tradingAction.addInitialTimeframeRecords(
+        tokenAddress, pairAddress, timeframes, pairCreatedTime, 'round_trip_test'
+    )
+
+    candleDataByTimeframe = {}
+    for timeframeRecord in timeframeRecords:
+        for candle in candlesByTimeframe[timeframeRecord.timeframe]:
+            timeframeRecord.addOHLCVDetail(candle)
+        latestTime = timeframeRecord.ohlcvDetails[-1].unixTime
+        timeframeRecord.updateAfterFetch(
+            latestTime, CommonUtil.calculateNextFetchTimeForTimeframe(latestTime, timeframeRecord.timeframe)
+        )
+        candleDataByTimeframe[timeframeRecord.timeframe] = timeframeRecord
+
+    tradingAction.calculateAllIndicatorsInMemory(candleDataByTimeframe, tokenAddress, pairAddress, pairCreatedTime)
+    tradingAction.updateCandleAndIndicatorData(candleDataByTimeframe)
+    tradingAction.trading_handler.createInitialAlerts(
+        tokenId=tokenId, tokenAddress=tokenAddress, pairAddress=pairAddress, timeframes=timeframes
+    )
+
+
+def _runSchedulerTick(scheduler, tokenAddresses, candlesByToken: dict):
+    """TradingScheduler.handleTradingUpdatesFromJob with the candle fetch replaced by candlesByToken"""
+    from utils.CommonUtil import CommonUtil
+
+    # The tokens were created moments ago - look past the scheduler's creation buffer
+    trackedTokens = [trackedToken for trackedToken
+                     in scheduler.trading_handler.getAllTimeframeRecordsReadyForFetching(buffer_seconds=-60)
+                     if trackedToken.tokenAddress.rstrip() in tokenAddresses]
+    assert sorted(trackedToken.tokenAddress.rstrip() for trackedToken in trackedTokens) == sorted(tokenAddresses)
+
+    for trackedToken in trackedTokens:
+        for timeframeRecord in trackedToken.timeframeRecords:
+            for candle in candlesByToken[trackedToken.tokenAddress.rstrip()][timeframeRecord.timeframe]:
+                timeframeRecord.addOHLCVDetail(candle)
+            latestTime = timeframeRecord.ohlcvDetails[-1].unixTime
+            timeframeRecord.updateAfterFetch(
+                latestTime, CommonUtil.calculateNextFetchTimeForTimeframe(latestTime, timeframeRecord.timeframe)
+            )
+
+    with scheduler.trading_handler.bulk_session() as cursor:
+        scheduler.trading_handler.batchPersistNewlyFetchedCandlesData(trackedTokens, maxCandlesPerTimeframe=None,
+                                                                      cursor=cursor)
+
+    scheduler.calculateAndPersistVWAPIndicators()
+    scheduler.calculateAndPersistEMAIndicators()
+    scheduler.calculateAndPersistAVWAPIndicators()
+    scheduler.calculateAndPersistRSIIndicators()
+    scheduler.calculateAndPersistAlerts()
+
+
+def testShortAddressRoundTripMatchesFullLengthAddress(tradingHandler, tokenAddress, candleSeries):
+    from constants.TradingConstants import TimeframeConstants
+    from scheduler.TradingScheduler import TradingScheduler
+
+    timeframes = TimeframeConstants.VALID_NEW_TOKEN_TIMEFRAMES
+    # Every candle is complete: the series ends at the start of the current 4h candle
+    seriesEnd = int(time.time()) // 14400 * 14400
+    pairCreatedTime = seriesEnd - 8 * _SECONDS_PER_DAY
+    # Candles before the cutoff are fetched by the add path, the rest by the scheduler tick
+    tickCutoff = seriesEnd - _SECONDS_PER_DAY
+
+    scheduler = TradingScheduler()
+    shortAddress, fullAddress = tokenAddress(43), tokenAddress(44)
+    addedCandles, tickCandles = {}, {}
+    for address in (shortAddress, fullAddress):
+        pairAddress = tokenAddress(len(address))
+        addedCandles[address], tickCandles[address] = {}, {}
+        for seed, timeframe in enumerate(timeframes):
+            candles = candleSeries(address, pairAddress, timeframe, pairCreatedTime, seriesEnd, seed=seed)
+            addedCandles[address][timeframe] = [candle for candle in candles if candle.unixTime < tickCutoff]
+            tickCandles[address][timeframe] = [candle for candle in candles if candle.unixTime >= tickCutoff]
+
+        _addTokenWithCandles(scheduler.trading_action, address, pairAddress, timeframes,
+                             pairCreatedTime, addedCandles[address])
+
+    _runSchedulerTick(scheduler, [shortAddress, fullAddress], tickCandles)
+
+    shortSnapshot = _indicatorSnapshot(tradingHandler, shortAddress)
+    fullSnapshot = _indicatorSnapshot(tradingHandler, fullAddress)
+
+    # The tick reached the short token: fetch status advanced and the new candles carry indicators
+    lastFetchedAt = {row['timeframe']: row['lastfetchedat'] for row in shortSnapshot['timeframemetadata']}
+    assert lastFetchedAt == {timeframe: tickCandles[shortAddress][timeframe][-1].unixTime for timeframe in timeframes}
+    tickRows = [row for row in shortSnapshot['ohlcvdetails'] if row['unixtime'] >= tickCutoff]
+    assert tickRows and all(row['vwapvalue'] is not None for row in tickRows)
+
+    for table in _INDICATOR_TABLES:
+        assert shortSnapshot[table] == fullSnapshot[table], table
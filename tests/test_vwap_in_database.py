@@ -0,0 +1,102 @@
+"""
+TRADING_VWAP_IN_DATABASE parity: batchAdvanceVWAPInDatabase must leave vwapsessions and
+ohlcvdetails.vwapvalue exactly as the scheduler's Python path
+(getAllVWAPDataForScheduler + VWAPProcessor + batchPersistVWAPData) does.
+"""
+
+import pytest
+
+_TIMEFRAME = '30min'
+_SECONDS_PER_DAY = 86400
+# 2024-03-10 00:00:00 UTC - fixed, so the day boundaries do not depend on when the test runs
+_SESSION_DAY_START = 1710028800
+_PAIR_CREATED_TIME = _SESSION_DAY_START - 3 * _SECONDS_PER_DAY
+
+_SQL_INSERT_SESSION = """
+    INSERT INTO vwapsessions
+    (tokenaddress, pairaddress, timeframe, sessionstartunix, sessionendunix,
+     cumulativepv, cumulativevolume, currentvwap, lastcandleunix, nextcandlefetch)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+# (sessionstartunix, sessionendunix, cumulativepv, cumulativevolume, currentvwap, lastcandleunix, nextcandlefetch)
+_STORED_SESSIONS = {
+    # What the add path stores when the token had no candles yet today
+    'addPathSessionWithoutCandles': (
+        _SESSION_DAY_START, _SESSION_DAY_START + _SECONDS_PER_DAY - 1, 0.0, 0.0, 0.0, None, None
+    ),
+    # Processed up to noon the day before - the rest of that day continues, the next day resets
+    'sessionContinuedThenReset': (
+        _SESSION_DAY_START - _SECONDS_PER_DAY, _SESSION_DAY_START - 1, 2500.0, 1000.0, 2.5,
+        _SESSION_DAY_START - _SECONDS_PER_DAY // 2, _SESSION_DAY_START - _SECONDS_PER_DAY // 2 + 1800
+    ),
+    'noSession': None,
+}
+
+
+def _seedToken(tradingHandler, candleSeries, tokenAddress: str, pairAddress: str, storedSession):
+    tradingHandler.addToken(tokenAddress, 'VWAP', 'VWAP parity', pairAddress, pairCreatedTime=_PAIR_CREATED_TIME)
+    [timeframeRecord] = tradingHandler.createTimeframeInitialRecords(
+        tokenAddress, pairAddress, [_TIMEFRAME], _PAIR_CREATED_TIME
+    )
+    candles = candleSeries(tokenAddress, pairAddress, _TIMEFRAME,
+                           _SESSION_DAY_START - 2 * _SECONDS_PER_DAY,
+                           _SESSION_DAY_START + _SECONDS_PER_DAY // 2, seed=7)
+
+    with tradingHandler.conn_manager.transaction() as cursor:
+        tradingHandler.batchInsertCandles(cursor, tradingHandler._candlePersistRows(timeframeRecord, candles))
+        if storedSession is not None:
+            cursor.execute(_SQL_INSERT_SESSION, (tokenAddress, pairAddress, _TIMEFRAME) + storedSession)
+
+
+def _vwapSnapshot(tradingHandler, tokenAddress: str):
+    with tradingHandler.conn_manager.transaction() as cursor:
+        cursor.execute("""
+            SELECT sessionstartunix, sessionendunix, cumulativepv, cumulativevolume,
+                   currentvwap, lastcandleunix, nextcandlefetch
+            FROM vwapsessions
+            WHERE tokenaddress = %s AND timeframe = %s
+        """, (tokenAddress, _TIMEFRAME))
+        session = cursor.fetchone()
+        cursor.execute("""
+            SELECT unixtime, vwapvalue
+            FROM ohlcvdetails
+            WHERE tokenaddress = %s AND timeframe = %s
+            ORDER BY unixtime
+        """, (tokenAddress, _TIMEFRAME))
+        candles = [(row['unixtime'], row['vwapvalue']) for row in cursor.fetchall()]
+    return session, candles
+
+
+@pytest.mark.parametrize('storedSession', list(_STORED_SESSIONS.values()), ids=list(_STORED_SESSIONS))
+def testAdvanceVWAPInDatabaseMatchesProcessor(tradingHandler, tokenAddress, candleSeries, storedSession):
+    from scheduler.VWAPProcessor import VWAPProcessor
+
+    # Short addresses come back blank-padded from CHAR(44), which both paths must handle
+    processorAddress, databaseAddress = tokenAddress(43), tokenAddress(43)
+    for address in (processorAddress, databaseAddress):
+        _seedToken(tradingHandler, candleSeries, address, tokenAddress(43), storedSession)
+
+    # Python path, restricted to its own token
+    trackedTokens = [trackedToken for trackedToken in tradingHandler.getAllVWAPDataForScheduler()
+                     if trackedToken.tokenAddress.rstrip() == processorAddress]
+    assert len(trackedTokens) == 1
+    VWAPProcessor(tradingHandler).calculateVWAPForAllTrackedTokens(trackedTokens)
+    tradingHandler.batchPersistVWAPData(trackedTokens)
+
+    # SQL path - the processor token has no unprocessed candles left, so only the other one advances
+    assert tradingHandler.batchAdvanceVWAPInDatabase() >= 1
+
+    processorSession, processorCandles = _vwapSnapshot(tradingHandler, processorAddress)
+    databaseSession, databaseCandles = _vwapSnapshot(tradingHandler, databaseAddress)
+
+    for column in ('sessionstartunix', 'sessionendunix', 'lastcandleunix', 'nextcandlefetch'):
+        assert databaseSession[column] == processorSession[column], column
+    for column in ('cumulativepv', 'cumulativevolume', 'currentvwap'):
+        assert databaseSession[column] == pytest.approx(processorSession[column], rel=1e-12), column
+
+    assert [unixTime for unixTime, _ in databaseCandles] == [unixTime for unixTime, _ in processorCandles]
+    assert [value for _, value in databaseCandles] == pytest.approx(
+        [value for _, value in processorCandles], rel=1e-12
+    )
+    assert any(value is not None for _, value in databaseCandles)
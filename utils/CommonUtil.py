@@ -1,6 +1,18 @@
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Tuple
 
+# Timeframe spellings that do not follow the <number><unit> pattern
+_TIMEFRAME_ALIASES = MappingProxyType({
+    '15min': 900,
+    '30min': 1800,
+    '1hour': 3600,
+    '4hour': 14400,
+    '1day': 86400,
+    '1week': 604800
+})
+
 class CommonUtil:
     """
     Common utility methods for date/time calculations
@@ -56,9 +68,12 @@ class CommonUtil:
         return candleDay > sessionDay
     
     @staticmethod
+    @lru_cache(maxsize=32)
     def getTimeframeSeconds(timeframe: str) -> int:
         """
         Convert timeframe string to seconds with support for various formats.
+        Results are memoized in a small LRU - the scheduler only ever passes a handful of
+        timeframe strings, and arbitrary caller input cannot grow the cache without bound.
         
         Args:
             timeframe: Timeframe string (e.g., '30m', '1h', '4h', '15m', '1d', '1w')
@@ -110,17 +125,8 @@ class CommonUtil:
             return minutes * 60
         
         # Handle common aliases
-        timeframe_aliases = {
-            '15min': 900,
-            '30min': 1800,
-            '1hour': 3600,
-            '4hour': 14400,
-            '1day': 86400,
-            '1week': 604800
-        }
-        
-        if tf in timeframe_aliases:
-            return timeframe_aliases[tf]
+        if tf in _TIMEFRAME_ALIASES:
+            return _TIMEFRAME_ALIASES[tf]
         
         raise ValueError(f"Unsupported timeframe format: {timeframe}. "
                         f"Supported formats: 15m, 30m, 1h, 4h, 1d, 1w, etc.")
@@ -26,8 +26,8 @@ class IndicatorConstants:
         EMA_34 = 34
         EMA_VALUE = 'emavalue'
         EMA_PERIOD = 'emaperiod'
-        CANDLE_UNIX_TIME = 'candle_unixtime' #used in query
-        CANDLE_CLOSE_PRICE = 'candle_closeprice' #used in query
+        CANDLE_UNIX_TIMES = 'candle_unixtimes' #used in query
+        CANDLE_CLOSE_PRICES = 'candle_closeprices' #used in query
         CANDLES = 'candles'
         PAIR_ID = 'pair_id'
         EMA21 = 'ema21'
@@ -0,0 +1,85 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+from scipy.signal import lfilter
+
+SECONDS_PER_DAY = 86400
+
+
+class IndicatorKernels:
+    """
+    Array-level indicator loops shared by the scheduler processors
+    """
+
+    @staticmethod
+    def vwapUpdate(unixTimes: np.ndarray, highPrices: np.ndarray, lowPrices: np.ndarray,
+                   closePrices: np.ndarray, volumes: np.ndarray, cumulativePV: float,
+                   cumulativeVolume: float, sessionEndUnix: Optional[int]) -> Tuple[np.ndarray, float, float, Optional[int]]:
+        """
+        Advance a daily VWAP session over candles ordered by unixTime.
+
+        The running sums reset whenever a candle falls on a later UTC day than the
+        current session. Each day is one vectorised cumulative sum.
+
+        Args:
+            unixTimes, highPrices, lowPrices, closePrices, volumes: Parallel candle arrays
+            cumulativePV: Carried price*volume sum of the existing session
+            cumulativeVolume: Carried volume sum of the existing session
+            sessionEndUnix: End of the existing session (None = no session yet)
+
+        Returns:
+            Tuple of (vwapValues, cumulativePV, cumulativeVolume, lastResetUnix)
+            - vwapValues: VWAP per candle, NaN while the session has no volume
+            - lastResetUnix: unixTime of the candle that opened the final session,
+              None when every candle continued the existing session
+        """
+        candleCount = len(unixTimes)
+        vwapValues = np.full(candleCount, np.nan)
+        if candleCount == 0:
+            return vwapValues, cumulativePV, cumulativeVolume, None
+
+        priceVolumes = (highPrices + lowPrices + closePrices) / 3.0 * volumes
+
+        # A candle opens a new session when its day is past every day seen so far
+        candleDays = unixTimes // SECONDS_PER_DAY
+        sessionDay = sessionEndUnix // SECONDS_PER_DAY if sessionEndUnix is not None else -1
+        previousDays = np.maximum.accumulate(np.concatenate(([sessionDay], candleDays[:-1])))
+        sessionStarts = np.flatnonzero(candleDays > previousDays).tolist()
+
+        segmentBounds = [0] + sessionStarts + [candleCount]
+        sessionStarts = set(sessionStarts)
+        lastResetUnix = None
+        for start, end in zip(segmentBounds[:-1], segmentBounds[1:]):
+            if start == end:
+                continue
+            if start in sessionStarts:
+                cumulativePV, cumulativeVolume = 0.0, 0.0
+                lastResetUnix = int(unixTimes[start])
+
+            runningPV = np.cumsum(priceVolumes[start:end]) + cumulativePV
+            runningVolume = np.cumsum(volumes[start:end]) + cumulativeVolume
+            hasVolume = runningVolume > 0
+            np.divide(runningPV, runningVolume, out=vwapValues[start:end], where=hasVolume)
+
+            cumulativePV, cumulativeVolume = float(runningPV[-1]), float(runningVolume[-1])
+
+        return vwapValues, cumulativePV, cumulativeVolume, lastResetUnix
+
+    @staticmethod
+    def emaUpdate(closePrices, previousEMA: float, period: int) -> List[float]:
+        """
+        Run EMA = (Close - Previous_EMA) * (2 / (Period + 1)) + Previous_EMA over a close series.
+
+        The recurrence is the first-order IIR filter y[n] = a*x[n] + (1-a)*y[n-1], so it runs
+        as a single lfilter call seeded with previousEMA instead of a per-candle Python loop.
+
+        Returns:
+            EMA value per close, aligned with closePrices
+        """
+        closes = np.asarray(closePrices, dtype=np.float64)
+        if closes.size == 0:
+            return []
+        multiplier = 2.0 / (period + 1)
+        decay = 1.0 - multiplier
+        emaValues, _ = lfilter([multiplier], [1.0, -decay], closes, zi=[decay * float(previousEMA)])
+        return emaValues.tolist()